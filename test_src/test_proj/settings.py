@@ -133,6 +133,10 @@ API['v2']['testbinaryfiles2'] = dict(
 API['v2']['request_info'] = dict(
     view='test_proj.views.RequestInfoTestView'
 )
+API['v2']['async_request_info'] = dict(
+    view='test_proj.views.async_request_info',
+    type='view',
+)
 API['v2'][r'settings'] = dict(
     view='test_proj.views.SettingsViewSetV2',
     op_types=['get', 'mod'],
@@ -500,6 +500,16 @@ class VSTUtilsTestCase(BaseTestCase):
         exchenger.delete()
         self.assertTrue(not exchenger.get())
 
+        # Consumer waits for published value.
+        import threading
+
+        self.assertIsNone(exchenger.wait(0.05))
+        threading.Timer(0.05, exchenger.publish, args=('first',)).start()
+        self.assertEqual(exchenger.wait(), 'first')
+        threading.Timer(0.05, exchenger.send, args=('second',)).start()
+        self.assertEqual(exchenger.wait(5), 'second')
+        self.assertIsNone(exchenger.get())
+
     def test_locks(self):
         @utils.model_lock_decorator(repeat=0.01)
         def method(pk):
@@ -515,6 +525,237 @@ class VSTUtilsTestCase(BaseTestCase):
         with self.assertRaises(utils.Lock.AcquireLockException):
             method2(pk=123)
 
+        # Free lock is acquired without delay and fencing tokens grow.
+        with patch('vstutils.utils.time.sleep') as sleep_mock:
+            with utils.Lock('fenced') as lock:
+                token = lock.token
+            with utils.Lock('fenced') as lock:
+                self.assertGreater(lock.token, token)
+            sleep_mock.assert_not_called()
+
+            # Contended lock is retried with growing delays.
+            with utils.Lock('fenced'):
+                with self.assertRaises(utils.Lock.AcquireLockException):
+                    utils.Lock('fenced', repeat=0.001)
+                with patch('vstutils.utils.random.random', return_value=1), \
+                        patch('vstutils.utils.time.monotonic', side_effect=[0, 0, 0.5, 5]):
+                    with self.assertRaises(utils.Lock.AcquireLockException):
+                        utils.Lock('fenced', repeat=1)
+            self.assertEqual([c.args[0] for c in sleep_mock.call_args_list[-2:]], [0.01, 0.02])
+
+        # Expired lock doesn't release or prolong lock of the next owner.
+        lock = utils.Lock('expired')
+        utils.Lock.cache.delete(lock.key)
+        with utils.Lock('expired') as other_lock:
+            self.assertFalse(lock.prolong())
+            lock.release()
+            self.assertEqual(utils.Lock.cache.get(other_lock.key), other_lock.payload_data)
+            self.assertTrue(other_lock.prolong(10))
+        self.assertIsNone(utils.Lock.cache.get(other_lock.key))
+        utils.Lock('expired').release(force_release=True)
+        self.assertIsNone(utils.Lock.cache.get(other_lock.key))
+
+    def test_semaphores(self):
+        cache = utils.Lock.cache
+
+        # Semaphore allows limited number of holders.
+        first = utils.Semaphore('exports', limit=2)
+        second = utils.Semaphore('exports', limit=2)
+        self.assertNotEqual(first.key, second.key)
+        with self.assertRaises(utils.Lock.AcquireLockException):
+            utils.Semaphore('exports', limit=2, repeat=0.01)
+        first.release()
+        with utils.Semaphore('exports', limit=2) as third:
+            self.assertEqual(third.key, first.key)
+        second.release()
+
+        # Readers share lock while there is no writer.
+        readers = [utils.ReadLock('config', limit=3) for _ in range(3)]
+        with self.assertRaises(utils.Lock.AcquireLockException):
+            utils.WriteLock('config', limit=3, repeat=0.01)
+        self.assertFalse(cache.has_key(f'{utils.WriteLock.PREFIX}config'))
+        for reader in readers:
+            reader.release()
+        with utils.WriteLock('config', limit=3) as writer:
+            self.assertTrue(cache.has_key(writer.key))
+            with self.assertRaises(utils.Lock.AcquireLockException):
+                utils.ReadLock('config', limit=3, repeat=0.01)
+            with self.assertRaises(utils.Lock.AcquireLockException):
+                utils.WriteLock('config', limit=3, repeat=0.01)
+
+        # Reader backs off when writer takes lock after check.
+        with patch.object(type(cache), 'has_key', side_effect=[False, True]):
+            with self.assertRaises(utils.Lock.AcquireLockException):
+                utils.ReadLock('config', limit=3, repeat=0)
+        self.assertEqual(cache.get_many([f'{utils.ReadLock.PREFIX}config_{i}' for i in range(3)]), {})
+
+        # Writer checks that it still owns the key while waiting for readers.
+        writer_key = f'{utils.WriteLock.PREFIX}owned'
+        get_many = type(cache).get_many
+
+        def replace_writer(value):
+            def side_effect(keys, *args, **kwargs):
+                if side_effect.calls:
+                    return get_many(cache, keys, *args, **kwargs)
+                side_effect.calls += 1
+                cache.delete(writer_key)
+                if value is not None:
+                    cache.set(writer_key, value)
+                return {keys[0]: 1}
+            side_effect.calls = 0
+            return patch.object(type(cache), 'get_many', side_effect=side_effect)
+
+        with replace_writer('another'):
+            with self.assertRaises(utils.Lock.AcquireLockException):
+                utils.WriteLock('owned', limit=1, repeat=0.1)
+        self.assertEqual(cache.get(writer_key), 'another')
+        cache.delete(writer_key)
+        with replace_writer(None):
+            with utils.WriteLock('owned', limit=1, repeat=1) as writer:
+                self.assertEqual(cache.get(writer_key), writer.payload_data)
+
+        # Decorators bound concurrency by pk.
+        @utils.model_semaphore_decorator(limit=2, repeat=0.01)
+        def export(pk, depth):
+            if depth:
+                export(pk=pk, depth=depth - 1)
+
+        export(pk=1, depth=1)
+        with self.assertRaises(utils.Lock.AcquireLockException):
+            export(pk=1, depth=2)
+
+        @utils.model_read_lock_decorator(repeat=0.01)
+        def read(pk):
+            read_nested(pk=pk)
+
+        @utils.model_read_lock_decorator(repeat=0.01)
+        def read_nested(pk):
+            pass
+
+        @utils.model_write_lock_decorator(repeat=0.01)
+        def write(pk):
+            read(pk=pk)
+
+        read(pk=1)
+        with self.assertRaises(utils.Lock.AcquireLockException):
+            write(pk=1)
+
+    def test_lock_leases(self):
+        import asyncio
+        import threading
+        import time
+
+        # Lease is renewed by heartbeat until release.
+        with utils.Lock('leased', lease=0.3) as lock:
+            time.sleep(0.5)
+            self.assertEqual(utils.Lock.cache.get(lock.key), lock.payload_data)
+            heartbeat = lock.heartbeat
+        self.assertTrue(heartbeat.is_set())
+        self.assertIsNone(utils.Lock.cache.get(lock.key))
+
+        # Heartbeat survives errors and stops when lock is lost or collected.
+        with patch.object(utils.LockEngine, 'prolong', side_effect=[Exception('test'), False]):
+            lock = utils.Lock('lost', lease=0.03)
+            time.sleep(0.2)
+            self.assertIsNone(lock.id)
+        utils._lock_heartbeat(lambda: None, threading.Event(), 0)
+
+        async def hold():
+            async with utils.AsyncLock('leased', lease=0.3) as lock:
+                await asyncio.sleep(0.5)
+                with self.assertRaises(utils.Lock.AcquireLockException):
+                    await utils.AsyncLock('leased', repeat=0.05).acquire()
+                heartbeat = lock.heartbeat
+            await asyncio.sleep(0)
+            self.assertTrue(heartbeat.cancelled())
+            self.assertIsNone(lock.id)
+
+            with patch.object(utils.LockEngine, 'prolong', side_effect=[Exception('test'), False]):
+                lock = await utils.AsyncLock('lost', lease=0.03).acquire()
+                await asyncio.sleep(0.2)
+                self.assertIsNone(lock.id)
+                self.assertTrue(lock.heartbeat.done())
+            await lock.arelease()
+
+            # Lock released outside of event loop thread cancels heartbeat by its loop.
+            lock = await utils.AsyncLock('leased', lease=0.3).acquire()
+            heartbeat = lock.heartbeat
+            await asyncio.to_thread(lock.release)
+            with self.assertRaises(asyncio.CancelledError):
+                await heartbeat
+            return await utils.AsyncLock('leased', lease=0.3).acquire()
+
+        lock = asyncio.run(hold())
+        # Heartbeat of closed loop is skipped.
+        self.assertTrue(lock.heartbeat.done())
+        lock.release()
+        self.assertIsNone(lock.heartbeat)
+        self.assertIsNone(utils.Lock.cache.get(lock.key))
+
+    def test_lock_engines(self):
+        import pickle
+        from django.core.cache.backends.redis import RedisCache
+
+        redis_cache = RedisCache('redis://127.0.0.1:6379', {})
+        engine = utils.LockEngine.get_engine(redis_cache)
+        self.assertIsInstance(engine, utils.RedisLockEngine)
+        with patch.object(redis_cache._cache, 'get_client') as get_client:
+            script = get_client.return_value.register_script.return_value
+            script.return_value = 3
+            self.assertEqual(engine.acquire('lock', 'owner', 1.5), 3)
+            key = redis_cache.make_and_validate_key('lock')
+            script.assert_called_with(
+                keys=[key, redis_cache.make_and_validate_key('lock_fence')],
+                args=(pickle.dumps('owner', pickle.HIGHEST_PROTOCOL), 1500),
+                client=get_client.return_value,
+            )
+            self.assertTrue(engine.release('lock', 'owner'))
+            script.return_value = 0
+            self.assertFalse(engine.prolong('lock', 'owner', None))
+            self.assertEqual(script.call_args.kwargs['args'][1], 0)
+            self.assertEqual(get_client.return_value.register_script.call_count, 3)
+            engine.release('lock', 'owner')
+            self.assertEqual(get_client.return_value.register_script.call_count, 3)
+
+            # Consumers are woken up by notifications list.
+            script.return_value = None
+            engine.publish('value', 'data', 10)
+            script.assert_called_with(
+                keys=[redis_cache.make_and_validate_key('value'), redis_cache.make_and_validate_key('value_notify')],
+                args=(pickle.dumps('data', pickle.HIGHEST_PROTOCOL), 10000),
+                client=get_client.return_value,
+            )
+            script.side_effect = [None, pickle.dumps('data', pickle.HIGHEST_PROTOCOL)]
+            self.assertEqual(engine.wait('value', 5), 'data')
+            get_client.return_value.blpop.assert_called_once_with(
+                [redis_cache.make_and_validate_key('value_notify')], timeout=1.0
+            )
+
+        with patch('vstutils.drivers.cache.tarantool.Connection') as connection_mock:
+            from vstutils.drivers.cache import TarantoolCache, TarantoolConnectionPool
+
+            with patch.dict(TarantoolConnectionPool.pools, clear=True):
+                connection_mock.return_value.is_closed.return_value = False
+                cache = TarantoolCache('localhost:3301', {'OPTIONS': {'serializer': 'msgpack'}})
+                engine = utils.LockEngine.get_engine(cache)
+                self.assertIsInstance(engine, utils.TarantoolLockEngine)
+                client = connection_mock.return_value
+                client.call.return_value.data = [True]
+                self.assertTrue(engine.release('lock', 'owner'))
+                client.call.assert_called_with('django_cache_delete_if_equal', (':1:lock', 'owner'))
+                self.assertTrue(engine.prolong('lock', 'owner', None))
+                client.call.assert_called_with('django_cache_touch_if_equal', (':1:lock', 'owner', -1))
+
+                engine.publish('value', 'data', None)
+                client.call.assert_called_with('django_cache_publish', ((':1:value', 'data', -1),))
+                client.call.return_value.data = [None]
+                client.call.reset_mock()
+                self.assertIsNone(engine.wait('value', 0.5))
+                self.assertEqual(client.call.call_args_list[0].args, ('django_cache_pop', (':1:value',)))
+                name, (key, timeout) = client.call.call_args_list[1].args
+                self.assertEqual((name, key), ('django_cache_wait', ':1:value'))
+                self.assertAlmostEqual(timeout, 0.5, places=1)
+
     def test_raise_context(self):
         class SomeEx(KeyError):
             pass
@@ -2435,6 +2676,7 @@ class OpenapiEndpointTestCase(BaseTestCase):
         paths_which_is_tech = (
             r'settings',
             r'_lang',
+            r'async_request_info',
         )
 
         valid_paths = [
@@ -2797,6 +3039,594 @@ class EndpointTestCase(BaseTestCase):
         perf_results = '\n'.join(f'{k.upper()}: {v}ms' for k, v in map(iteration, ('post', 'put', 'patch')))
         print(f"\nTimings for different methods:\n{perf_results}\n")
 
+    def test_dependency_aware_bulk(self):
+        from vstutils.api.bulk import _get_operations_dependencies, OperationsResults
+
+        self.assertEqual(_get_operations_dependencies([
+            {'method': 'post', 'path': 'subhosts', 'data': {'name': 'a'}, 'let': 'host'},
+            {'method': 'get', 'path': ['subhosts', '<<host[data][id]>>']},
+            {'method': 'get', 'path': ['subhosts', '<<0[data][id]>>'], 'let': 'host'},
+            {'method': 'get', 'path': 'subhosts', 'query': 'name=<<host[data][name]>>'},
+            {'method': 'get', 'path': 'subhosts', 'headers': {'x-test': '<<later[data]>>'}},
+            None,
+            {'method': 'get', 'path': 'subhosts', 'let': 'later'},
+        ]), [set(), {0}, {0, 1}, {2}, set(), set(), {4}])
+        self.assertIsNone(_get_operations_dependencies([
+            {'method': 'get', 'path': 'subhosts', 'let': '<<0[data][name]>>'},
+        ]))
+        self.assertIsNone(_get_operations_dependencies([
+            {'method': 'get', 'path': 'subhosts', 'headers': {'x-test': '<<1[data]>>'}},
+            {'method': 'get', 'path': 'subhosts'},
+        ]))
+        self.assertIsNone(_get_operations_dependencies([
+            {'method': 'get', 'path': ['subhosts', '<<>>']},
+        ]))
+
+        # Only referenced results are stored until dependent operations are done
+        results = OperationsResults([set(), {0}, {0, 1}, set()])
+        results.add(0, 'a')
+        results.add(1, 'b', {0})
+        self.assertEqual((results[0], results[1], len(results)), ('a', 'b', 2))
+        results.add(2, 'c', {0, 1})
+        results.add(3, 'd')
+        self.assertEqual(len(results), 0)
+        with self.assertRaises(IndexError):
+            results[3]
+        results = OperationsResults(None)
+        results.add(0, 'a')
+        self.assertEqual(results[0], 'a')
+
+        request = [
+            {'method': 'get', 'path': ['user', self.user.id, 'test_bulk_perf'], 'version': 'v4', 'let': 'perf'},
+            *({'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': f'op={i}'} for i in range(4)),
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'id=<<perf[data][id]>>', 'let': 'info'},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'id=<<info[data][user_id]>>&op=<<4[data][query][op]>>'},
+        ]
+        with self.patch('vstutils.api.endpoint.EndpointViewSet.parallel_independent', True):
+            results = self.bulk(request)
+            self.assertEqual([r['status'] for r in results], [200] * 7)
+            self.assertEqual([r['data']['query']['op'] for r in results[1:5]], ['0', '1', '2', '3'])
+            self.assertEqual(results[5]['data']['query'], {'id': str(self.user.id)})
+            self.assertEqual(results[6]['data']['query'], {'id': str(self.user.id), 'op': '3'})
+            # References to next operations fail like in sequential execution
+            results = self.bulk([
+                {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'id=<<1[data][id]>>'},
+                {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'id=<<later[data][id]>>'},
+                {'method': 'get', 'path': ['user', self.user.id, 'test_bulk_perf'], 'version': 'v4', 'let': 'later'},
+            ])
+            self.assertEqual([r['status'] for r in results], [500, 500, 200])
+            # All operations of transactional request see its uncommitted changes
+            request = [
+                {'method': 'post', 'path': 'subhosts', 'data': {'name': 'transactional'}},
+                {'method': 'get', 'path': 'subhosts', 'query': 'name=transactional'},
+                {'method': 'get', 'path': ['subhosts', '<<0[data][id]>>']},
+                {'method': 'get', 'path': ['user', 'not_found_404']},
+                {'method': 'get', 'path': 'request_info', 'version': 'v2'},
+            ]
+            results = self.bulk_transactional(request, code=502)
+            self.assertEqual([r['status'] for r in results], [201, 200, 200, 404])
+            self.assertEqual(results[1]['data']['count'], 1)
+            self.assertEqual(results[2]['data']['name'], 'transactional')
+            self.assertFalse(Host.objects.filter(name='transactional').exists())
+
+
+    def test_bulk_operation_templates(self):
+        from vstutils.api.endpoint import OperationTemplate, RequestDataField, get_operation_template
+
+        results = [utils.Dict(status=201, data=utils.Dict(id=5, name='123', title='Some title', flag=True, items=[1]))]
+        variables = {'host': results[0]}
+
+        def render(template):
+            return get_operation_template(template).render(results, variables)
+
+        self.assertIsNone(get_operation_template('plain string'))
+        self.assertIsNone(get_operation_template('{"id": "<<0[data][id]>>"}'))
+        # Templates are compiled once
+        self.assertIs(get_operation_template('<<0[data][id]>>'), get_operation_template('<<0[data][id]>>'))
+        # Referenced objects, lists and numbers are inserted as is
+        self.assertEqual(render('<<0[data][id]>>'), 5)
+        self.assertIs(render('<<host[data]>>'), results[0]['data'])
+        self.assertIs(render('<<host[data][items]>>'), results[0]['data']['items'])
+        # Other values are formatted to string and parsed as JSON if possible
+        self.assertEqual(render('<<0[data][name]>>'), 123)
+        self.assertEqual(render('<<0[data][title]>>'), 'Some title')
+        self.assertEqual(render('<<0[data][flag]>>'), 'True')
+        self.assertEqual(render('<<0[data][id]:03d>>'), '005')
+        self.assertEqual(render('id=<<host[data][id]>>&name=<<0[data][title]!r>>'), "id=5&name='Some title'")
+        self.assertEqual(render('[<<0[data][id]>>, <<host[data][name]>>]'), [5, 123])
+        # Auto-numbering and nested fields are formatted by str.format
+        self.assertIsNone(OperationTemplate('<<>>').parts)
+        self.assertEqual(OperationTemplate('<<>>').render([7], {}), 7)
+        self.assertEqual(render('<<0[data][id]:<<host[data][id]>>>>'), 5)
+        with self.assertRaises(ValueError):
+            OperationTemplate('<<0 >').render(results, variables)
+        with self.assertRaises(KeyError):
+            render('<<unknown[data]>>')
+
+        field = RequestDataField()
+        field._context = {'results': results, 'variables': variables}
+        data = {'items': [{'name': 'x', 'values': [1, 2.5, None, True]}] * 3}
+        # Data without templates is not copied
+        self.assertIs(field.to_internal_value(data), data)
+        self.assertEqual(field.to_internal_value({
+            'id': '<<0[data][id]>>',
+            'nested': ({'<<0[data][title]>>': ['<<host[data][id]>>', 1, None]},),
+            'static': {'a': [1]},
+        }), {
+            'id': 5,
+            'nested': [{'Some title': [5, 1, None]}],
+            'static': {'a': [1]},
+        })
+        self.assertEqual(field.to_internal_value('<<host[data][id]>>'), 5)
+        self.assertEqual(field.to_internal_value(10), 10)
+        # Data which can't be checked by serialization is walked through
+        self.assertEqual(field.to_internal_value({1: ['<<0[data][id]>>']}), {1: [5]})
+
+    def test_bulk_operations_dispatch(self):
+        from django.core.signals import request_started, request_finished
+        from vstutils.api.endpoint import BulkClient
+
+        handler = BulkClient.handler
+        handler.resolve_route.cache_clear()
+        started_handler = Mock()
+        finished_handler = Mock()
+        request_started.connect(started_handler)
+        request_finished.connect(finished_handler)
+        try:
+            results = self.bulk([
+                *({'method': 'get', 'path': ['user', self.user.id, 'test_bulk_perf'], 'version': 'v4', 'query': f'op={i}'}
+                  for i in range(5)),
+                {'method': 'get', 'path': '/not_found/', 'query': 'op=1'},
+                {'method': 'get', 'path': '/not_found/', 'query': 'op=2'},
+            ])
+        finally:
+            request_started.disconnect(started_handler)
+            request_finished.disconnect(finished_handler)
+
+        self.assertEqual([r['status'] for r in results], [200] * 5 + [404] * 2)
+        # Request started signal is sent only for bulk request itself
+        self.assertEqual(started_handler.call_count, 1)
+        # Every operation response is closed with cleanup by request finished handlers
+        self.assertEqual(finished_handler.call_count, 8)
+        # Routes are resolved once for ETag pre-check and operations with same path
+        self.assertEqual(handler.resolve_route.cache_info().hits, 9)
+        self.assertEqual(handler.resolve_route.cache_info().currsize, 1)
+
+        # Every call returns new match and query string doesn't split routes
+        path = f'/api/v4/user/{self.user.id}/test_bulk_perf/'
+        match = handler.resolve_path(None, path)
+        match.kwargs['changed'] = True
+        other_match = handler.resolve_path(None, f'{path}?op=1')
+        self.assertIsNot(match, other_match)
+        self.assertNotIn('changed', other_match.kwargs)
+        self.assertEqual(other_match.func, match.func)
+        self.assertEqual(handler.resolve_route.cache_info().currsize, 1)
+
+        # Streaming responses are closed when their content is consumed
+        from unittest.mock import AsyncMock
+        from asgiref.sync import async_to_sync
+        from django.http import StreamingHttpResponse
+        from vstutils.api.endpoint import AsyncBulkClient
+
+        async def async_content():
+            yield b'async'
+
+        environ = RequestFactory()._base_environ(PATH_INFO=path)
+        request_finished.connect(finished_handler)
+        try:
+            finished_handler.reset_mock()
+            with patch.object(handler, 'get_response', return_value=StreamingHttpResponse(iter([b'sync']))):
+                response = handler(environ)
+            self.assertFalse(finished_handler.called)
+            self.assertEqual(b''.join(response.streaming_content), b'sync')
+            self.assertEqual(finished_handler.call_count, 1)
+
+            async_handler = AsyncBulkClient.handler
+            with patch.object(async_handler, 'get_response_async', new_callable=AsyncMock,
+                              return_value=StreamingHttpResponse(async_content())):
+                response = async_to_sync(async_handler)(environ)
+
+            async def consume():
+                return [chunk async for chunk in response.streaming_content]
+
+            self.assertEqual(async_to_sync(consume)(), [b'async'])
+            self.assertEqual(finished_handler.call_count, 2)
+        finally:
+            request_finished.disconnect(finished_handler)
+
+        # Signal receivers aren't changed while operation response is closed
+        # and connection with transaction isn't closed by request finished handler.
+        from django.db import connection
+        from django.http import HttpResponse
+
+        async_finished = []
+
+        async def async_finished_handler(**kwargs):
+            async_finished.append(kwargs['signal'])
+
+        request_finished.connect(finished_handler)
+        request_finished.connect(async_finished_handler)
+        receivers = list(request_finished.receivers)
+        finished_handler.side_effect = lambda **kwargs: self.assertEqual(request_finished.receivers, receivers)
+        try:
+            finished_handler.reset_mock()
+            self.assertTrue(connection.in_atomic_block)
+            closed_resource = Mock()
+            response = HttpResponse(b'sync')
+            response._resource_closers.append(closed_resource)
+            with patch.object(handler, 'get_response', return_value=response):
+                handler(environ)
+            self.assertTrue(response.closed)
+            closed_resource.assert_called_once()
+            self.assertEqual(finished_handler.call_count, 1)
+            self.assertEqual(async_finished, [request_finished])
+            self.assertIsNotNone(connection.connection)
+            self.assertFalse(connection.needs_rollback)
+        finally:
+            request_finished.disconnect(finished_handler)
+            request_finished.disconnect(async_finished_handler)
+
+    def test_bulk_executor(self):
+        import threading
+        import time
+        from vstutils.api.bulk import BulkExecutor
+
+        executor = BulkExecutor(max_workers=2, max_per_queue=1)
+        lock = threading.Lock()
+        started, running = [], {'a': 0, 'b': 0}
+        max_running = dict(running)
+
+        def task(queue, name):
+            with lock:
+                started.append(name)
+                running[queue] += 1
+                max_running[queue] = max(max_running[queue], running[queue])
+            time.sleep(0.05)
+            with lock:
+                running[queue] -= 1
+            return name
+
+        with patch('vstutils.api.bulk.close_old_connections') as close_old_connections:
+            futures = [executor.submit_to_queue('a', task, 'a', f'a{i}') for i in range(3)]
+            futures += [executor.submit_to_queue('b', task, 'b', f'b{i}') for i in range(2)]
+            failed = executor.submit_to_queue('b', int, 'not a number')
+            self.assertEqual([f.result(timeout=5) for f in futures], ['a0', 'a1', 'a2', 'b0', 'b1'])
+            self.assertIsInstance(failed.exception(timeout=5), ValueError)
+            # Connections are checked when all operations of queue are taken.
+            for _ in range(100):
+                if close_old_connections.call_count == 2:
+                    break
+                time.sleep(0.01)  # nocv
+        self.assertEqual(close_old_connections.call_count, 2)
+        # Operations of one queue don't hold all workers
+        self.assertEqual(max_running, {'a': 1, 'b': 1})
+        self.assertLess(started.index('b0'), started.index('a1'))
+        self.assertEqual(executor.workers, 2)
+        self.assertEqual((executor.queued, executor.running), (0, 0))
+
+        # Bulk response reports time which operations waited in queue
+        client = self._login()
+        response = client.patch('/api/endpoint/', data=json.dumps([
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': f'op={i}'} for i in range(3)
+        ]), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('bulk_queue;dur=', response.headers['Server-Timing'])
+        self._logout(client)
+
+    def test_async_bulk(self):
+        from asgiref.sync import async_to_sync
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from vstutils.api import bulk, endpoint
+
+        view = endpoint.AsyncEndpointViewSet.as_view()
+        factory = APIRequestFactory()
+
+        def call(method, data=None, **kwargs):
+            request = getattr(factory, method)('/api/endpoint/', data=data, format='json', **kwargs)
+            force_authenticate(request, self.user)
+            response = async_to_sync(view)(request)
+            if not response.streaming:
+                response.render()
+            return response
+
+        operations = [
+            *({'method': 'get', 'path': 'async_request_info', 'version': 'v2', 'query': f'op={i}'} for i in range(3)),
+            {'method': 'get', 'path': ['user', self.user.id, 'test_bulk_perf'], 'version': 'v4', 'let': 'perf'},
+            {'method': 'get', 'path': 'async_request_info', 'version': 'v2', 'query': 'op=<<perf[data][id]>>'},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'ab=<<0[status]>>'},
+            {'method': 'get', 'path': '/not_found/'},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'a=1'},
+        ]
+        expected_statuses = [200] * 6 + [404, 500]
+
+        for method in ('put', 'patch'):
+            with self.patch('vstutils.api.endpoint._run_in_bulk_executor', wraps=bulk._run_in_bulk_executor) as run:
+                response = call(method, operations)
+            # Only sync views are called in thread pool
+            self.assertEqual(run.call_count, 3)
+            self.assertEqual(response.status_code, 200)
+            results = json.loads(response.content)
+            self.assertEqual([r['status'] for r in results], expected_statuses)
+            self.assertEqual([r['data']['detail'] for r in results[:3]], [f'{self.user.id}:{i}' for i in range(3)])
+            self.assertEqual(results[4]['data']['detail'], f'{self.user.id}:{self.user.id}')
+            self.assertEqual(results[5]['data']['query'], {'ab': '200'})
+            self.assertEqual(response.cookies['async_request_info'].value, '0')
+
+        # Sequential execution
+        with self.patch('vstutils.api.endpoint.AsyncEndpointViewSet.concurrency', 1):
+            results = json.loads(call('put', operations).content)
+        self.assertEqual([r['status'] for r in results], expected_statuses)
+
+        # Streaming
+        async def read_stream(response):
+            lines = [json.loads(line) async for line in response.streaming_content]
+            # Queue key of bulk executor is reset when operations are iterated
+            self.assertIsNone(bulk.bulk_queue_key.get())
+            return lines
+
+        response = call('put', operations, HTTP_ACCEPT='application/x-ndjson')
+        self.assertTrue(response.streaming)
+        results = sorted(async_to_sync(read_stream)(response), key=lambda r: r['index'])
+        self.assertEqual([r['status'] for r in results], expected_statuses)
+        self.assertTrue(all('timing' in r for r in results))
+
+        # Transactional bulk is executed synchronously in one thread
+        response = call('post', [
+            {'method': 'post', 'path': 'subhosts', 'data': {'name': 'async_transactional'}},
+            {'method': 'get', 'path': ['subhosts', '<<0[data][id]>>']},
+        ])
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(response.content)
+        self.assertEqual([r['status'] for r in results], [201, 200])
+        self.assertEqual(results[1]['data']['name'], 'async_transactional')
+
+        response = call('post', [
+            {'method': 'post', 'path': 'subhosts', 'data': {'name': 'async_transactional_fail'}},
+            {'method': 'get', 'path': '/not_found/'},
+        ])
+        self.assertEqual(response.status_code, 502)
+        self.assertFalse(Host.objects.filter(name='async_transactional_fail').exists())
+
+        self.assertEqual(call('get').status_code, 200)
+        response = call('delete', HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(response.status_code, 405)
+        self.assertIn('detail', json.loads(response.content))
+
+    def test_bulk_completion_order(self):
+        import asyncio
+        import threading
+        from vstutils.api import bulk
+
+        request = Mock(method='PATCH', data=[{'path': 'first'}, {'path': 'second'}])
+        second_done = threading.Event()
+
+        def operate(operation, context):
+            if operation['path'] == 'first':
+                second_done.wait(5)
+            second_done.set()
+            return {'path': operation['path']}, 0
+
+        async def aresults(ordered):
+            second_done = asyncio.Event()
+
+            async def aoperate(operation, context):
+                if operation['path'] == 'first':
+                    await second_done.wait()
+                second_done.set()
+                return {'path': operation['path']}, 0
+
+            return [r async for r in bulk._aiter_request(request, aoperate, {}, ordered=ordered)]
+
+        for ordered, expected in ((True, [0, 1]), (False, [1, 0])):
+            second_done.clear()
+            results = list(bulk._iter_request(request, operate, {}, ordered=ordered))
+            self.assertEqual([(idx, r['path']) for idx, r, _ in results], [(i, ('first', 'second')[i]) for i in expected])
+            results = asyncio.run(aresults(ordered))
+            self.assertEqual([idx for idx, *_ in results], expected)
+
+    def test_streaming_bulk(self):
+        request = [
+            {'method': 'get', 'path': ['user', self.user.id, 'test_bulk_perf'], 'version': 'v4'},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'id=<<0[data][id]>>'},
+            {'method': 'get', 'path': ['user', 'not_found_404']},
+        ]
+        client = self._login()
+        for method in ('put', 'patch'):
+            response = getattr(client, method)(
+                '/api/endpoint/',
+                data=json.dumps(request),
+                content_type='application/json',
+                HTTP_ACCEPT='application/x-ndjson',
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.streaming)
+            self.assertEqual(response.headers['Content-Type'], 'application/x-ndjson')
+            results = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+            # Results are sent as soon as operations are done with index of operation
+            results.sort(key=lambda r: r['index'])
+            self.assertEqual([r['index'] for r in results], [0, 1, 2])
+            self.assertEqual([r['status'] for r in results], [200, 200, 404])
+            self.assertEqual(results[1]['data']['query'], {'id': str(self.user.id)})
+            self.assertTrue(all(isinstance(r['timing'], float) for r in results))
+
+        # Transactional bulk can't be streamed, but results are still rendered as ndjson
+        response = client.post(
+            '/api/endpoint/',
+            data=json.dumps(request[:2]),
+            content_type='application/json',
+            HTTP_ACCEPT='application/x-ndjson',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.streaming)
+        results = [json.loads(line) for line in response.content.splitlines()]
+        self.assertEqual([r['status'] for r in results], [200, 200])
+        self._logout(client)
+
+        # ASGI server consumes results asynchronously
+        response = self.api_test_client.put(
+            '/api/endpoint/',
+            content=json.dumps([{'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'ab=1'}] * 2),
+            headers={
+                'content-type': 'application/json',
+                'accept': 'application/x-ndjson',
+                'accept-encoding': 'identity',
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        results = [json.loads(line) for line in response.content.splitlines()]
+        self.assertEqual([r['status'] for r in results], [403, 403])
+
+    def test_bulk_operations_memo(self):
+        from asgiref.sync import async_to_sync
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from vstutils.api import bulk, endpoint
+        from test_proj.views import RequestInfoTestView
+
+        request = [
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'op=1'},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'op=1'},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'op=1', 'headers': {'X-Test': '1'}},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'op=1', 'data': {'op': 2}},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'op=1',
+             'headers': {'Cache-Control': 'no-cache'}},
+            {'method': 'put', 'path': 'request_info', 'version': 'v2', 'data': {}},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'op=1'},
+        ]
+        with patch.object(RequestInfoTestView, 'list', autospec=True, side_effect=RequestInfoTestView.list) as view:
+            results = self.bulk(request)
+        self.assertEqual([r['status'] for r in results], [200] * 7)
+        # Duplicate is not executed, but write operation invalidates memo
+        self.assertEqual(view.call_count, 5)
+        self.assertEqual(results[0]['data'], results[1]['data'])
+        self.assertEqual(results[2]['data']['headers']['X-Test'], '1')
+        self.assertEqual(results[3]['data']['query'], {'op': '2'})
+
+        # Concurrent duplicates of async endpoint wait for the first one
+        view = endpoint.AsyncEndpointViewSet.as_view()
+        factory = APIRequestFactory()
+        operations = [
+            {'method': 'get', 'path': 'async_request_info', 'version': 'v2', 'query': 'op=1'},
+            {'method': 'get', 'path': 'async_request_info', 'version': 'v2', 'query': 'op=1'},
+            {'method': 'post', 'path': 'async_request_info', 'version': 'v2', 'query': 'op=1'},
+            {'method': 'get', 'path': 'async_request_info', 'version': 'v2', 'query': 'op=1'},
+            {'method': 'get', 'path': 'async_request_info', 'version': 'v2', 'query': 'op=1',
+             'headers': {'Cache-Control': 'no-cache'}},
+        ]
+        http_request = factory.patch('/api/endpoint/', data=operations, format='json')
+        force_authenticate(http_request, self.user)
+        with patch.object(endpoint.AsyncBulkClient, 'request', autospec=True,
+                          side_effect=endpoint.AsyncBulkClient.request) as client_request:
+            response = async_to_sync(view)(http_request)
+        response.render()
+        self.assertEqual([r['status'] for r in json.loads(response.content)], [200] * 5)
+        self.assertEqual(client_request.call_count, 4)
+
+        # Failed operation is not reused
+        memo = bulk.OperationsMemo()
+        method = Mock(side_effect=[ValueError, 'response'])
+        kwargs = {'data': '', 'headers': {}}
+        with self.assertRaises(ValueError):
+            memo.call('get', method, '/api/', kwargs)
+        self.assertEqual(memo.call('get', method, '/api/', kwargs), 'response')
+        self.assertEqual(memo.call('get', method, '/api/', kwargs), 'response')
+        self.assertEqual(method.call_count, 2)
+
+        async def failed(*args, **kwargs):
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            async_to_sync(memo.acall)('get', failed, '/api/v1/', kwargs)
+        self.assertNotIn(('/api/v1/', b'""', ()), memo.responses)
+        self.assertIn(('/api/', b'""', ()), memo.responses)
+
+    def test_bulk_objects_loader(self):
+        from rest_framework.generics import GenericAPIView
+        from vstutils.api import bulk, endpoint
+
+        hosts = [Host.objects.create(name=f'loader_{i}') for i in range(3)]
+        request = [
+            *({'method': 'get', 'path': ['subhosts', host.id]} for host in hosts),
+            {'method': 'get', 'path': f'subhosts/{hosts[0].id}', 'headers': {'If-None-Match': '"1"'}},
+            {'method': 'get', 'path': ['subhosts', 999999]},
+            {'method': 'get', 'path': ['user', self.user.id]},
+            {'method': 'get', 'path': ['user', 999999]},
+        ]
+        with patch.object(GenericAPIView, 'get_object', autospec=True, side_effect=GenericAPIView.get_object) as get_object:
+            results = self.bulk(request)
+        self.assertEqual([r['status'] for r in results], [200] * 4 + [404, 200, 404])
+        self.assertEqual([r['data']['name'] for r in results[:4]], [h.name for h in hosts] + [hosts[0].name])
+        self.assertEqual(results[5]['data']['id'], self.user.id)
+        # Only not found objects are selected separately
+        self.assertEqual(get_object.call_count, 2)
+
+        # Invalid lookup values are handled by views
+        results = self.bulk([
+            {'method': 'get', 'path': ['subhosts', hosts[0].id]},
+            {'method': 'get', 'path': ['subhosts', 'invalid']},
+        ])
+        self.assertEqual([r['status'] for r in results], [200, 404])
+
+        loaders = bulk._get_objects_loaders(endpoint._iter_resolved_get_operations([
+            *request,
+            {'method': 'get', 'path': ['subhosts', hosts[0].id], 'query': 'a=1'},
+            {'method': 'get', 'path': ['subhosts', '<<0[data][id]>>']},
+            {'method': 'get', 'path': ['subhosts', hosts[1].id], 'query': '<<0[data][id]>>'},
+            {'method': 'get', 'path': ['subhosts']},
+        ]))
+        self.assertEqual(len(loaders), 6)
+        self.assertEqual(len(set(map(id, loaders.values()))), 2)
+        self.assertEqual(
+            loaders[(f'/api/v1/subhosts/{hosts[1].id}/', ())].lookup_values,
+            {str(h.id) for h in hosts} | {'999999'},
+        )
+        view = Mock(action='retrieve', lookup_field='pk', lookup_url_kwarg=None, kwargs={'pk': '2'})
+        self.assertIsNone(bulk.ObjectsLoader(['1', '3']).get_object(view))
+        view.filter_queryset.assert_not_called()
+
+    def test_bulk_raw_json(self):
+        import orjson
+        from vstutils.api.renderers import ORJSONRenderer, NDJSONRenderer, MsgpackRenderer, RawJSON, RawJSONList
+
+        raw = RawJSON(b'{"a": [1, "<<"]}')
+        self.assertEqual(str(raw), '{"a": [1, "<<"]}')
+        self.assertEqual(repr(raw), 'RawJSON(b\'{"a": [1, "<<"]}\')')
+        self.assertEqual(raw['a'], [1, '<<'])
+        self.assertIs(raw.value, raw.value)
+
+        # Content is inserted as is and decoded only for renderers which can't splice it
+        data = RawJSONList([{'data': raw, 'status': 200}, {'data': RawJSON(b'[]')}, {'status': 404}, 1])
+        rendered = ORJSONRenderer().render(data)
+        self.assertIn(b'"data":{"a": [1, "<<"]}', rendered)
+        self.assertEqual(json.loads(rendered), [{'data': {'a': [1, '<<']}, 'status': 200}, {'data': []}, {'status': 404}, 1])
+        self.assertEqual(json.loads(ORJSONRenderer().render(data, 'text/html')), json.loads(rendered))
+        self.assertEqual(
+            [json.loads(line) for line in NDJSONRenderer().render(data).splitlines()],
+            json.loads(rendered),
+        )
+        self.assertEqual(ormsgpack.unpackb(MsgpackRenderer().render(data)), json.loads(rendered))
+        with self.patch('vstutils.api.renderers.ORJSONRenderer.options', orjson.OPT_INDENT_2):
+            self.assertEqual(json.loads(ORJSONRenderer().render(data)), json.loads(rendered))
+            self.assertEqual(json.loads(ORJSONRenderer().render_object(data[0])), json.loads(rendered)[0])
+
+        # Plain json responses of operations are not parsed
+        request = [
+            {'method': 'get', 'path': 'async_request_info', 'version': 'v2', 'query': 'op=1&json=1', 'let': 'info'},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2', 'query': 'op=<<info[data][op]>>'},
+            {'method': 'put', 'path': 'request_info', 'version': 'v2', 'data': {'items': '<<0[data][items]>>'}},
+            {'method': 'put', 'path': 'request_info', 'version': 'v2', 'data': '<<info[data]>>'},
+        ]
+        client = self._login()
+        with self.patch('vstutils.api.renderers.orjson.loads', wraps=orjson.loads) as loads:
+            response = client.put('/api/endpoint/', data=json.dumps(request), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        results = response.json()
+        self.assertEqual(results[0]['data'], {'user': self.user.id, 'op': '1', 'items': [1, 2]})
+        self.assertEqual(results[1]['data']['query'], {'op': '1'})
+        self.assertEqual(results[2]['data'], {'items': [1, 2]})
+        self.assertEqual(results[3]['data'], results[0]['data'])
+        # Content of first operation is decoded only once for templates
+        self.assertEqual(sum(1 for call in loads.call_args_list if call.args[0][:8] == b'{"user":'), 1)
+        self._logout(client)
 
     @override_settings(CENTRIFUGO_CLIENT_KWARGS={
         'address': 'https://localhost:8000',
@@ -3718,6 +4548,62 @@ class ProjectTestCase(BaseTestCase):
         self.assertEqual(results[0]['status'], 200)
         self.assertNotIn('ETag', results[0]['headers'])
 
+    def test_bulk_etag_prefetch(self):
+        from django.core.cache import caches
+        from vstutils.api import bulk, endpoint
+        from vstutils.api.base import get_cached_etag_values
+
+        CachableModel = self.get_model_class('test_proj.CachableProxyModel')
+        instance = CachableModel.objects.create(name='1')
+        request = [
+            {'method': 'get', 'path': ['cacheable']},
+            {'method': 'get', 'path': ['cacheable', instance.id]},
+            {'method': 'get', 'path': 'request_info', 'version': 'v2'},
+            {'method': 'get', 'path': '/not_found/'},
+            {'method': 'options', 'path': ['cacheable']},
+        ]
+        results = self.bulk(request)
+        self.assertEqual([r['status'] for r in results], [200, 200, 200, 404, 200])
+        for operation, result in zip(request[:2], results):
+            operation['headers'] = {'If-None-Match': result['headers']['ETag']}
+
+        # Values of all cachable views are loaded in two batches without separate requests of operations
+        cache_class = type(caches['etag'])
+        with patch.object(cache_class, 'get_many', autospec=True, side_effect=cache_class.get_many) as get_many, \
+                patch.object(cache_class, 'get_or_set', autospec=True, side_effect=cache_class.get_or_set) as get_or_set:
+            results = self.bulk(request)
+        self.assertEqual([r['status'] for r in results], [304, 304, 200, 404, 200])
+        self.assertEqual(get_many.call_count, 2)
+        self.assertEqual(get_or_set.call_count, 0)
+
+        instance.save()
+        results = self.bulk(request)
+        self.assertEqual([r['status'] for r in results], [200, 200, 200, 404, 200])
+
+        # Values are not prefetched if bulk could change them
+        self.assertEqual(
+            bulk._get_cached_views_items(endpoint._iter_resolved_get_operations(
+                [*request, {'method': 'get', 'path': 'cacheable/<<0[data][id]>>'}]
+            )),
+            {(CachableModel, None), (CachableModel, str(instance.id))},
+        )
+        self.assertTrue(bulk._is_read_only(request))
+        self.assertFalse(bulk._is_read_only([*request, {'method': 'patch', 'path': 'cacheable'}]))
+        self.assertFalse(bulk._is_read_only([*request, 'invalid']))
+        with patch('vstutils.api.endpoint._get_cached_views_items') as get_items:
+            self.bulk([*request, {'method': 'patch', 'path': ['cacheable', instance.id], 'data': {}}])
+        get_items.assert_not_called()
+
+        # Missing values are not returned and models without cached responses are ignored
+        caches['etag'].clear()
+        self.assertEqual(get_cached_etag_values({(CachableModel, None), (CachableModel, '1'), (Host, None)}), {})
+        self.assertEqual(get_cached_etag_values({(Host, None)}), {})
+        CachableModel.get_etag_value()
+        self.assertEqual(
+            get_cached_etag_values({(CachableModel, None), (CachableModel, '1')}),
+            {(CachableModel, None): CachableModel.get_etag_value()},
+        )
+
     def test_env_vars(self):
         self.assertIn(settings.TEST_VAR_FROM_ENV, (os.environ['HOME'], 'default'))
         self.assertEqual(settings.TEST_VAR_FROM_ENV_DEFAULT, 'default')
@@ -5759,6 +6645,748 @@ class ToolsTestCase(BaseTestCase):
         )
         self.assertEqual(result, expected)
 
+    def test_cache_pool_metrics(self):
+        import tarantool
+        from vstutils.drivers.cache import TarantoolCache, TarantoolConnectionPool
+
+        with patch('vstutils.drivers.cache.tarantool.Connection') as connection_mock, \
+                patch.dict(TarantoolConnectionPool.pools, clear=True):
+            connection_mock.return_value.is_closed.return_value = False
+            cache = TarantoolCache('localhost:3301', {'OPTIONS': {'max_pool_size': 1, 'pool_timeout': 0}})
+            # Spaces are prepared once for the whole process.
+            self.assertEqual(connection_mock.return_value.eval.call_count, 4)
+            TarantoolCache('localhost:3301', {})
+            self.assertEqual(connection_mock.return_value.eval.call_count, 4)
+            self.assertIs(cache.pool, TarantoolConnectionPool.get_pool('localhost:3301', {}))
+
+            with cache.pool.connection() as client:
+                with self.assertRaises(TimeoutError):
+                    cache.pool.acquire()
+                result = self.get_result('get', '/api/metrics/')
+            self.assertIn('test_cache_pool_connections{location="localhost:3301",state="in_use"} 1\n', result)
+            self.assertIn('test_cache_pool_connections{location="localhost:3301",state="idle"} 0\n', result)
+            self.assertIn('test_cache_pool_size{location="localhost:3301"} 1\n', result)
+            self.assertIn('test_cache_pool_waits{location="localhost:3301"} 1\n', result)
+
+            # Idle connection is reused while it is healthy.
+            cache.set('key', 1)
+            self.assertEqual(connection_mock.call_count, 1)
+            client.call.assert_called_once()
+
+            # Stale connection is pinged and reopened when ping fails.
+            cache.pool.health_check_interval = 0
+            client.ping.side_effect = tarantool.error.NetworkError('test')
+            cache.has_key('key')
+            self.assertEqual(connection_mock.call_count, 2)
+            self.assertEqual(cache.pool.reconnects, 1)
+            client.close.assert_called_once()
+            client.ping.side_effect = None
+
+            # Connection broken during request is dropped.
+            client.call.side_effect = tarantool.error.NetworkError('test')
+            with self.assertRaises(tarantool.error.NetworkError):
+                cache.get('key')
+            self.assertEqual(client.close.call_count, 2)
+            result = self.get_result('get', '/api/metrics/')
+            self.assertIn('test_cache_pool_connections{location="localhost:3301",state="idle"} 0\n', result)
+            self.assertIn('test_cache_pool_created{location="localhost:3301"} 2\n', result)
+            self.assertIn('test_cache_pool_reconnects{location="localhost:3301"} 1\n', result)
+
+            client.is_closed.return_value = True
+            with patch.object(cache.pool, '_connect', side_effect=tarantool.error.NetworkError('test')):
+                with self.assertRaises(tarantool.error.NetworkError):
+                    cache.get('key')
+            self.assertEqual(cache.pool.in_use, 0)
+
+            # Waits don't take slots of pool, extra idle connections are closed.
+            client.is_closed.return_value = False
+            client.close.reset_mock()
+            client.call.side_effect = None
+            client.call.return_value.data = [False]
+            with cache.pool.connection():
+                self.assertFalse(cache.wait('key', 0))
+                client.call.assert_called_with('django_cache_wait', (':1:key', 0))
+            client.close.assert_called_once()
+            self.assertEqual(cache.pool.idle, 1)
+
+            cache.close()
+            TarantoolCache('localhost:3301', {'OPTIONS': {'close_connection': True}}).close()
+
+    def test_cache_bulk_functions(self):
+        import tarantool
+        from vstutils.drivers.cache import TarantoolCache, TarantoolConnectionPool
+
+        with patch('vstutils.drivers.cache.tarantool.Connection') as connection_mock, \
+                patch.dict(TarantoolConnectionPool.pools, clear=True):
+            client = connection_mock.return_value
+            client.is_closed.return_value = False
+            cache = TarantoolCache('localhost:3301', {'OPTIONS': {'connect_on_start': False, 'batch_size': 2}})
+            serializer = cache._serializer
+
+            client.call.side_effect = [
+                Mock(data=[[[':1:a', serializer.dumps({'a': 1})]]]),
+                Mock(data=[[[":1:c'", 3]]]),
+            ]
+            self.assertEqual(cache.get_many(['a', 'b', "c'"]), {'a': {'a': 1}, "c'": 3})
+            # Keys are sent as binary arguments in batches of batch_size items.
+            self.assertEqual(client.call.call_args_list[0].args, ('django_cache_get_many', ((':1:a', ':1:b'),)))
+            self.assertEqual(client.call.call_args_list[1].args, ('django_cache_get_many', ((":1:c'",),)))
+            self.assertEqual(connection_mock.call_count, 1)
+
+            client.call.reset_mock(side_effect=True)
+            with patch('vstutils.drivers.cache.time.time', return_value=100):
+                self.assertEqual(cache.set_many({'a': b'\x00', 'b': 1}, timeout=10), [])
+            client.call.assert_called_once_with(
+                'django_cache_set_many',
+                (((':1:a', serializer.dumps(b'\x00'), 110), (':1:b', 1, 110)),),
+            )
+            self.assertEqual(cache.set_many({}), [])
+
+            # Space and functions lost by server are created again.
+            client.call.reset_mock()
+            client.call.side_effect = [tarantool.error.DatabaseError(tarantool.error.ER_NO_SUCH_PROC, 'test'), Mock(data=[1])]
+            cache.delete_many(['a'])
+            self.assertEqual(client.call.call_count, 2)
+            self.assertIn("box.schema.space.create('DJANGO_CACHE'", client.eval.call_args_list[0].args[0])
+            self.assertIn('function django_cache_delete_many(keys)', client.eval.call_args.args[0])
+            self.assertIsNone(cache.delete_many([]))
+
+            # Values are set by stored function too, so lost space is recovered by sync set.
+            client.eval.reset_mock()
+            client.call.reset_mock()
+            client.call.side_effect = [tarantool.error.DatabaseError(tarantool.error.ER_NO_SUCH_PROC, 'test'), Mock(data=[True])]
+            with patch('vstutils.drivers.cache.time.time', return_value=100):
+                cache.set('a', 1, timeout=10)
+            self.assertEqual(client.call.call_args.args, ('django_cache_set', ((':1:a', 1, 110),)))
+            self.assertEqual(client.call.call_count, 2)
+            self.assertIn("box.schema.space.create('DJANGO_CACHE'", client.eval.call_args_list[0].args[0])
+
+            client.call.side_effect = tarantool.error.DatabaseError(1, 'test')
+            with self.assertRaises(tarantool.error.DatabaseError):
+                cache.delete_many(['a'])
+
+    def test_cache_atomic_functions(self):
+        from vstutils.drivers.cache import TarantoolCache, TarantoolConnectionPool
+
+        with patch('vstutils.drivers.cache.tarantool.Connection') as connection_mock, \
+                patch.dict(TarantoolConnectionPool.pools, clear=True), \
+                patch('vstutils.drivers.cache.time.time', return_value=100):
+            client = connection_mock.return_value
+            client.is_closed.return_value = False
+            cache = TarantoolCache('localhost:3301', {'OPTIONS': {'connect_on_start': False}, 'TIMEOUT': 10})
+            dumps = cache._serializer.dumps
+
+            def call_result(value):
+                client.call.reset_mock()
+                client.call.return_value.data = [value]
+
+            # Every primitive takes exactly one call of stored function.
+            call_result(None)
+            self.assertEqual(cache.get('key', 'default'), 'default')
+            client.call.assert_called_once_with('django_cache_get', (':1:key',))
+
+            call_result(dumps('value'))
+            self.assertEqual(cache.get_or_set('key', 'new', timeout=None), 'value')
+            client.call.assert_called_once_with('django_cache_get_or_set', ((':1:key', dumps('new'), -1),))
+
+            call_result(dumps('value'))
+            default = Mock()
+            self.assertEqual(cache.get_or_set('key', default), 'value')
+            default.assert_not_called()
+            client.call.side_effect = [Mock(data=[None]), Mock(data=[dumps('new')])]
+            default.return_value = 'new'
+            self.assertEqual(cache.get_or_set('key', default), 'new')
+            default.assert_called_once()
+            self.assertEqual(client.call.call_args.args, ('django_cache_get_or_set', ((':1:key', dumps('new'), 110),)))
+            self.assertEqual(client.call.call_count, 3)
+
+            client.call.side_effect = None
+            call_result(False)
+            self.assertFalse(cache.add('key', 'value', timeout=0))
+            client.call.assert_called_once_with('django_cache_add', ((':1:key', dumps('value'), 100),))
+
+            call_result(True)
+            self.assertTrue(cache.touch('key', 5))
+            client.call.assert_called_once_with('django_cache_touch', (':1:key', 105))
+
+            call_result(True)
+            self.assertTrue(cache.has_key('key'))
+            client.call.assert_called_once_with('django_cache_has_key', (':1:key',))
+
+            call_result(3)
+            self.assertEqual(cache.decr('key', 2), 3)
+            client.call.assert_called_once_with('django_cache_incr', (':1:key', -2))
+            call_result(None)
+            with self.assertRaises(ValueError):
+                cache.incr('key')
+
+    def test_cache_serializer(self):
+        import pickle
+        import uuid
+        from django.core.exceptions import ImproperlyConfigured
+        from vstutils.drivers.cache import TarantoolCache, TarantoolConnectionPool, TarantoolSerializer
+
+        value = {'str': 'text', 'list': [1, 1.5, True, None, {}], 'dict': {'a': []}}
+        not_native = (1.0, None, b'bytes', (1,), {1: 2}, {'a': b'bytes'}, [1.0], uuid.uuid4(), datetime.date.today())
+
+        serializer = TarantoolSerializer()
+        self.assertEqual(serializer.dumps(1), 1)
+        self.assertEqual(serializer.dumps(value), pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(serializer.loads(serializer.dumps(value)), value)
+        self.assertEqual(serializer.loads(1), 1)
+
+        serializer = TarantoolSerializer('msgpack')
+        self.assertIs(serializer.dumps(value), value)
+        self.assertEqual(serializer.dumps('text'), 'text')
+        self.assertEqual(serializer.loads(value), value)
+        for item in not_native:
+            dumped = serializer.dumps(item)
+            self.assertIsInstance(dumped, bytes, item)
+            self.assertEqual(serializer.loads(dumped), item)
+
+        serializer = TarantoolSerializer('msgpack', compress='zlib', compress_min_length=20)
+        self.assertEqual(serializer.dumps('short'), 'short')
+        for item in ('long' * 10, {'items': [value] * 5}, ('text' * 50,)):
+            dumped = serializer.dumps(item)
+            self.assertIsInstance(dumped, bytes)
+            self.assertIn(dumped[0], {0x10, 0x11})
+            self.assertEqual(serializer.loads(dumped), item)
+        # Payloads which aren't shrunk by compression are stored as is.
+        self.assertEqual(serializer.dumps(1.0), pickle.dumps(1.0, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(serializer.dumps([1.5, 2.5]), [1.5, 2.5])
+
+        serializer = TarantoolSerializer(protocol=0)
+        self.assertEqual(serializer.dumps('text'), b'\x00' + pickle.dumps('text', 0))
+        self.assertEqual(serializer.loads(serializer.dumps('text')), 'text')
+        self.assertEqual(TarantoolSerializer(protocol=-1).protocol, pickle.HIGHEST_PROTOCOL)
+
+        with self.assertRaises(ImproperlyConfigured):
+            TarantoolSerializer('json')
+        with self.assertRaises(ImproperlyConfigured):
+            TarantoolSerializer(compress='unknown')
+
+        with patch.dict(TarantoolConnectionPool.pools, clear=True):
+            cache = TarantoolCache('localhost:3301', {'OPTIONS': {
+                'connect_on_start': False,
+                'serializer': 'msgpack',
+                'compress': 'zlib',
+                'compress_min_length': 10,
+            }})
+        self.assertTrue(cache._serializer.native)
+        self.assertEqual(cache._serializer.compress_min_length, 10)
+
+    def test_cache_async_client(self):
+        # pylint: disable=too-many-statements
+        import asyncio
+        import socket
+        import struct
+        import threading
+        import msgpack
+        import tarantool
+        from tarantool import const as iproto
+        from vstutils.drivers.cache import TarantoolCache, TarantoolConnectionPool
+
+        storage = {}
+        requests_log = []
+        registered = set()
+        spaces = set()
+        functions = {
+            'set': lambda item: storage.update({item[0]: item}) or True,
+            'get': lambda key: storage[key][1] if key in storage else None,
+            'add': lambda item: False if item[0] in storage else storage.update({item[0]: item}) or True,
+            'get_or_set': lambda item: storage.setdefault(item[0], item)[1],
+            'delete': lambda key: storage.pop(key, None) is not None,
+            'has_key': lambda key: key in storage,
+            'touch': lambda key, exp: key in storage,
+            'incr': lambda key, delta: (
+                storage.update({key: [key, storage[key][1] + delta, storage[key][2]]}) or storage[key][1]
+                if key in storage else None
+            ),
+            'get_many': lambda keys: [storage[k][:2] for k in keys if k in storage],
+            'set_many': lambda items: len([storage.update({i[0]: i}) for i in items]),
+            'delete_many': lambda keys: len([storage.pop(k) for k in keys if k in storage]),
+        }
+
+        def pack_response(sync, code=iproto.REQUEST_TYPE_OK, body=None):
+            payload = msgpack.packb({iproto.IPROTO_REQUEST_TYPE: code, iproto.IPROTO_SYNC: sync})
+            payload += msgpack.packb(body or {})
+            return b'\xce' + struct.pack('>I', len(payload)) + payload
+
+        async def handle_client(reader, writer):
+            writer.write(b'Tarantool 2.11.0 (Binary)'.ljust(63) + b'\n' + base64.b64encode(b'0' * 32).ljust(63) + b'\n')
+            unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+            pending = []
+            while data := await reader.read(65536):
+                unpacker.feed(data)
+                pending.extend(unpacker)
+                while len(pending) >= 3:
+                    _, header, body = pending[:3]
+                    del pending[:3]
+                    request_type, sync = header[iproto.IPROTO_REQUEST_TYPE], header[iproto.IPROTO_SYNC]
+                    requests_log.append((request_type, body))
+                    if request_type == iproto.REQUEST_TYPE_EVAL:
+                        if "box.schema.space.create('DJANGO_CACHE'" in body[iproto.IPROTO_EXPR]:
+                            spaces.add('DJANGO_CACHE')
+                        registered.update(functions)
+                        if 'truncate' in body[iproto.IPROTO_EXPR]:
+                            storage.clear()
+                        writer.write(pack_response(sync, body={iproto.IPROTO_DATA: []}))
+                        continue
+                    if request_type == iproto.REQUEST_TYPE_AUTHENTICATE:
+                        writer.write(pack_response(sync))
+                        continue
+                    name = body[iproto.IPROTO_FUNCTION_NAME].replace('django_cache_', '')
+                    if name == 'disconnect':
+                        writer.close()
+                        return
+                    if name not in registered:
+                        writer.write(pack_response(
+                            sync,
+                            iproto.REQUEST_TYPE_ERROR | tarantool.error.ER_NO_SUCH_PROC,
+                            {iproto.IPROTO_ERROR_24: f"Procedure '{name}' is not defined"},
+                        ))
+                        continue
+                    try:
+                        assert 'DJANGO_CACHE' in spaces, "Space 'DJANGO_CACHE' does not exist"
+                        result = functions[name](*body[iproto.IPROTO_TUPLE])
+                    except Exception as err:
+                        writer.write(pack_response(
+                            sync,
+                            iproto.REQUEST_TYPE_ERROR | 32,
+                            {iproto.IPROTO_ERROR_24: str(err)},
+                        ))
+                        continue
+                    writer.write(pack_response(sync, body={iproto.IPROTO_DATA: [result]}))
+
+        async def scenario():
+            server = await asyncio.start_server(handle_client, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            cache = TarantoolCache(f'127.0.0.1:{port}', {
+                'OPTIONS': {'connect_on_start': False, 'password': 'secret', 'batch_size': 2, 'close_connection': True},
+                'TIMEOUT': None,
+            })
+
+            # Server has no functions, so they are registered by first call.
+            await cache.aset('a', {'x': 1})
+            self.assertEqual(requests_log[0][0], iproto.REQUEST_TYPE_AUTHENTICATE)
+            self.assertEqual(requests_log[0][1][iproto.IPROTO_USER_NAME], 'guest')
+            self.assertEqual(requests_log[0][1][iproto.IPROTO_TUPLE][0], 'chap-sha1')
+            self.assertEqual([r[0] for r in requests_log[1:]], [
+                iproto.REQUEST_TYPE_CALL, *[iproto.REQUEST_TYPE_EVAL] * 4, iproto.REQUEST_TYPE_CALL,
+            ])
+            self.assertEqual(storage[':1:a'][2], -1)
+
+            # Concurrent requests are multiplexed over one connection.
+            results = await asyncio.gather(*(cache.aget('a') for _ in range(10)), cache.aget('b', 'default'))
+            self.assertEqual(results, [{'x': 1}] * 10 + ['default'])
+            self.assertEqual(cache.pool.created, 1)
+            self.assertIn(
+                ('{prefix}_cache_pool_connections', ({'location': f'127.0.0.1:{port}', 'state': 'async'}, 1)),
+                list(TarantoolConnectionPool.get_metrics()),
+            )
+
+            requests_log.clear()
+            self.assertEqual(await cache.aset_many({'b': 1, 'c': 'text', 'd': b'\x00\xff'}), [])
+            self.assertEqual(len(requests_log), 2)
+            self.assertEqual(
+                await cache.aget_many(['a', 'b', 'c', 'd', 'e']),
+                {'a': {'x': 1}, 'b': 1, 'c': 'text', 'd': b'\x00\xff'},
+            )
+            self.assertEqual(await cache.aset_many({}), [])
+            self.assertEqual(await cache.aincr('b', 2), 3)
+            self.assertEqual(await cache.adecr('b'), 2)
+            with self.assertRaises(ValueError):
+                await cache.aincr('e')
+            self.assertFalse(await cache.aadd('b', 10))
+            self.assertTrue(await cache.aadd('e', 10))
+            self.assertEqual(await cache.aget_or_set('e', 20), 10)
+            self.assertEqual(await cache.aget_or_set('e', lambda: 20), 10)
+            self.assertEqual(await cache.aget_or_set('f', lambda: 20), 20)
+            self.assertTrue(await cache.atouch('f', 10))
+            self.assertFalse(await cache.atouch('g'))
+            self.assertTrue(await cache.ahas_key('f'))
+            self.assertTrue(await cache.adelete('f'))
+            self.assertFalse(await cache.ahas_key('f'))
+            await cache.adelete_many(['b', 'c'])
+            await cache.adelete_many([])
+            self.assertEqual(sorted(storage), [':1:a', ':1:d', ':1:e'])
+            await cache.aclear()
+            self.assertEqual(storage, {})
+
+            # Restarted server lost temporary space with functions, so both are created again.
+            registered.clear()
+            spaces.clear()
+            await cache.aset('a', 1)
+            self.assertEqual(spaces, {'DJANGO_CACHE'})
+            self.assertEqual(await cache.aget('a'), 1)
+            await cache.adelete('a')
+
+            # Broken connection fails pending requests and is reopened by next call.
+            with self.assertRaises(tarantool.error.NetworkError):
+                await asyncio.gather(cache.acall('disconnect'), cache.aget('a'))
+            self.assertIsNone(await cache.aget('a'))
+            self.assertEqual(cache.pool.created, 2)
+            self.assertEqual(cache.pool.reconnects, 1)
+
+            with patch.dict(functions, {'get': Mock(side_effect=Exception('test error'))}):
+                with self.assertRaises(tarantool.error.DatabaseError) as err:
+                    await cache.acall('get', 'a')
+            self.assertEqual((err.exception.code, err.exception.message), (32, 'test error'))
+
+            connection = await cache.pool.aacquire()
+            await cache.aclose()
+            self.assertTrue(connection.is_closed())
+            self.assertEqual(cache.pool.async_connections, 0)
+            await cache.aclose()
+            with self.assertRaises(tarantool.error.NetworkError):
+                await connection.call('django_cache_get', ('a',))
+
+            server.close()
+            await server.wait_closed()
+
+        with patch.dict(TarantoolConnectionPool.pools, clear=True):
+            asyncio.run(scenario())
+
+        # Connections are closed and dropped from pool with their event loops.
+        server = socket.create_server(('127.0.0.1', 0))
+        server.settimeout(5)
+        accepted = []
+
+        def accept():
+            for _ in range(6):
+                client = server.accept()[0]
+                client.settimeout(5)
+                client.sendall(b'0' * iproto.IPROTO_GREETING_SIZE)
+                accepted.append(client)
+
+        thread = threading.Thread(target=accept, daemon=True)
+        thread.start()
+        pool = TarantoolConnectionPool('127.0.0.1', server.getsockname()[1])
+        connections = [asyncio.run(pool.aacquire()) for _ in range(5)]
+        self.assertEqual(pool.async_connections, 0)
+        self.assertTrue(all(connection.is_closed() for connection in connections))
+        # Loop closed without shutdown is dropped by the next connection.
+        closed_loop = asyncio.new_event_loop()
+        closed_loop.close()
+        pool._async_connections[closed_loop] = Mock()
+        asyncio.run(pool.aacquire())
+        self.assertEqual(pool.async_connections, 0)
+        thread.join(5)
+        self.assertEqual([client.recv(1) for client in accepted[:5]], [b''] * 5)
+        for client in accepted:
+            client.close()
+        server.close()
+
+    def test_tarantool_transport_batches(self):
+        from queue import Empty
+        import kombu
+        import vstutils.drivers  # noqa: F401
+
+        def task(tarantool_id, **payload):
+            return [tarantool_id, 't', payload]
+
+        with patch('vstutils.drivers.kombu.tarantool.connect') as connect_mock:
+            client = connect_mock.return_value
+            connection = kombu.Connection(
+                'tarantool://guest@localhost:3301/rpc',
+                transport_options={'take_batch_size': 3, 'ack_batch_size': 2, 'ack_flush_interval': 60},
+            )
+            channel = connection.default_channel
+            self.assertIn('function rpc_celery_queue_take_many(', client.eval.call_args.args[0])
+            self.assertEqual(channel.take_batch_size, 3)
+
+            # Messages are taken in batches limited by prefetch count.
+            channel.qos.prefetch_count = 2
+            client.call.return_value.data = [[task(1, body='1'), task(2, body='2')]]
+            self.assertEqual(channel._get('tasks'), {'body': '1', 'tarantool_queue_id': 1})
+            client.call.assert_called_once_with('rpc_celery_queue_take_many', ('rpc_celery_queue_tasks', 2, 0, False))
+            self.assertEqual(channel._get('tasks', timeout=1), {'body': '2', 'tarantool_queue_id': 2})
+            client.call.return_value.data = [[]]
+            with self.assertRaises(Empty):
+                channel._get('tasks', timeout=1)
+            client.call.assert_called_with('rpc_celery_queue_take_many', ('rpc_celery_queue_tasks', 2, 1, False))
+            channel.qos.prefetch_count = 0
+            client.call.return_value.data = [[task(3), task(4)]]
+            channel._get('other')
+            client.call.assert_called_with('rpc_celery_queue_take_many', ('rpc_celery_queue_other', 3, 0, False))
+
+            # Acks and rejects are sent together when batch is full.
+            client.call.reset_mock()
+            channel.schedule_task_operation('ack', 'tasks', 1)
+            client.call.assert_not_called()
+            channel.schedule_task_operation('release', 'tasks', 2)
+            self.assertEqual(client.call.call_args_list, [
+                (('rpc_celery_queue_apply_many', ('rpc_celery_queue_tasks', 'ack', [1])),),
+                (('rpc_celery_queue_apply_many', ('rpc_celery_queue_tasks', 'release', [2])),),
+            ])
+
+            # Or when flush interval is passed.
+            client.call.reset_mock()
+            channel.ack_flush_interval = 0
+            channel.schedule_task_operation('delete', 'tasks', 5)
+            client.call.assert_called_once_with(
+                'rpc_celery_queue_apply_many', ('rpc_celery_queue_tasks', 'delete', [5])
+            )
+
+            # QoS schedules operations for delivered messages.
+            client.call.reset_mock()
+            message = Mock(delivery_info={'routing_key': 'tasks'}, tarantool_queue_id=6)
+            channel.qos._delivered.update({'tag1': message, 'tag2': message, 'tag3': message})
+            channel.qos.ack('tag1')
+            channel.qos.reject('tag2', requeue=True)
+            channel.qos.reject('tag3')
+            self.assertEqual([c.args[1][1] for c in client.call.call_args_list], ['ack', 'release', 'delete'])
+
+            # Buffered messages are released on close.
+            client.call.reset_mock()
+            channel.close()
+            client.call.assert_called_once_with(
+                'rpc_celery_queue_apply_many', ('rpc_celery_queue_other', 'release', [4])
+            )
+            client.close.assert_called_once()
+
+    def test_tarantool_transport_payload(self):
+        import kombu
+        import vstutils.drivers  # noqa: F401
+
+        with patch('vstutils.drivers.kombu.tarantool.connect') as connect_mock:
+            client = connect_mock.return_value
+            channel = kombu.Connection('tarantool://guest@localhost:3301/rpc').default_channel
+            eta = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+            message = {
+                'body': 'e30=',
+                'headers': {'eta': eta.isoformat()},
+                'properties': {'priority': 3, 'delivery_info': {}},
+            }
+
+            # Message is sent as binary argument of function instead of base64 literal in Lua source.
+            client.call.reset_mock()
+            channel._put('tasks', message)
+            name, (tube, payload, options) = client.call.call_args.args
+            self.assertEqual((name, tube), ('rpc_celery_queue_put', 'rpc_celery_queue_tasks'))
+            self.assertEqual(payload, ormsgpack.packb(message))
+            self.assertEqual(options['pri'], 3)
+            self.assertIn(options['delay'], {29, 30})
+            self.assertIn('msgpack.object_from_raw(data)', client.eval.call_args.args[0])
+
+            channel._put('tasks', {'body': ''})
+            self.assertEqual(client.call.call_args.args[1][2], {})
+
+            # Messages published by previous versions are still readable.
+            client.call.return_value.data = [[
+                [1, 't', base64.b64encode(ormsgpack.packb({'body': 'old'})).decode('utf-8')],
+                [2, 't', {'body': 'new'}],
+            ]]
+            self.assertEqual(channel._get('tasks'), {'body': 'old', 'tarantool_queue_id': 1})
+            self.assertEqual(channel._get('tasks'), {'body': 'new', 'tarantool_queue_id': 2})
+
+            # Messages are published in batches inside buffered block.
+            client.call.reset_mock()
+            channel.publish_batch_size = 2
+            with channel.buffered_publish():
+                with channel.buffered_publish():
+                    channel._put('tasks', message)
+                    channel._put('other', {'body': '1'})
+                client.call.assert_not_called()
+                channel._put('tasks', {'body': '2'})
+                self.assertEqual(client.call.call_count, 1)
+                name, (tube, messages) = client.call.call_args.args
+                self.assertEqual((name, tube), ('rpc_celery_queue_put_many', 'rpc_celery_queue_tasks'))
+                self.assertEqual(messages[0][0], ormsgpack.packb(message))
+                self.assertEqual(messages[0][1]['pri'], 3)
+                self.assertIn(messages[0][1]['delay'], {29, 30})
+                self.assertEqual(messages[1], (ormsgpack.packb({'body': '2'}), {}))
+            client.call.assert_called_with(
+                'rpc_celery_queue_put_many', ('rpc_celery_queue_other', [(ormsgpack.packb({'body': '1'}), {})])
+            )
+            self.assertEqual(client.call.call_count, 2)
+            self.assertIn('function rpc_celery_queue_put_many(', client.eval.call_args.args[0])
+
+    def test_tarantool_transport_long_polling(self):
+        import socket
+        import threading
+        import kombu
+        import vstutils.drivers  # noqa: F401
+
+        with patch('vstutils.drivers.kombu.tarantool.connect') as connect_mock:
+            client, consumer_client = Mock(), Mock()
+            connect_mock.side_effect = [client, consumer_client]
+            connection = kombu.Connection(
+                'tarantool://guest@localhost:3301/rpc',
+                transport_options={'long_polling': True, 'long_polling_timeout': 3},
+            )
+            channel = connection.default_channel
+            self.assertEqual(connect_mock.call_count, 2)
+            self.assertIn('function rpc_celery_queue_take_any(', client.eval.call_args.args[0])
+
+            # Messages are waited on server by dedicated connection.
+            callback = Mock()
+            channel._active_queues.extend(['tasks', 'other'])
+            channel._consumers.add('consumer')
+            consumer_client.call.return_value.data = [[
+                ['rpc_celery_queue_tasks', [1, 't', {'body': '1'}]],
+                ['rpc_celery_queue_other', [2, 't', {'body': '2'}]],
+            ]]
+            channel.drain_events(callback=callback)
+            consumer_client.call.assert_called_once_with(
+                'rpc_celery_queue_take_any',
+                (['rpc_celery_queue_tasks', 'rpc_celery_queue_other'], 10, 3, channel.consumer_id, False),
+            )
+            self.assertEqual(callback.call_args_list, [
+                (({'body': '1', 'tarantool_queue_id': 1}, 'tasks'),),
+                (({'body': '2', 'tarantool_queue_id': 2}, 'other'),),
+            ])
+            client.call.assert_not_called()
+
+            # Empty wait raises timeout only when requested timeout is over.
+            consumer_client.call.return_value.data = [[]]
+            with self.assertRaises(socket.timeout):
+                channel.drain_events(timeout=1, callback=callback)
+            consumer_client.call.assert_called_with(
+                'rpc_celery_queue_take_any',
+                (['rpc_celery_queue_tasks', 'rpc_celery_queue_other'], 10, 1, channel.consumer_id, False),
+            )
+            channel.drain_events(timeout=10, callback=callback)
+            self.assertEqual(callback.call_count, 2)
+
+            # Acks are sent from the same session, messages are published by main connection.
+            channel.ack_flush_interval = 0
+            channel.schedule_task_operation('ack', 'tasks', 1)
+            consumer_client.call.assert_called_with(
+                'rpc_celery_queue_apply_many', ('rpc_celery_queue_tasks', 'ack', [1])
+            )
+            client.call.assert_not_called()
+
+            # Acks from other threads don't wait for long poll, but wake it up to send them.
+            consumer_client.call.reset_mock()
+            poll_started, poll_finished = threading.Event(), threading.Event()
+
+            def poll():
+                with channel.consumer_lock:
+                    poll_started.set()
+                    poll_finished.wait(5)
+
+            thread = threading.Thread(target=poll)
+            thread.start()
+            poll_started.wait(5)
+            channel.schedule_task_operation('ack', 'tasks', 2)
+            client.call.assert_called_once_with('rpc_celery_queue_wakeup', (channel.consumer_id,))
+            consumer_client.call.assert_not_called()
+            poll_finished.set()
+            thread.join(5)
+            channel.drain_events(callback=callback)
+            consumer_client.call.assert_any_call(
+                'rpc_celery_queue_apply_many', ('rpc_celery_queue_tasks', 'ack', [2])
+            )
+
+            # Wakeup callback is installed again on tube created after drop.
+            self.assertIn('if rpc_celery_queue_watched[tube_name] == tube then', client.eval.call_args.args[0])
+            channel._delete('tasks')
+            client.eval.assert_called_with(
+                "queue.tube.rpc_celery_queue_tasks:drop() "
+                "rpc_celery_queue_watched['rpc_celery_queue_tasks'] = nil rpc_celery_queue_taken_at['rpc_celery_queue_tasks'] = nil"
+            )
+
+            channel.close()
+            client.close.assert_called_once()
+            consumer_client.close.assert_called_once()
+
+    def test_tarantool_transport_metrics(self):
+        from queue import Empty
+        import tarantool
+        import kombu
+        from vstutils.drivers.kombu import TarantoolChannel
+
+        statistics = [
+            [
+                'rpc_celery_queue_tasks',
+                {'tasks': {'ready': 3, 'taken': 1, 'delayed': 2, 'total': 6}, 'calls': {'put': 10}},
+                {'take': {'buckets': [0, 1, 1, 2, 2, 2, 2, 2, 2, 2], 'sum': 0.03, 'count': 3}},
+            ],
+            ['rpc_celery_queue_other', {'tasks': {}, 'calls': {}}, []],
+        ]
+        with patch('vstutils.drivers.kombu.tarantool.connect') as connect_mock, \
+                patch.dict(TarantoolChannel.statistics_cache, clear=True):
+            client = connect_mock.return_value
+            self.assertIn('function rpc_celery_queue_statistics(', kombu.Connection(
+                'tarantool://guest@localhost:3301/rpc',
+            ).default_channel.client.eval.call_args.args[0])
+            self.assertNotIn('test_broker_', self.get_result('get', '/api/metrics/'))
+
+            connection = kombu.Connection(
+                'tarantool://guest@localhost:3301/rpc',
+                transport_options={'collect_metrics': True},
+            )
+            channel = connection.default_channel
+            client.call.reset_mock()
+            client.call.return_value.data = [statistics]
+            result = self.get_result('get', '/api/metrics/')
+            client.call.assert_called_once_with('rpc_celery_queue_statistics', ())
+            self.assertIn('test_broker_queue_tasks{queue="tasks",state="ready"} 3\n', result)
+            self.assertIn('test_broker_queue_tasks{queue="tasks",state="delayed"} 2\n', result)
+            self.assertIn('test_broker_queue_tasks{queue="other",state="taken"} 0\n', result)
+            self.assertIn('test_broker_published_total{queue="tasks"} 10\n', result)
+            self.assertIn('test_broker_take_latency_seconds_bucket{queue="tasks",le="0.01"} 1\n', result)
+            self.assertIn('test_broker_take_latency_seconds_bucket{queue="tasks",le="+Inf"} 3\n', result)
+            self.assertIn('test_broker_take_latency_seconds_sum{queue="tasks"} 0.03\n', result)
+            self.assertIn('test_broker_take_latency_seconds_count{queue="tasks"} 3\n', result)
+
+            # Statistics are cached and stay available when server fails.
+            self.get_result('get', '/api/metrics/')
+            client.call.assert_called_once()
+            channel.metrics_cache_timeout = 0
+            client.call.side_effect = tarantool.error.NetworkError('test')
+            self.assertEqual(channel.get_statistics(), statistics)
+            self.assertEqual(client.call.call_count, 2)
+
+            # Latency is observed only by channels which collect metrics.
+            client.call.side_effect = None
+            client.call.return_value.data = [[]]
+            with self.assertRaises(Empty):
+                channel._get('tasks')
+            client.call.assert_called_with('rpc_celery_queue_take_many', ('rpc_celery_queue_tasks', 10, 0, True))
+
+            channel.close()
+            self.assertNotIn(channel, TarantoolChannel.channels)
+
+    def test_tarantool_result_backend(self):
+        import tarantool
+        from celery import Celery
+        from vstutils.drivers.kombu import TarantoolBackend
+
+        with patch('vstutils.drivers.kombu.tarantool.connect') as connect_mock:
+            client = connect_mock.return_value
+            backend = TarantoolBackend(
+                app=Celery(set_as_current=False), url='tarantool://localhost:3301/rpc', expires=60
+            )
+            self.assertIn('function rpc_celery_backend_incr(', client.eval.call_args.args[0])
+            self.assertTrue(backend.implements_incr)
+
+            # Keys are passed as strings declared by primary index of space.
+            def call_function(name, args):
+                keys = args[0] if name.endswith('_mget') else args[:1]
+                if not all(isinstance(key, str) for key in keys):
+                    raise tarantool.error.DatabaseError(
+                        18, 'Supplied key type of part 0 does not match index part type: expected string'
+                    )
+                return Mock(data=[results[name]])
+
+            results = {'rpc_celery_backend_mget': [['celery-task-meta-1', '{}']]}
+            client.call.side_effect = call_function
+            keys = [b'celery-task-meta-1', b"celery-task-meta-'2"]
+            self.assertEqual(backend.mget(keys), {'celery-task-meta-1': '{}'})
+            client.call.assert_called_once_with(
+                'rpc_celery_backend_mget', (['celery-task-meta-1', "celery-task-meta-'2"],)
+            )
+
+            # Chord counters are incremented by server with expiration time.
+            results.update({'rpc_celery_backend_incr': 3, 'rpc_celery_backend_expire': None})
+            with patch('vstutils.drivers.kombu.time.time', return_value=1000):
+                self.assertEqual(backend.incr(b'chord-unlock-1'), 3)
+                client.call.assert_called_with('rpc_celery_backend_incr', ('chord-unlock-1', 1060))
+                backend.expire(b'chord-unlock-1', None)
+                client.call.assert_called_with('rpc_celery_backend_expire', ('chord-unlock-1', -1))
+
     def test_health_page(self):
         result = self.get_result('get', '/api/health/')
         self.assertIn('db', result)
@@ -1,9 +1,11 @@
 import typing as _t
+import asyncio
 import mimetypes
 import time
 import json
 
 import pydantic
+from django.http import HttpResponse, JsonResponse
 from django.utils.functional import SimpleLazyObject
 from rest_framework.fields import IntegerField, CharField
 from rest_framework.permissions import AllowAny
@@ -227,6 +229,16 @@ class RequestInfoTestView(NonModelsViewSet):
         return response
 
 
+async def async_request_info(request):
+    await asyncio.sleep(0)
+    if 'json' in request.GET:
+        return JsonResponse({'user': request.user.id, 'op': request.GET.get('op', ''), 'items': [1, 2]})
+    response = HttpResponse(f"{request.user.id}:{request.GET.get('op', '')}", content_type='text/plain')
+    if request.GET.get('op') == '0':
+        response.set_cookie('async_request_info', '0')
+    return response
+
+
 class TestUserViewSet(UserViewSet):
     @action(methods=['get'], detail=True)
     def test_bulk_perf(self, request, *args, **kwargs):
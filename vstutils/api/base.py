@@ -15,6 +15,7 @@ import orjson
 import pydantic
 from django.conf import settings
 from django.core import exceptions as djexcs
+from django.core.cache import caches as django_caches
 from django.http.response import Http404, FileResponse, HttpResponseNotModified
 from django.db.models.query import QuerySet
 from django.db import transaction, models
@@ -36,6 +37,7 @@ from ..utils import (
     check_request_etag,
 )
 from .. import exceptions as vstexceptions
+from ..gui.context import gui_version
 from . import responses, fields
 from .filter_backends import get_serializer_readable_fields
 from .serializers import (
@@ -377,6 +379,17 @@ class GenericViewSet(QuerySetMixin, vsets.GenericViewSet, metaclass=GenericViewS
     def filter_for_filter_backends(self, backend):
         return getattr(backend, 'required', False)
 
+    def get_object(self):
+        """
+        Returns object of detail view. Objects of detail operations to the same view in bulk request
+        are selected together by :class:`vstutils.api.bulk.ObjectsLoader` of request.
+        """
+        if (loader := getattr(self.request, 'objects_loader', None)) is not None and \
+                (obj := loader.get_object(self)) is not None:
+            self.check_object_permissions(self.request, obj)
+            return obj
+        return super().get_object()
+
     def filter_queryset(self, queryset):
         if hasattr(self, 'nested_name'):
             self.filter_backends = filter(
@@ -569,7 +582,7 @@ def get_etag_value(view, model_class, request, pk=None):
         ).hexdigest()
     elif (get_etag_value_callback := getattr(model_class, 'get_etag_value', None)) is not None:
         pk = pk or view.kwargs.get(view.lookup_url_kwarg or view.lookup_field)
-        etag_value = get_etag_value_callback(pk)
+        etag_value = getattr(request, 'etag_values', {}).get((model_class, pk)) or get_etag_value_callback(pk)
         dependencies = getattr(model_class, '_cache_response_dependencies', (EtagDependency.LANG,))
 
         if EtagDependency.LANG in dependencies:
@@ -588,6 +601,46 @@ def get_etag_value(view, model_class, request, pk=None):
         else etag_value
 
 
+def get_cached_etag_values(items):
+    """
+    Returns base ETag values of models which are already stored in cache.
+    Values are requested in batch: all table values in one cache request and
+    all values of instances in another one. Missing values are not included in result.
+
+    Result could be set to ``etag_values`` attribute of request, so :func:`.get_etag_value`
+    uses it instead of requesting cache for every model.
+
+    :param items: Iterable of ``(model_class, pk)`` pairs, where ``pk`` is ``None`` for list views.
+    :return: Mapping of ``(model_class, pk)`` pairs to their values.
+    :rtype: :class:`dict`
+    """
+    items = {
+        (model_class, pk)
+        for model_class, pk in items
+        if getattr(model_class, '_cache_responses', False) and
+        not any('get_etag_value' in vars(klass) for klass in model_class.__mro__)
+    }
+    if not items:
+        return {}
+    cache = django_caches['etag']
+    values = cache.get_many(
+        {model_class.get_api_cache_name(None if pk is None else '__postfix__') for model_class, pk in items},
+        version=gui_version,
+    )
+    result = {}
+    instance_keys = {}
+    for model_class, pk in items:
+        if pk is None:
+            if (key := model_class.get_api_cache_name()) in values:
+                result[(model_class, pk)] = str(values[key])
+        elif (postfix := values.get(model_class.get_api_cache_name('__postfix__'))) is not None:
+            instance_keys[model_class.get_api_cache_name(pk, _postfix=postfix)] = (model_class, pk)
+    if instance_keys:
+        for key, value in cache.get_many(instance_keys, version=gui_version).items():
+            result[instance_keys[key]] = str(value)
+    return result
+
+
 class EtagDependency(enum.Flag):
     """
     A custom enumeration that defines potential dependencies for ETag generation. It includes:
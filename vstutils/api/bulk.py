@@ -0,0 +1,574 @@
+import os
+import re
+import time
+import asyncio
+import threading
+import typing as _t
+import functools
+import contextvars
+from concurrent.futures import Executor, Future, as_completed, wait as wait_futures
+from collections import OrderedDict, deque
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import exceptions as djexcs
+from django.db import close_old_connections
+from django.urls import ResolverMatch
+
+from .base import CachableHeadMixin, GenericViewSet
+
+THREADS_COUNT = settings.BULK_THREADS
+WORKERS_COUNT = settings.BULK_WORKERS
+PARALLEL_INDEPENDENT = settings.BULK_PARALLEL_INDEPENDENT
+ASYNC_CONCURRENCY = settings.BULK_ASYNC_CONCURRENCY
+SAFE_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+TEMPLATE_OPERATION_FIELDS = ('path', 'headers', 'data', 'query')
+template_reference_regex = re.compile(r'<<\s*(\w*)')
+
+append_to_list = list.append
+_iter_end = object()
+_no_queue = object()
+
+
+@functools.singledispatch
+def _get_request_data(request_data: _t.Iterable) -> _t.Union[_t.List, _t.Tuple]:
+    assert isinstance(request_data, (list, tuple)), 'Request data must be list or tuple.'
+    return request_data
+
+
+@_get_request_data.register(dict)
+def _get_request_data_dict(request_data):
+    return [request_data]
+
+
+@_get_request_data.register(str)
+def _get_request_data_str(request_data):
+    return _get_request_data(orjson.loads(request_data))  # nocv
+
+
+def _iter_template_references(value) -> _t.Iterator[_t.Text]:
+    if isinstance(value, str):
+        if '<<' in value and '>>' in value and not ('{' in value and '}' in value):
+            yield from template_reference_regex.findall(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_template_references(item)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _iter_template_references(key)
+            yield from _iter_template_references(item)
+
+
+def _get_operations_dependencies(operations: _t.Sequence) -> _t.Optional[_t.List[_t.Set[int]]]:
+    """
+    Build dependency graph of bulk operations using "<< >>" template references.
+
+    :param operations: List of raw operations data.
+    :returns: List with indexes of previous operations for every operation or
+              ``None`` if operations should be executed in order (e.g. ``let`` name is template,
+              reference is auto-numbered or references result of next operation).
+    """
+    dependencies: _t.List[_t.Set[int]] = []
+    variables: _t.Dict[_t.Text, int] = {}
+    readers: _t.Dict[_t.Text, _t.List[int]] = {}
+
+    for idx, operation in enumerate(operations):
+        operation_dependencies: _t.Set[int] = set()
+        dependencies.append(operation_dependencies)
+        if not isinstance(operation, dict):
+            continue
+
+        for reference in _iter_template_references([operation.get(f) for f in TEMPLATE_OPERATION_FIELDS]):
+            if not reference:
+                return None
+            if reference.isdigit():
+                if int(reference) >= idx:
+                    # Result of next operation isn't available, so reference fails as in sequential execution.
+                    return None
+                operation_dependencies.add(int(reference))
+            else:
+                if reference in variables:
+                    operation_dependencies.add(variables[reference])
+                # Variable defined by next operations should not be available for previous readers.
+                readers.setdefault(reference, []).append(idx)
+
+        if let := operation.get('let'):
+            if not isinstance(let, str) or '<<' in let:
+                return None
+            # Redefined variable should not be overwritten before previous readers got it.
+            operation_dependencies.update(readers.pop(let, ()))
+            if let in variables:
+                operation_dependencies.add(variables[let])
+            variables[let] = idx
+
+    return dependencies
+
+
+def _is_read_only(operations: _t.Sequence) -> bool:
+    return all(
+        isinstance(operation, dict) and str(operation.get('method', '')).upper() in SAFE_METHODS
+        for operation in operations
+    )
+
+
+def _get_headers_key(headers: _t.Mapping) -> _t.Tuple:
+    # ETag check is done before loading of object, so it doesn't split operations
+    return tuple(sorted((str(k).lower(), str(v)) for k, v in headers.items() if str(k).lower() != 'if-none-match'))
+
+
+def _get_cached_views_items(resolved_operations: _t.Iterable) -> _t.Set[_t.Tuple[_t.Any, _t.Optional[_t.Text]]]:
+    """Returns model classes and primary keys of cachable views requested by resolved ``GET`` operations."""
+    items: _t.Set[_t.Tuple[_t.Any, _t.Optional[_t.Text]]] = set()
+    for _, _, resolver_match in resolved_operations:
+        view_class = getattr(resolver_match.func, 'cls', None)
+        action = getattr(resolver_match.func, 'actions', {}).get('get')
+        if not isinstance(view_class, type) or not issubclass(view_class, CachableHeadMixin):
+            continue
+        model_class = view_class.model or getattr(view_class.queryset, 'model', None)
+        if action == 'list':
+            items.add((model_class, None))
+        elif action == 'retrieve':
+            items.add((model_class, resolver_match.kwargs.get(view_class.lookup_url_kwarg or view_class.lookup_field)))
+    return items
+
+
+class ObjectsLoader:
+    """
+    Loads objects for detail ``GET`` operations of one bulk request to the same view with one query.
+    The first executed operation loads objects for all operations, others take them from loaded objects.
+    Objects are selected from queryset of view, so filtering and permissions are the same as for single object.
+
+    :param lookup_values: Values of lookup field requested by operations.
+    """
+    __slots__ = ('lookup_values', 'objects', 'lock')
+
+    def __init__(self, lookup_values: _t.Iterable[_t.Text]):
+        self.lookup_values = frozenset(lookup_values)
+        self.objects: _t.Optional[_t.Dict[_t.Text, _t.Any]] = None
+        self.lock = threading.Lock()
+
+    def get_object(self, view) -> _t.Optional[_t.Any]:
+        """
+        Returns loaded object for view or ``None`` if view should get it by itself
+        (object is not found or view is not a detail view of loaded objects).
+        """
+        lookup_field = view.lookup_field
+        lookup_value = view.kwargs.get(view.lookup_url_kwarg or lookup_field)
+        if view.action != 'retrieve' or '__' in lookup_field or lookup_value not in self.lookup_values:
+            return None
+        with self.lock:
+            if self.objects is None:
+                queryset = view.filter_queryset(view.get_queryset())
+                try:
+                    self.objects = {
+                        str(getattr(obj, lookup_field)): obj
+                        for obj in queryset.filter(**{f'{lookup_field}__in': self.lookup_values})
+                    }
+                except (TypeError, ValueError, djexcs.ValidationError):
+                    # Invalid lookup values are handled by views themselves
+                    self.objects = {}
+        return self.objects.get(str(lookup_value))
+
+
+def _is_retrieve_route(resolver_match: ResolverMatch) -> bool:
+    view_class = getattr(resolver_match.func, 'cls', None)
+    return (
+        isinstance(view_class, type) and
+        issubclass(view_class, GenericViewSet) and
+        resolver_match.func.actions.get('get') == 'retrieve'
+    )
+
+
+def _is_plain_query_and_headers(query, headers) -> bool:
+    # Operations with templates can't be grouped until referenced results are known.
+    return isinstance(query, str) and isinstance(headers, dict) and '<<' not in query + str(headers)
+
+
+def _get_objects_loaders(resolved_operations: _t.Iterable) -> _t.Dict[_t.Tuple, ObjectsLoader]:
+    """
+    Groups resolved detail ``GET`` operations which differ only by lookup value of the same view
+    and returns loaders for such operations by their url with query and headers.
+    """
+    groups: _t.Dict[_t.Tuple, _t.Tuple[_t.Set[_t.Text], _t.List[_t.Tuple]]] = {}
+    for operation, url, resolver_match in resolved_operations:
+        query = operation.get('query') or ''
+        headers = operation.get('headers') or {}
+        if not _is_retrieve_route(resolver_match) or not _is_plain_query_and_headers(query, headers):
+            continue
+        view_class = resolver_match.func.cls
+        lookup_url_kwarg = view_class.lookup_url_kwarg or view_class.lookup_field
+        headers_key = _get_headers_key(headers)
+        lookup_values, operation_keys = groups.setdefault(
+            (
+                resolver_match.func,
+                tuple(sorted((k, v) for k, v in resolver_match.kwargs.items() if k != lookup_url_kwarg)),
+                query,
+                headers_key,
+            ),
+            (set(), []),
+        )
+        lookup_values.add(resolver_match.kwargs.get(lookup_url_kwarg))
+        operation_keys.append((f'{url}?{query}' if query else url, headers_key))
+
+    loaders: _t.Dict[_t.Tuple, ObjectsLoader] = {}
+    for lookup_values, operation_keys in groups.values():
+        if len(lookup_values) > 1:
+            loader = ObjectsLoader(lookup_values)
+            loaders.update((key, loader) for key in operation_keys)
+    return loaders
+
+
+class OperationsMemo:
+    """
+    Memo of ``GET`` operations responses scoped to one bulk request.
+    Identical operations (same url, query, data and headers) are executed once:
+    concurrent duplicates wait for the first one and reuse its response.
+    Any operation which could modify data clears memo before and after execution.
+    Operations with ``Cache-Control: no-cache`` header are always executed.
+    """
+    __slots__ = ('responses', 'lock')
+
+    def __init__(self):
+        self.responses: _t.Dict[_t.Tuple, Future] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_key(method_name: _t.Text, url: _t.Text, request_kwargs: _t.Mapping) -> _t.Optional[_t.Tuple]:
+        """Returns key of operation or ``None`` if response of operation should not be reused."""
+        headers = {str(k).lower(): str(v) for k, v in request_kwargs['headers'].items()}
+        if method_name != 'get' or 'no-cache' in headers.get('cache-control', ''):
+            return None
+        return url, orjson.dumps(request_kwargs['data'], option=orjson.OPT_SORT_KEYS), tuple(sorted(headers.items()))
+
+    def invalidate(self):
+        with self.lock:
+            self.responses.clear()
+
+    def acquire(self, key: _t.Tuple) -> _t.Tuple[Future, bool]:
+        """Returns future of response and flag that caller should execute operation and set its result."""
+        with self.lock:
+            if (future := self.responses.get(key)) is not None:
+                return future, False
+            future = self.responses[key] = Future()
+            return future, True
+
+    def release(self, key: _t.Tuple, future: Future, response=None, error: _t.Optional[BaseException] = None):
+        if error is None:
+            future.set_result(response)
+            return
+        with self.lock:
+            if self.responses.get(key) is future:
+                del self.responses[key]
+        future.set_exception(error)
+
+    def call(self, method_name: _t.Text, method: _t.Callable, url: _t.Text, request_kwargs: _t.Dict):
+        """Executes operation or returns response of identical operation."""
+        if method_name.upper() not in SAFE_METHODS:
+            self.invalidate()
+            try:
+                return method(url, **request_kwargs)
+            finally:
+                self.invalidate()
+        if (key := self.get_key(method_name, url, request_kwargs)) is None:
+            return method(url, **request_kwargs)
+        future, should_execute = self.acquire(key)
+        if not should_execute:
+            return future.result()
+        try:
+            response = method(url, **request_kwargs)
+        except BaseException as err:
+            self.release(key, future, error=err)
+            raise
+        self.release(key, future, response)
+        return response
+
+    async def acall(self, method_name: _t.Text, method: _t.Callable, url: _t.Text, request_kwargs: _t.Dict):
+        """Same as :meth:`.call` for coroutine method."""
+        if method_name.upper() not in SAFE_METHODS:
+            self.invalidate()
+            try:
+                return await method(url, **request_kwargs)
+            finally:
+                self.invalidate()
+        if (key := self.get_key(method_name, url, request_kwargs)) is None:
+            return await method(url, **request_kwargs)
+        future, should_execute = self.acquire(key)
+        if not should_execute:
+            return await asyncio.wrap_future(future)
+        try:
+            response = await method(url, **request_kwargs)
+        except BaseException as err:
+            self.release(key, future, error=err)
+            raise
+        self.release(key, future, response)
+        return response
+
+
+class OperationsResults:
+    """
+    Results of bulk request operations available to "<< >>" templates of next operations.
+    If dependency graph of operations is known, only results referenced by next operations are stored
+    and every one of them is dropped when all dependent operations are done,
+    so results of long bulk requests are not collected in memory.
+    Reference to result which is not stored (e.g. result of next operation) raises ``IndexError``.
+
+    :param dependencies: Dependency graph of operations (see :func:`._get_operations_dependencies`)
+                         or ``None`` to store all results.
+    """
+    __slots__ = ('results', 'dependents', 'lock')
+
+    def __init__(self, dependencies: _t.Optional[_t.Sequence[_t.Set[int]]]):
+        self.results: _t.Dict[int, _t.Any] = {}
+        self.dependents: _t.Optional[_t.Dict[int, int]] = None
+        self.lock = threading.Lock()
+        if dependencies is not None:
+            self.dependents = {}
+            for operation_dependencies in dependencies:
+                for dependency in operation_dependencies:
+                    self.dependents[dependency] = self.dependents.get(dependency, 0) + 1
+
+    def __getitem__(self, idx: int) -> _t.Any:
+        try:
+            return self.results[idx]
+        except KeyError:
+            raise IndexError(f'Result of operation {idx} is not available.') from None
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def add(self, idx: int, result: _t.Any, dependencies: _t.Iterable[int] = ()) -> None:
+        """Stores result of operation if it is referenced and drops results which are not needed anymore."""
+        if self.dependents is None:
+            self.results[idx] = result
+            return
+        with self.lock:
+            if self.dependents.get(idx):
+                self.results[idx] = result
+            for dependency in dependencies:
+                self.dependents[dependency] -= 1
+                if not self.dependents[dependency]:
+                    del self.dependents[dependency]
+                    self.results.pop(dependency, None)
+
+
+class BulkExecutor(Executor):
+    """
+    Thread pool which executes operations of all bulk requests in the process.
+    Every bulk request has its own queue of operations. Queues are served in round-robin order
+    and no more than ``max_per_queue`` operations of one queue are executed at once,
+    so large bulk requests can't occupy all workers.
+
+    :param max_workers: Max count of worker threads.
+    :param max_per_queue: Max count of concurrently executed operations of one queue.
+    """
+
+    def __init__(self, max_workers: int, max_per_queue: int):
+        self.max_workers = max(max_workers, 1)
+        self.max_per_queue = max(max_per_queue, 1)
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._condition = threading.Condition()
+        self._queues: _t.Dict[_t.Hashable, deque] = OrderedDict()
+        self._running: _t.Dict[_t.Hashable, int] = {}
+        self._threads: _t.List[threading.Thread] = []
+        self._idle = 0
+        #: Count of operations waiting for free worker.
+        self.queued = 0
+        #: Count of currently executed operations.
+        self.running = 0
+
+    @property
+    def workers(self) -> int:
+        return len(self._threads)
+
+    def submit_to_queue(self, queue_key: _t.Hashable, fn: _t.Callable, /, *args, **kwargs) -> Future:
+        """
+        Schedules callable to be executed in queue with given key (e.g. bulk request).
+        """
+        future: Future = Future()
+        with self._condition:
+            queue = self._queues.get(queue_key)
+            if queue is None:
+                queue = self._queues[queue_key] = deque()
+            queue.append((future, fn, args, kwargs))
+            self.queued += 1
+            if self._idle < self.queued and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f'bulk_worker_{len(self._threads)}',
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify()
+        return future
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self.submit_to_queue(bulk_queue_key.get(), fn, *args, **kwargs)
+
+    def _get_available_queue_key(self):
+        for queue_key in self._queues:
+            if self._running.get(queue_key, 0) < self.max_per_queue:
+                return queue_key
+        return _no_queue
+
+    def _get_task(self):
+        with self._condition:
+            while (queue_key := self._get_available_queue_key()) is _no_queue:
+                self._idle += 1
+                self._condition.wait()
+                self._idle -= 1
+            queue = self._queues[queue_key]
+            task = queue.popleft()
+            if queue:
+                self._queues.move_to_end(queue_key)  # type: ignore[attr-defined]
+            else:
+                del self._queues[queue_key]
+            self._running[queue_key] = self._running.get(queue_key, 0) + 1
+            self.queued -= 1
+            self.running += 1
+            return queue_key, task
+
+    def _task_done(self, queue_key: _t.Hashable) -> bool:
+        """Marks task as done and returns ``True`` if there are no more queued tasks with the same key."""
+        with self._condition:
+            self.running -= 1
+            self._running[queue_key] -= 1
+            if not self._running[queue_key]:
+                del self._running[queue_key]
+            self._condition.notify()
+            return queue_key not in self._queues
+
+    def _worker(self):
+        while True:
+            queue_key, (future, fn, args, kwargs) = self._get_task()
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except Exception as exc:  # pylint: disable=broad-exception-caught
+                        future.set_exception(exc)
+            finally:
+                # Connections are reused by operations of the same request and checked when it is drained.
+                if self._task_done(queue_key):
+                    close_old_connections()
+
+
+#: Key of queue in bulk executor for operations submitted by asyncio code.
+bulk_queue_key: contextvars.ContextVar[_t.Hashable] = contextvars.ContextVar('bulk_queue_key', default=None)
+bulk_executor = BulkExecutor(WORKERS_COUNT, THREADS_COUNT)
+
+
+def _is_concurrent_request(request, parallel_independent: bool) -> bool:
+    # Transactional request is executed in request thread, because transaction is bound to its database connection.
+    return request.method != 'POST' and (parallel_independent or request.method != 'PUT')
+
+
+def _iter_request(request, operation_handler, context, parallel_independent=PARALLEL_INDEPENDENT, ordered=True):
+    operations = _get_request_data(request.data)
+    dependencies = _get_operations_dependencies(operations)
+    results = context['results'] = OperationsResults(dependencies)
+    queue_waits: _t.List[float] = []
+    context['queue_waits'] = queue_waits
+
+    def handler(idx, operation, wait_for=(), queued_at=None):
+        if queued_at is not None:
+            append_to_list(queue_waits, time.monotonic() - queued_at)
+        if wait_for:
+            wait_futures(wait_for)
+        result, timing = operation_handler(operation, context)
+        results.add(idx, result, () if dependencies is None else dependencies[idx])
+        return idx, result, timing
+
+    if dependencies is None or not THREADS_COUNT or len(operations) < 2 or \
+            not _is_concurrent_request(request, parallel_independent):
+        for idx, operation in enumerate(operations):
+            yield handler(idx, operation)
+        return
+
+    scheduled: _t.List[Future] = []
+    try:
+        for idx, operation in enumerate(operations):
+            append_to_list(scheduled, bulk_executor.submit_to_queue(
+                request,
+                handler,
+                idx,
+                operation,
+                [scheduled[dep] for dep in dependencies[idx]],
+                time.monotonic(),
+            ))
+        for future in scheduled if ordered else as_completed(scheduled):
+            yield future.result()
+    finally:
+        for future in scheduled:
+            future.cancel()
+
+
+async def _aiter_request(
+    request,
+    operation_handler,
+    context,
+    parallel_independent=PARALLEL_INDEPENDENT,
+    concurrency=ASYNC_CONCURRENCY,
+    ordered=True,
+):
+    operations = _get_request_data(request.data)
+    dependencies = _get_operations_dependencies(operations)
+    results = context['results'] = OperationsResults(dependencies)
+    context['queue_waits'] = []
+    # Generator is iterated by request task, so queue key is visible in its steps
+    # and tasks of operations but must not stay in request context after iteration.
+    token = bulk_queue_key.set(request)
+
+    async def handler(idx, operation, wait_for=(), semaphore=None):
+        if wait_for:
+            await asyncio.wait(wait_for)
+        if semaphore is None:
+            result, timing = await operation_handler(operation, context)
+        else:
+            async with semaphore:
+                result, timing = await operation_handler(operation, context)
+        results.add(idx, result, () if dependencies is None else dependencies[idx])
+        return idx, result, timing
+
+    tasks: _t.List[asyncio.Future] = []
+    try:
+        if dependencies is None or concurrency < 2 or len(operations) < 2 or \
+                not _is_concurrent_request(request, parallel_independent):
+            for idx, operation in enumerate(operations):
+                yield await handler(idx, operation)
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+        for idx, operation in enumerate(operations):
+            tasks.append(asyncio.ensure_future(handler(
+                idx,
+                operation,
+                [tasks[dep] for dep in dependencies[idx]],
+                semaphore,
+            )))
+        for task in tasks if ordered else asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        bulk_queue_key.reset(token)
+
+
+async def _run_in_bulk_executor(context: _t.Dict, func: _t.Callable, *args, **kwargs):
+    queued_at = time.monotonic()
+
+    def call():
+        append_to_list(context['queue_waits'], time.monotonic() - queued_at)
+        return func(*args, **kwargs)
+
+    return await sync_to_async(call, thread_sensitive=False, executor=bulk_executor)()
+
+
+async def _aiter_sync(iterator: _t.Iterator) -> _t.AsyncIterator:
+    get_next = sync_to_async(functools.partial(next, iterator, _iter_end), thread_sensitive=True)
+    while (item := await get_next()) is not _iter_end:
+        yield item
@@ -1,16 +1,23 @@
+import string
+import asyncio
 import typing as _t
 import logging
 import traceback
 import functools
-from concurrent.futures import ThreadPoolExecutor, Executor
 from collections import OrderedDict
+from urllib.parse import urlsplit
 
 import orjson
+from asgiref.sync import async_to_sync, sync_to_async, iscoroutinefunction
 from django.conf import settings
-from django.db import transaction
-from django.http import HttpResponse, HttpRequest
+from django.db import transaction, close_old_connections
+from django.core.handlers.asgi import ASGIRequest
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpResponse, HttpRequest, StreamingHttpResponse
 from django.contrib.auth.models import AbstractUser, AnonymousUser
-from django.test.client import Client, ClientHandler
+from django.core.signals import request_finished
+from django.test.client import Client, ClientHandler, conditional_content_removal
+from django.urls import get_resolver, set_urlconf, Resolver404, ResolverMatch
 from django.test.utils import modify_settings
 from drf_yasg.views import SPEC_RENDERERS
 from rest_framework import serializers, views, versioning, request as drf_request, exceptions
@@ -22,18 +29,35 @@ from rest_framework.authentication import (
 )
 
 from . import responses
+from .base import get_cached_etag_values
+from .bulk import (
+    PARALLEL_INDEPENDENT,
+    ASYNC_CONCURRENCY,
+    OperationsMemo,
+    OperationsResults,
+    _is_read_only,
+    _get_headers_key,
+    _get_cached_views_items,
+    _get_objects_loaders,
+    _iter_request,
+    _aiter_request,
+    _aiter_sync,
+    _run_in_bulk_executor,
+)
 from .decorators import cache_method_result
 from .serializers import DataSerializer
 from .validators import UrlQueryStringValidator
-from .renderers import ORJSONRenderer
+from .renderers import ORJSONRenderer, NDJSONRenderer, RawJSON, RawJSONList
 from ..utils import Dict, raise_context, patch_gzip_response
 from ..middleware import BaseMiddleware
 from ..oauth2.authentication import JWTBearerTokenAuthentication
 
 RequestType = _t.Union[drf_request.Request, HttpRequest]
+BulkResponseType = _t.Union[responses.BaseResponseClass, StreamingHttpResponse]
 logger: logging.Logger = logging.getLogger('vstutils')
 
-THREADS_COUNT = settings.BULK_THREADS
+RESOLVE_CACHE_SIZE = settings.BULK_RESOLVE_CACHE_SIZE
+TEMPLATES_CACHE_SIZE = settings.BULK_TEMPLATES_CACHE_SIZE
 API_URL: _t.Text = settings.API_URL
 DEFAULT_VERSION = settings.VST_API_VERSION
 REST_METHODS: _t.List[_t.Text] = [
@@ -48,6 +72,7 @@ default_authentication_classes = (
 )
 
 append_to_list = list.append
+_template_formatter = string.Formatter()
 response_headers_to_pass = (
     "ETag",
     "Location",
@@ -57,32 +82,22 @@ response_headers_to_pass = (
 )
 
 
-@functools.singledispatch
-def _get_request_data(request_data: _t.Iterable) -> _t.Union[_t.List, _t.Tuple]:
-    assert isinstance(request_data, (list, tuple)), 'Request data must be list or tuple.'
-    return request_data
-
-
-@_get_request_data.register(dict)
-def _get_request_data_dict(request_data):
-    return [request_data]
-
-
-@_get_request_data.register(str)
-def _get_request_data_str(request_data):
-    return _get_request_data(orjson.loads(request_data))  # nocv
-
-
-def _iter_request(request, operation_handler, context):
-    executor_class = _DummyExecutor
-    if request.method not in ('POST', 'PUT'):
-        executor_class = ThreadPoolExecutor if THREADS_COUNT else executor_class
-
-    def handler(operation):
-        return operation_handler(operation, context)
-
-    with executor_class(max_workers=THREADS_COUNT) as executor:
-        yield from executor.map(handler, _get_request_data(request.data))
+def _iter_resolved_get_operations(operations: _t.Sequence) -> _t.Iterator[_t.Tuple[_t.Dict, _t.Text, _t.Any]]:
+    """Yields ``GET`` operations without templates in path with their urls and resolved routes."""
+    for operation in operations:
+        path = operation.get('path')
+        if str(operation['method']).upper() != 'GET' or not isinstance(path, (str, list, tuple)) or '<<' in str(path):
+            continue
+        url = _join_paths(
+            API_URL,
+            operation.get('version', settings.VST_API_VERSION),
+            *((path,) if isinstance(path, str) else path),
+        )
+        try:
+            resolver_match = BulkClient.handler.resolve_path(None, url)
+        except Resolver404:
+            continue
+        yield operation, url, resolver_match
 
 
 def _join_paths(*args) -> _t.Text:
@@ -94,16 +109,6 @@ def _join_paths(*args) -> _t.Text:
     return f"/{'/'.join(str(arg).strip('/') for arg in args)}/"
 
 
-class _DummyExecutor(Executor):
-    # pylint: disable=abstract-method
-
-    def __init__(self, *args, **kwargs):
-        super().__init__()
-
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
-        return map(fn, *iterables)
-
-
 class ParseResponseDict(dict):
     timing: _t.SupportsFloat
 
@@ -131,6 +136,9 @@ class ParseResponseDict(dict):
                 return response.rendered_content  # type: ignore
         if response.status_code != 404 and getattr(response, "rendered_content", False):  # nocv
             return orjson.loads(response.rendered_content.decode())  # type: ignore
+        if response.content and response.get('Content-Type', '').startswith(ORJSONRenderer.json_media_type):
+            # Content of plain JSON responses is inserted to bulk response without parsing
+            return RawJSON(response.content)
         return Dict(detail=str(response.content.decode('utf-8')))
 
 
@@ -158,21 +166,169 @@ class BulkMiddleware(BaseMiddleware):
             request.session = request.META.pop('session')
         if 'notificator' in request.META:
             request.notificator = request.META.pop('notificator')  # type: ignore
+        if 'etag_values' in request.META:
+            request.etag_values = request.META.pop('etag_values')  # type: ignore
+        if 'objects_loader' in request.META:
+            request.objects_loader = request.META.pop('objects_loader')  # type: ignore
         return request
 
 
+def _send_request_finished(sender):
+    # Receivers are filtered without changing of signal, which is shared by concurrent requests.
+    # pylint: disable=protected-access
+    sync_receivers, async_receivers = _t.cast(
+        _t.Tuple[_t.List[_t.Callable], _t.List[_t.Callable]],
+        request_finished._live_receivers(sender),
+    )
+    for receiver in sync_receivers:
+        if receiver is not close_old_connections:
+            receiver(signal=request_finished, sender=sender)
+    if async_receivers:
+        async def asend():
+            await asyncio.gather(*(
+                receiver(signal=request_finished, sender=sender)
+                for receiver in async_receivers
+            ))
+        async_to_sync(asend)()
+
+
+def _closing_iterator(iterable, close):
+    try:
+        yield from iterable
+    finally:
+        close()
+
+
+async def _aclosing_iterator(iterable, close):
+    try:
+        async for chunk in iterable:
+            yield chunk
+    finally:
+        await sync_to_async(close, thread_sensitive=False)()
+
+
 class BulkClientHandler(ClientHandler):
+    """
+    Handler which executes bulk operations in-process through endpoint middleware chain.
+    Unlike test client handler it doesn't send ``request_started`` signal for every operation
+    (it is sent once for the bulk request itself) and caches url routes resolving.
+
+    Operations are still passed through middlewares from ``MIDDLEWARE_ENDPOINT_CONTROL`` setting,
+    because views rely on request attributes set by them (user, language, notificator and so on).
+    Routes are cached by path without query string: path converters can be matched only by resolver.
+    """
+
     @modify_settings(MIDDLEWARE=settings.MIDDLEWARE_ENDPOINT_CONTROL)
     def __init__(self, *args, **kwargs):
         super().__init__(enforce_csrf_checks=False, *args, **kwargs)
+        self.resolve_route = functools.lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._resolve_route)
         if self.__class__.__name__ == 'BulkClientHandler':
             self.load_middleware()
 
+    @staticmethod
+    def _resolve_route(urlconf, path_info):
+        return get_resolver(urlconf).resolve(path_info)
+
+    def resolve_path(self, urlconf, path_info) -> ResolverMatch:
+        """
+        Returns new match for path. Route is resolved once, so views may change
+        arguments of their match without affecting other operations.
+        """
+        route = self.resolve_route(urlconf, urlsplit(path_info).path)
+        return ResolverMatch(
+            route.func,
+            tuple(route.args),
+            dict(route.kwargs),
+            url_name=route.url_name,
+            app_names=route.app_names,
+            namespaces=route.namespaces,
+            route=route.route,
+            tried=route.tried,
+            captured_kwargs=dict(route.captured_kwargs),
+            extra_kwargs=dict(route.extra_kwargs),
+        )
+
+    def resolve_request(self, request):
+        urlconf = getattr(request, 'urlconf', None)
+        if urlconf is not None:
+            set_urlconf(urlconf)  # nocv
+        request.resolver_match = resolver_match = self.resolve_path(urlconf, request.path_info)
+        return resolver_match
+
+    @staticmethod
+    def close_response(response: HttpResponse):
+        """
+        Closes response like test client does: releases its resources and sends ``request_finished`` signal
+        to every receiver except ``close_old_connections``, because it would close connection
+        of operation running in atomic block. Connections are checked when bulk request is finished.
+        """
+        # Response is closed without sending of signal to all receivers.
+        # pylint: disable=protected-access
+        for closer in response._resource_closers:
+            with raise_context():
+                closer()
+        response._resource_closers.clear()
+        response.closed = True
+        _send_request_finished(response._handler_class)
+
+    def wrap_streaming_response(self, response: HttpResponse):
+        close = functools.partial(self.close_response, response)
+        if response.is_async:  # type: ignore[attr-defined]
+            response.streaming_content = _aclosing_iterator(  # type: ignore[attr-defined]
+                response.streaming_content,  # type: ignore[attr-defined]
+                close,
+            )
+        else:
+            response.streaming_content = _closing_iterator(  # type: ignore[attr-defined]
+                response.streaming_content,  # type: ignore[attr-defined]
+                close,
+            )
+
+    def __call__(self, environ):
+        if self._middleware_chain is None:
+            self.load_middleware()  # nocv
+
+        request = WSGIRequest(environ)
+        request._dont_enforce_csrf_checks = not self.enforce_csrf_checks  # pylint: disable=protected-access
+        response = self.get_response(request)
+        conditional_content_removal(request, response)
+        response.wsgi_request = request
+        if response.streaming:
+            self.wrap_streaming_response(response)
+        else:
+            self.close_response(response)
+        return response
+
+
+class AsyncBulkClientHandler(BulkClientHandler):
+    """
+    Handler which awaits async views of bulk operations through async endpoint middleware chain.
+    """
+
+    @modify_settings(MIDDLEWARE=settings.MIDDLEWARE_ENDPOINT_CONTROL)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.load_middleware(is_async=True)
+
+    async def __call__(self, environ):
+        # pylint: disable=invalid-overridden-method
+        request = WSGIRequest(environ)
+        request._dont_enforce_csrf_checks = not self.enforce_csrf_checks  # pylint: disable=protected-access
+        response = await self.get_response_async(request)
+        conditional_content_removal(request, response)
+        response.wsgi_request = request
+        if response.streaming:
+            self.wrap_streaming_response(response)
+        else:
+            await sync_to_async(self.close_response, thread_sensitive=False)(response)
+        return response
+
 
 class BulkClient(Client):
     __slots__ = ('user', 'language', 'session', 'exc_info')
     handler: BulkClientHandler = BulkClientHandler()
     user: _t.Optional[AbstractUser]
+    etag_values: _t.Optional[_t.Dict]
 
     def __init__(self, enforce_csrf_checks=False, **defaults):
         # pylint: disable=bad-super-call
@@ -181,10 +337,11 @@ class BulkClient(Client):
         self.language = defaults.pop('language', None)
         self.session = defaults.pop('session', None)
         self.notificator = defaults.pop('notificator', None)
+        self.etag_values = defaults.pop('etag_values', None)
         super(Client, self).__init__(**defaults)
         self.exc_info = None
 
-    def request(self, **request):
+    def get_environ(self, **request):
         if self.user:
             request['user'] = self.user
         if self.auth_obj:
@@ -195,12 +352,97 @@ class BulkClient(Client):
             request['session'] = self.session
         if self.notificator:
             request['notificator'] = self.notificator
-        response = self.handler(self._base_environ(**request))
+        if self.etag_values:
+            request['etag_values'] = self.etag_values
+        return self._base_environ(**request)
+
+    def request(self, **request):
+        response = self.handler(self.get_environ(**request))
         if response.cookies:
             self.cookies.update(response.cookies)
         return response
 
 
+class AsyncBulkClient(BulkClient):
+    __slots__ = ()
+    handler: AsyncBulkClientHandler = AsyncBulkClientHandler()
+
+    async def request(self, **request):
+        # pylint: disable=invalid-overridden-method
+        response = await self.handler(self.get_environ(**request))
+        if response.cookies:
+            self.cookies.update(response.cookies)
+        return response
+
+
+class OperationTemplate:
+    """
+    Compiled "<< >>" template of operation field.
+    Template is parsed once and references are resolved directly from results of operations and variables.
+    If the whole string is one reference to object, list or number, referenced value is returned as is.
+
+    :param template: String with "<< >>" templates.
+    """
+    __slots__ = ('template', 'parts')
+
+    def __init__(self, template: _t.Text):
+        self.template = template.replace('<<', '{').replace('>>', '}')
+        self.parts: _t.Optional[_t.Tuple[_t.Tuple[_t.Text, _t.Optional[_t.Text], _t.Optional[_t.Text], _t.Text], ...]]
+        try:
+            self.parts = tuple(_template_formatter.parse(self.template))  # type: ignore[arg-type]
+        except ValueError:
+            self.parts = None
+        if self.parts and any(field == '' or (spec and '{' in spec) for _, field, spec, _ in self.parts):
+            # Auto-numbering and nested replacement fields are formatted by str.format
+            self.parts = None
+
+    def render(self, results: _t.Union[_t.Sequence, OperationsResults], variables: _t.Mapping) -> _t.Any:
+        parts = self.parts
+        if parts is None:
+            result = _template_formatter.vformat(self.template, results, variables)
+        elif len(parts) == 1 and not parts[0][0] and not parts[0][2] and not parts[0][3]:
+            value = _template_formatter.get_field(parts[0][1], results, variables)[0]  # type: ignore[arg-type]
+            if isinstance(value, RawJSON):
+                value = value.value
+            if isinstance(value, (dict, list)) or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+                return value
+            result = format(value)
+        else:
+            chunks: _t.List[_t.Text] = []
+            for literal, field_name, format_spec, conversion in parts:
+                append_to_list(chunks, literal)
+                if field_name is not None:
+                    value = _template_formatter.get_field(field_name, results, variables)[0]
+                    if conversion:
+                        value = _template_formatter.convert_field(value, conversion)
+                    append_to_list(chunks, format(value, format_spec or ''))
+            result = ''.join(chunks)
+
+        try:
+            return orjson.loads(result)
+        except orjson.JSONDecodeError:
+            return result
+
+
+@functools.lru_cache(maxsize=TEMPLATES_CACHE_SIZE)
+def _compile_template(template: _t.Text) -> OperationTemplate:
+    return OperationTemplate(template)
+
+
+def get_operation_template(value: _t.Text) -> _t.Optional[OperationTemplate]:
+    """Returns compiled template if string contains "<< >>" templates."""
+    if '<<' in value and '>>' in value and not ('{' in value and '}' in value):
+        return _compile_template(value)
+    return None
+
+
+def _contains_templates(data) -> bool:
+    try:
+        return b'<<' in orjson.dumps(data)
+    except TypeError:
+        return True
+
+
 class FormatDataFieldMixin:
     """
     Mixin for fields that can format "<< >>" templates inside strings
@@ -208,20 +450,16 @@ class FormatDataFieldMixin:
     requires_context: bool = True
     context: _t.Dict
 
+    def format_template(self, value: _t.Text) -> _t.Any:
+        if 'results' in self.context and (template := get_operation_template(value)) is not None:
+            return template.render(self.context['results'], self.context['variables'])
+        return value
+
     def to_internal_value(self, data) -> _t.Text:
         result = super().to_internal_value(data)  # type: ignore
 
-        if isinstance(result, str) \
-                and '<<' in result \
-                and '>>' in result \
-                and not ('{' in result and '}' in result) \
-                and 'results' in self.context:
-            result = result.replace('<<', '{').replace('>>', '}').format(
-                *self.context['results'],
-                **self.context['variables'],
-            )
-            with raise_context():
-                return orjson.loads(result)
+        if isinstance(result, str):
+            return self.format_template(result)
 
         return result
 
@@ -235,19 +473,30 @@ class TemplateStringField(FormatDataFieldMixin, serializers.CharField):
 class RequestDataField(FormatDataFieldMixin, DataSerializer):
     """
     Field that can handle basic data types and recursise
-    format template strings inside them
+    format template strings inside them.
+    Data without templates is returned as is.
     """
 
     def to_internal_value(self, data):
+        if isinstance(data, (list, tuple, dict)) and not _contains_templates(data):
+            return data
+        return self.format_data(data)
+
+    def to_representation(self, instance):
+        if isinstance(instance, RawJSON):
+            return instance
+        return super().to_representation(instance)
+
+    def format_data(self, data):
         if isinstance(data, str):
-            pass
+            return self.format_template(data)
 
         elif isinstance(data, (list, tuple)):
-            return [self.to_internal_value(i) for i in data]
+            return [self.format_data(i) for i in data]
 
         elif isinstance(data, (dict, OrderedDict)):
             return type(data)(
-                (super(RequestDataField, self).to_internal_value(k), self.to_internal_value(v))
+                (self.format_data(k), self.format_data(v))
                 for k, v in data.items()
             )
 
@@ -303,39 +552,67 @@ class OperationSerializer(serializers.Serializer):
     def get_operation_method(self, method: _t.Text) -> _t.Callable:
         return getattr(self.context.get('client'), method.lower())
 
-    def create(self, validated_data: _t.Dict[_t.Text, _t.Union[_t.Text, _t.Mapping]]) -> ParseResponseDict:
+    def get_operation_request(self, validated_data: _t.Dict) -> _t.Tuple[_t.Text, _t.Text, _t.Dict]:
+        """Returns method name, url and keyword arguments for client's method."""
         # pylint: disable=protected-access
         method_name = str(validated_data['method']).lower()
-        method = self.get_operation_method(method_name)
         url = _join_paths(API_URL, validated_data['version'], validated_data['path'])
         if 'query' in validated_data and validated_data['query']:
             url += '?' + str(validated_data['query'])
-        if method_name != 'get':
-            method = transaction.atomic()(method)
         data = validated_data['data']
         if data and method_name != 'get':
             data = self.renderer.render(data, media_type=self.renderer.media_type)
 
-        headers: dict = validated_data['headers']  # type: ignore
+        headers: dict = validated_data['headers']
         # Fixing oldstyle headers
         for old_style_header in tuple(filter(lambda x: x.startswith('HTTP_'), headers.keys())):
             headers[old_style_header[5:].replace('_', '-').lower()] = headers.pop(old_style_header)  # nocv
 
-        result = ParseResponseDict(
-            path=url,
-            method=method_name,
-            response=method(
-                url,
-                content_type=self.renderer.media_type,
-                secure=self.context['request']._request.is_secure(),
-                data=data if data is not None else '',
-                headers=headers,
-            )
-        )
+        request_kwargs = {
+            'content_type': self.renderer.media_type,
+            'secure': self.context['request']._request.is_secure(),
+            'data': data if data is not None else '',
+            'headers': headers,
+        }
+        if loaders := self.context.get('objects_loaders'):
+            if (loader := loaders.get((url, _get_headers_key(headers)))) is not None:
+                request_kwargs['objects_loader'] = loader
+        return method_name, url, request_kwargs
+
+    def get_operation_result(self, validated_data: _t.Dict, method_name: _t.Text, url: _t.Text, response):
+        result = ParseResponseDict(path=url, method=method_name, response=response)
         if 'let' in validated_data:
             self.context['variables'][validated_data['let']] = result
         return result
 
+    def get_operations_memo(self) -> OperationsMemo:
+        """Returns memo of operations responses shared by operations of bulk request."""
+        return self.context.get('operations_memo') or OperationsMemo()
+
+    def is_async_operation(self) -> bool:
+        """Checks that view of validated operation is async and could be awaited by async endpoint."""
+        path = _join_paths(API_URL, self.validated_data['version'], self.validated_data['path'])
+        try:
+            resolver_match = BulkClient.handler.resolve_path(None, path)
+        except Resolver404:
+            return False
+        return iscoroutinefunction(resolver_match.func)
+
+    def create(self, validated_data: _t.Dict[_t.Text, _t.Union[_t.Text, _t.Mapping]]) -> ParseResponseDict:
+        method_name, url, request_kwargs = self.get_operation_request(validated_data)
+        method = self.get_operation_method(method_name)
+        if method_name != 'get':
+            method = transaction.atomic()(method)
+        response = self.get_operations_memo().call(method_name, method, url, request_kwargs)
+        return self.get_operation_result(validated_data, method_name, url, response)
+
+    async def acreate(self, validated_data: _t.Dict[_t.Text, _t.Union[_t.Text, _t.Mapping]]) -> ParseResponseDict:
+        """Same as :meth:`.create` but awaits operation using async client from context."""
+        method_name, url, request_kwargs = self.get_operation_request(validated_data)
+        method = getattr(self.context['async_client'], method_name)
+        response = await self.get_operations_memo().acall(method_name, method, url, request_kwargs)
+        return self.get_operation_result(validated_data, method_name, url, response)
+
 
 class EndpointViewSet(views.APIView):
     """
@@ -345,7 +622,7 @@ class EndpointViewSet(views.APIView):
     throttle_classes = []
     schema = None
     versioning_class = versioning.QueryParameterVersioning
-    renderer_classes = list(views.APIView.renderer_classes) + list(SPEC_RENDERERS)
+    renderer_classes = list(views.APIView.renderer_classes) + [NDJSONRenderer] + list(SPEC_RENDERERS)
     session_cookie_name: _t.ClassVar[_t.Text] = settings.SESSION_COOKIE_NAME
     client_environ_keys_copy: _t.List[_t.Text] = [
         "SCRIPT_NAME",
@@ -361,6 +638,9 @@ class EndpointViewSet(views.APIView):
 
     #: One operation serializer class.
     serializer_class: _t.ClassVar[_t.Type[OperationSerializer]] = OperationSerializer
+    #: Run operations of PUT bulk requests which don't reference each other concurrently.
+    #: Operations of transactional POST requests are always executed in request thread.
+    parallel_independent: _t.ClassVar[bool] = PARALLEL_INDEPENDENT
 
     class TransactionStop(Exception):
         pass
@@ -442,15 +722,23 @@ class EndpointViewSet(views.APIView):
             serializer.is_valid(raise_exception=True)
             return serializer.to_representation(serializer.save()), serializer.instance.timing  # type: ignore
         except Exception as err:
-            return {
-                'path': 'bulk',
-                'info': {
-                    'errors': getattr(serializer, '_errors', traceback.format_exc()),
-                    'operation_data': operation_data
-                },
-                'status': 500,
-                'data': {'detail': f'Error in bulk request data. See info. Original message: {str(err)}'}
-            }, 0.0
+            return self.get_operation_error(operation_data, serializer, err)
+
+    def get_operation_error(
+        self,
+        operation_data: _t.Dict,
+        serializer: OperationSerializer,
+        err: Exception,
+    ) -> _t.Tuple[_t.Dict, _t.SupportsFloat]:
+        return {
+            'path': 'bulk',
+            'info': {
+                'errors': getattr(serializer, '_errors', traceback.format_exc()),
+                'operation_data': operation_data
+            },
+            'status': 500,
+            'data': {'detail': f'Error in bulk request data. See info. Original message: {str(err)}'}
+        }, 0.0
 
     def get(self, request: BulkRequestType) -> HttpResponse:
         """Returns response with swagger ui or openapi json schema if ?format=openapi"""
@@ -474,37 +762,116 @@ class EndpointViewSet(views.APIView):
 
         return response  # type: ignore[return-value]
 
-    def post(self, request: BulkRequestType) -> responses.BaseResponseClass:
+    def post(self, request: BulkRequestType) -> BulkResponseType:
         """Execute transactional bulk request"""
         try:
             with transaction.atomic():
-                return self.put(request, allow_fail=False)
+                return self.perform_bulk(request, allow_fail=False)
         except Exception:
             if hasattr(request, 'notificator'):
                 request.notificator.clear_messages()
             logger.debug(traceback.format_exc())
             return responses.HTTP_502_BAD_GATEWAY(self.results)
 
-    def put(self, request: BulkRequestType, allow_fail=True) -> responses.BaseResponseClass:
+    def put(self, request: BulkRequestType, allow_fail=True) -> BulkResponseType:
         """Execute non transaction bulk request"""
-        context: _t.Dict[_t.Text, _t.Union[_t.List, _t.Dict, BulkClient]] = {
+        return self.perform_bulk(request, allow_fail)
+
+    def perform_bulk(self, request: BulkRequestType, allow_fail=True) -> BulkResponseType:
+        context: _t.Dict[_t.Text, _t.Any] = {
             'client': self.get_client(request),
-            'results': self.results,
+            'results': [],
             'variables': {},
+            'operations_memo': OperationsMemo(),
         }
+        self.prefetch_operations_data(request, context)
+        streaming = allow_fail and isinstance(getattr(request, 'accepted_renderer', None), NDJSONRenderer)
+        operations = _iter_request(request, self.operate, context, self.parallel_independent, not streaming)
+        if streaming:
+            return self.get_streaming_response(request, operations)
+
         timings: _t.List = []
-        for result, timing in _iter_request(request, self.operate, context):
+        for _, result, timing in operations:
             append_to_list(self.results, result)
             append_to_list(timings, timing)
             if not allow_fail and not (100 <= result.get('status', 500) < 400):
                 raise self.TransactionStop(f'Execute transaction stopped. Error message: {str(result)}')
-        response = responses.HTTP_200_OK(self.results, timings={f'op{i}': float(j) for i, j in enumerate(timings)})
-        for cookie_name, cookie_value in context['client'].cookies.items():  # type: ignore
+        return self.get_bulk_response(request, context['client'], timings, context['queue_waits'])
+
+    def prefetch_operations_data(self, request: BulkRequestType, context: _t.Dict[_t.Text, _t.Any]) -> None:
+        """
+        Prepares data shared by operations of read-only bulk request before execution.
+        ETag values of requested cachable views are loaded in batch (see :func:`.get_cached_etag_values`)
+        and passed to operations through clients, so operations with actual ``If-None-Match`` header
+        are responded with ``304`` without own cache requests. Detail operations to the same view
+        get common :class:`.ObjectsLoader`, so their objects are selected with one query.
+        Nothing is prepared if bulk request contains operations which could modify data.
+        """
+        operations = request.data if isinstance(request.data, (list, tuple)) else (request.data,)
+        if not _is_read_only(operations):
+            return
+        resolved_operations = tuple(_iter_resolved_get_operations(operations))
+        if items := _get_cached_views_items(resolved_operations):
+            etag_values = get_cached_etag_values(items)
+            for client_name in ('client', 'async_client'):
+                if client_name in context:
+                    context[client_name].etag_values = etag_values
+        context['objects_loaders'] = _get_objects_loaders(resolved_operations)
+
+    def get_bulk_response(
+        self,
+        request: BulkRequestType,
+        client: BulkClient,
+        timings: _t.List,
+        queue_waits: _t.Sequence[float] = (),
+    ) -> responses.BaseResponseClass:
+        """
+        Returns response with results of operations. Timings of operations and total time
+        which operations waited for free worker of bulk executor are sent in ``Server-Timing`` header.
+        """
+        response_timings: _t.Dict[_t.Text, _t.Any] = {f'op{i}': float(j) for i, j in enumerate(timings)}
+        if queue_waits:
+            response_timings['bulk_queue'] = round(sum(queue_waits) * 1000, 2)
+        response = responses.HTTP_200_OK(self.results, timings=response_timings)
+        for cookie_name, cookie_value in client.cookies.items():
             if cookie_value.value != request.COOKIES.get(cookie_name, None):
                 response.cookies[cookie_name] = cookie_value
         return response
 
-    def patch(self, request: BulkRequestType) -> responses.BaseResponseClass:
+    def get_streaming_response(
+        self,
+        request: BulkRequestType,
+        operations: _t.Union[_t.Iterator, _t.AsyncIterator],
+    ) -> StreamingHttpResponse:
+        """
+        Returns response which sends every operation result with its index and timing
+        as soon as operation is done, so results of concurrently executed operations may come unordered.
+        Results are not collected in memory and cookies set by operations are not passed to client.
+        """
+        renderer: NDJSONRenderer = request.accepted_renderer
+        renderer_context = self.get_renderer_context()
+
+        def render(idx, result, timing):
+            return renderer.render_line({**result, 'index': idx, 'timing': float(timing)}, renderer_context)
+
+        def stream():
+            for operation in operations:
+                yield render(*operation)
+
+        async def astream():
+            async for operation in operations:
+                yield render(*operation)
+
+        content: _t.Union[_t.Iterator, _t.AsyncIterator]
+        if isinstance(operations, _t.AsyncIterator):
+            content = astream()
+        elif isinstance(request._request, ASGIRequest):  # pylint: disable=protected-access
+            content = _aiter_sync(stream())
+        else:
+            content = stream()
+        return StreamingHttpResponse(content, content_type=renderer.media_type)
+
+    def patch(self, request: BulkRequestType) -> BulkResponseType:
         return self.put(request)
 
     def perform_authentication(self, request):
@@ -519,9 +886,110 @@ class EndpointViewSet(views.APIView):
 
     def initial(self, request: drf_request.Request, *args, **kwargs):
         super().initial(request, *args, **kwargs)
-        self.results: _t.List[_t.Dict[_t.Text, _t.Any]] = []
+        self.results: _t.List[_t.Dict[_t.Text, _t.Any]] = RawJSONList()
 
     def finalize_response(self, request: drf_request.Request, *args, **kwargs):
         if not isinstance(request.successful_authenticator, default_authentication_classes):
             self.get_client(_t.cast(BulkRequestType, self.request)).logout()
         return super().finalize_response(request, *args, **kwargs)
+
+
+class AsyncEndpointViewSet(EndpointViewSet):
+    """
+    API-endpoint viewset for ASGI applications.
+    Set ``ENDPOINT_VIEW_CLASS`` setting to ``'vstutils.api.endpoint.AsyncEndpointViewSet'`` to use it.
+
+    Operations of non-transactional bulk requests are executed on event loop
+    (no more than :attr:`.concurrency` at once): async views are awaited directly,
+    sync views are called in thread pool shared between requests.
+    Transactional bulk requests are executed in request thread like in :class:`.EndpointViewSet`.
+    """
+
+    view_is_async = True
+    #: Max count of concurrently executed operations of one bulk request.
+    concurrency: _t.ClassVar[int] = ASYNC_CONCURRENCY
+
+    def get_async_client(self, request: BulkRequestType, client: BulkClient) -> AsyncBulkClient:
+        """
+        Returns client for async views which shares cookies with sync one.
+        """
+        async_client = AsyncBulkClient(**self.original_environ_data(request=request))
+        async_client.cookies = client.cookies
+        return async_client
+
+    async def aoperate(self, operation_data: _t.Dict, context: _t.Dict) -> _t.Tuple[_t.Dict, _t.SupportsFloat]:
+        """Async version of :meth:`.operate` used by non-transactional bulk requests."""
+        serializer = self.get_serializer(data=operation_data, context=context)
+        try:
+            serializer.is_valid(raise_exception=True)
+            if serializer.is_async_operation():
+                instance = await serializer.acreate(serializer.validated_data)
+            else:
+                instance = await _run_in_bulk_executor(context, serializer.save)
+            return serializer.to_representation(instance), instance.timing
+        except Exception as err:
+            return self.get_operation_error(operation_data, serializer, err)
+
+    async def dispatch(self, request, *args, **kwargs):
+        # pylint: disable=invalid-overridden-method
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed  # nocv
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = await sync_to_async(self.finalize_response)(request, response, *args, **kwargs)
+        return self.response
+
+    async def get(self, request: BulkRequestType) -> HttpResponse:  # type: ignore[override]
+        # pylint: disable=invalid-overridden-method
+        return await sync_to_async(super().get)(request)
+
+    async def post(self, request: BulkRequestType) -> BulkResponseType:  # type: ignore[override]
+        # pylint: disable=invalid-overridden-method
+        return await sync_to_async(super().post)(request)
+
+    async def put(self, request: BulkRequestType) -> BulkResponseType:  # type: ignore[override]
+        # pylint: disable=invalid-overridden-method,arguments-differ
+        client = self.get_client(request)
+        context: _t.Dict[_t.Text, _t.Any] = {
+            'client': client,
+            'async_client': self.get_async_client(request, client),
+            'results': [],
+            'variables': {},
+            'operations_memo': OperationsMemo(),
+        }
+        await sync_to_async(self.prefetch_operations_data)(request, context)
+        streaming = isinstance(getattr(request, 'accepted_renderer', None), NDJSONRenderer)
+        operations = _aiter_request(
+            request,
+            self.aoperate,
+            context,
+            self.parallel_independent,
+            self.concurrency,
+            not streaming,
+        )
+        if streaming:
+            return self.get_streaming_response(request, operations)
+
+        timings: _t.List = []
+        async for _, result, timing in operations:
+            append_to_list(self.results, result)
+            append_to_list(timings, timing)
+        return self.get_bulk_response(request, client, timings, context['queue_waits'])
+
+    async def patch(self, request: BulkRequestType) -> BulkResponseType:  # type: ignore[override]
+        # pylint: disable=invalid-overridden-method
+        return await self.put(request)
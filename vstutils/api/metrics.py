@@ -16,6 +16,28 @@ def get_python_info():
     }, 1
 
 
+def get_bulk_operations_info():
+    # pylint: disable=import-outside-toplevel
+    from .bulk import bulk_executor
+
+    yield '{prefix}_bulk_operations', ({'state': 'queued'}, bulk_executor.queued)
+    yield '{prefix}_bulk_operations', ({'state': 'running'}, bulk_executor.running)
+
+
+def get_cache_pools_info():
+    # Tarantool driver is optional, so pools are reported only when it was already loaded.
+    cache_driver = sys.modules.get('vstutils.drivers.cache')
+    if cache_driver is not None:
+        yield from cache_driver.TarantoolConnectionPool.get_metrics()
+
+
+def get_broker_queues_info():
+    # Queues are reported only by channels of Tarantool transport with enabled metrics collection.
+    kombu_driver = sys.modules.get('vstutils.drivers.kombu')
+    if kombu_driver is not None:
+        yield from kombu_driver.TarantoolChannel.get_metrics()
+
+
 class BackendMetaClass(type):
     def __new__(mcs, name, bases, attrs, metrics_prefix=None):
         metrics_list = attrs.pop('metrics_list', ())
@@ -38,6 +60,9 @@ class BaseBackend(
         ('python_info', get_python_info),
         ('{prefix}_database_connections', lambda: (b'', len(settings.DATABASES))),
         ('{prefix}_cache_connections', lambda: (b'', len(settings.CACHES))),
+        (None, get_bulk_operations_info),
+        (None, get_cache_pools_info),
+        (None, get_broker_queues_info),
     )
     _metrics_set: ClassVar[METRICS_MAP_TYPE] = ()
     prefix: ClassVar[str] = ''
@@ -1,6 +1,8 @@
+import typing as _t
 import functools
 import operator
 
+import orjson
 import ormsgpack
 from django.utils.functional import Promise, LazyObject
 from rest_framework.renderers import BaseRenderer
@@ -10,10 +12,52 @@ from drf_orjson_renderer.renderers import ORJSONRenderer as BaseORJSONRenderer
 from ..utils import get_if_lazy
 
 
+class RawJSON:
+    """
+    Already serialized JSON value.
+    :class:`.ORJSONRenderer` inserts its content into output as is, without decoding and encoding again.
+    Other renderers and item access use value which is decoded lazily on first access.
+
+    :param content: Serialized JSON.
+    """
+    __slots__ = ('content', '_value')
+    _value: _t.Any
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    @property
+    def value(self):
+        try:
+            return self._value
+        except AttributeError:
+            self._value = orjson.loads(self.content)
+            return self._value
+
+    def __getitem__(self, item):
+        return self.value[item]
+
+    def __str__(self):
+        return self.content.decode('utf-8')
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.content!r})'
+
+
+class RawJSONList(list):
+    """
+    List of objects which values could be :class:`.RawJSON`.
+    :class:`.ORJSONRenderer` splices content of such values into rendered objects.
+    """
+    __slots__ = ()
+
+
 class ORJSONRenderer(BaseORJSONRenderer):
     @staticmethod
     def default(obj):
         # pylint: disable=protected-access
+        if isinstance(obj, RawJSON):
+            return obj.value
         if isinstance(obj, Promise):
             obj = obj._proxy____cast()
         elif isinstance(obj, LazyObject):  # nocv
@@ -23,8 +67,53 @@ class ORJSONRenderer(BaseORJSONRenderer):
     def render(self, data, media_type=None, renderer_context=None):
         if renderer_context and getattr(renderer_context['request'], 'is_bulk', False):
             return data
+        if isinstance(data, RawJSONList) and not self.options & orjson.OPT_INDENT_2 and \
+                not (media_type and self.html_media_type in media_type):
+            return b'[' + b','.join(self.render_object(item, renderer_context) for item in data) + b']'
         return super().render(data, media_type, renderer_context)
 
+    def render_object(self, data, renderer_context=None) -> bytes:
+        """
+        Renders object where :class:`.RawJSON` values of first level are inserted without re-encoding.
+        """
+        default = (renderer_context or {}).get('default_function', self.default)
+        if not isinstance(data, dict) or self.options & orjson.OPT_INDENT_2:
+            return orjson.dumps(data, default=default, option=self.options)
+        raw_items = [(key, value) for key, value in data.items() if isinstance(value, RawJSON)]
+        if not raw_items:
+            return orjson.dumps(data, default=default, option=self.options)
+        rendered = orjson.dumps(
+            {key: value for key, value in data.items() if not isinstance(value, RawJSON)},
+            default=default,
+            option=self.options,
+        )
+        chunks = [rendered[:-1]]
+        for key, value in raw_items:
+            if len(chunks) > 1 or len(rendered) > 2:
+                chunks.append(b',')
+            chunks.extend((orjson.dumps(str(key)), b':', value.content))
+        chunks.append(b'}')
+        return b''.join(chunks)
+
+
+class NDJSONRenderer(ORJSONRenderer):
+    """
+    Renderer which serializes list of objects to newline delimited JSON.
+    """
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def render_line(self, data, renderer_context=None) -> bytes:
+        return self.render_object(data, renderer_context) + b'\n'
+
+    def render(self, data, media_type=None, renderer_context=None):
+        if data is None or (renderer_context and getattr(renderer_context['request'], 'is_bulk', False)):
+            return super().render(data, media_type, renderer_context)  # nocv
+        if not isinstance(data, (list, tuple)):
+            data = (data,)
+        return b''.join(self.render_line(item, renderer_context) for item in data)
+
 
 class MsgpackRenderer(BaseRenderer):
     """
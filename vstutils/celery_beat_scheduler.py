@@ -67,12 +67,14 @@ class SingletonDatabaseScheduler(DatabaseScheduler):
             self.discarding_overdue_tasks = False
             return self._discard_overdue_tasks(heappop, heappush)
 
+        if self.scheduler_lock is not None and self.scheduler_lock.id is None:
+            # Lease wasn't renewed in time and lock could be acquired by another scheduler.
+            self.scheduler_lock = None
         if self.scheduler_lock is None:
             try:
-                self.scheduler_lock = Lock(Lock.SCHEDULER, timeout=120.0)
+                self.scheduler_lock = Lock(Lock.SCHEDULER, lease=30.0)
             except Lock.AcquireLockException:
                 return 60.0
-        self.scheduler_lock.prolong()
         return super().tick(event_t, min, heappop, heappush)
 
     def close(self):
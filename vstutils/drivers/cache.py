@@ -1,27 +1,331 @@
 import time
+import typing as _t
+import asyncio
+import pickle  # nosec B403
+import zlib
 
+import ormsgpack
 import tarantool
 from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
-from django.core.cache.backends.redis import RedisSerializer as Serializer
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.functional import cached_property
 
+from .connections import TarantoolConnectionPool
+
+COMPRESSORS: _t.Dict[str, _t.Tuple[int, _t.Callable[[bytes], bytes], _t.Callable[[bytes], bytes]]] = {
+    'zlib': (1, zlib.compress, zlib.decompress),
+}
+
+try:
+    import zstandard
+    COMPRESSORS['zstd'] = (2, zstandard.compress, zstandard.decompress)
+except ImportError:  # nocv
+    pass
+
+try:
+    import lz4.frame
+    COMPRESSORS['lz4'] = (3, lz4.frame.compress, lz4.frame.decompress)
+except ImportError:  # nocv
+    pass
+
+
+def _is_native(value, nested=False) -> bool:
+    # Exact types which Tarantool keeps unchanged when values pass through Lua functions.
+    # Integral floats become integers and binary strings become strings there.
+    # pylint: disable=unidiomatic-typecheck
+    value_type = type(value)
+    if value_type in (str, bool):
+        return True
+    if value_type is int:
+        return -2 ** 63 <= value < 2 ** 64
+    if value_type is float:
+        return not value.is_integer()
+    if value_type is list:
+        return all(_is_native(item, True) for item in value)
+    if value_type is dict:
+        return all(type(key) is str and _is_native(item, True) for key, item in value.items())
+    return nested and value is None
+
+
+class TarantoolSerializer:
+    """
+    Serializer of cache values.
+
+    Integers are stored as is (so ``incr`` works on the server), in ``msgpack`` mode other
+    msgpack-compatible values (strings, booleans, lists, dicts, etc.) are stored natively too,
+    and any other object is pickled. Payloads longer than ``compress_min_length`` bytes
+    are compressed when compressor is set and compression makes them shorter.
+    Binary payloads start with pickle protocol opcode or with header byte
+    which contains compressor id (high bits) and payload format (low bits).
+    """
+
+    __slots__ = ('native', 'protocol', 'compressor_id', 'compress_func', 'compress_min_length')
+
+    FORMAT_PICKLE = 0
+    FORMAT_MSGPACK = 1
+
+    def __init__(self, mode='pickle', protocol=None, compress=None, compress_min_length=1024):
+        if mode not in {'pickle', 'msgpack'}:
+            raise ImproperlyConfigured(f'Unknown cache serializer "{mode}".')
+        if compress and compress not in COMPRESSORS:
+            raise ImproperlyConfigured(f'Compressor "{compress}" is unknown or its library is not installed.')
+        self.native = mode == 'msgpack'
+        self.protocol = pickle.HIGHEST_PROTOCOL if protocol is None or int(protocol) < 0 else int(protocol)
+        # Compressor id 0 means that values are not compressed.
+        self.compressor_id, self.compress_func, _ = COMPRESSORS[compress] if compress else (0, bytes, bytes)
+        self.compress_min_length = int(compress_min_length)
+
+    def _compress(self, payload_format: int, payload: bytes) -> _t.Optional[bytes]:
+        if not self.compressor_id or len(payload) < self.compress_min_length:
+            return None
+        compressed = self.compress_func(payload)
+        if len(compressed) + 1 >= len(payload):
+            return None
+        return bytes((payload_format | self.compressor_id << 4,)) + compressed
+
+    def dumps(self, value):
+        # pylint: disable=unidiomatic-typecheck
+        if type(value) is int:
+            return value
+        if self.native and _is_native(value):
+            if not self.compressor_id:
+                return value
+            return self._compress(self.FORMAT_MSGPACK, ormsgpack.packb(value)) or value
+        payload = pickle.dumps(value, self.protocol)
+        compressed = self._compress(self.FORMAT_PICKLE, payload)
+        if compressed is not None:
+            return compressed
+        if self.protocol >= 2:
+            return payload
+        return bytes((self.FORMAT_PICKLE,)) + payload
+
+    def loads(self, value):
+        if not isinstance(value, bytes):
+            return value
+        # Pickle protocol 2 and higher starts with PROTO opcode.
+        if value[:1] == pickle.PROTO:
+            return pickle.loads(value)  # nosec B301
+        header, payload = value[0], value[1:]
+        if header >> 4:
+            payload = next(c[2] for c in COMPRESSORS.values() if c[0] == header >> 4)(payload)
+        if header & 0x0F == self.FORMAT_MSGPACK:
+            return ormsgpack.unpackb(payload)
+        return pickle.loads(payload)  # nosec B301
+
 
 class TarantoolCache(BaseCache):
+    # Django cache API has async twin of every method.
+    # pylint: disable=too-many-public-methods
+    # Stored functions of the cache space. Cache methods call them with binary arguments,
+    # so the server doesn't parse generated code and keys may contain any characters.
+    # Memtx calls don't yield, so every function except ``wait`` is atomic and takes one round-trip.
+    # ``wait`` yields on condition of its key until value is published.
+    functions_source = """
+        local clock = require('clock')
+        local fiber = require('fiber')
+
+        {lower_name}_waiters = {lower_name}_waiters or {{}}
+
+        local function is_alive(tuple)
+          return tuple ~= nil and (tuple[3] < 0 or tuple[3] >= clock.realtime())
+        end
+
+        function {lower_name}_get(key)
+          local space = box.space.{space_name}
+          local tuple = space:get(key)
+          if tuple == nil then
+            return nil
+          end
+          if is_alive(tuple) then
+            return tuple[2]
+          end
+          space:delete(key)
+          return nil
+        end
+
+        function {lower_name}_set(tuple)
+          box.space.{space_name}:replace(tuple)
+          return true
+        end
+
+        function {lower_name}_delete(key)
+          return box.space.{space_name}:delete(key) ~= nil
+        end
+
+        function {lower_name}_has_key(key)
+          return is_alive(box.space.{space_name}:get(key))
+        end
+
+        function {lower_name}_add(tuple)
+          local space = box.space.{space_name}
+          if is_alive(space:get(tuple[1])) then
+            return false
+          end
+          if tuple[3] == 0 then
+            space:delete(tuple[1])
+          else
+            space:replace(tuple)
+          end
+          return true
+        end
+
+        function {lower_name}_get_or_set(tuple)
+          local space = box.space.{space_name}
+          local current = space:get(tuple[1])
+          if is_alive(current) then
+            return current[2]
+          end
+          if tuple[3] == 0 then
+            space:delete(tuple[1])
+          else
+            space:replace(tuple)
+          end
+          return tuple[2]
+        end
+
+        function {lower_name}_incr(key, delta)
+          local space = box.space.{space_name}
+          if not is_alive(space:get(key)) then
+            return nil
+          end
+          return space:update(key, {{ {{'+', 2, delta}} }})[2]
+        end
+
+        function {lower_name}_touch(key, exp)
+          local space = box.space.{space_name}
+          if not is_alive(space:get(key)) then
+            return false
+          end
+          space:update(key, {{ {{'=', 3, exp}} }})
+          return true
+        end
+
+        function {lower_name}_delete_if_equal(key, value)
+          local space = box.space.{space_name}
+          local tuple = space:get(key)
+          if not is_alive(tuple) or tuple[2] ~= value then
+            return false
+          end
+          space:delete(key)
+          return true
+        end
+
+        function {lower_name}_touch_if_equal(key, value, exp)
+          local space = box.space.{space_name}
+          local tuple = space:get(key)
+          if not is_alive(tuple) or tuple[2] ~= value then
+            return false
+          end
+          space:update(key, {{ {{'=', 3, exp}} }})
+          return true
+        end
+
+        function {lower_name}_pop(key)
+          local tuple = box.space.{space_name}:delete(key)
+          if is_alive(tuple) then
+            return tuple[2]
+          end
+          return nil
+        end
+
+        function {lower_name}_publish(tuple)
+          box.space.{space_name}:replace(tuple)
+          local waiters = {lower_name}_waiters[tuple[1]]
+          if waiters ~= nil then
+            waiters.cond:broadcast()
+          end
+          return true
+        end
+
+        function {lower_name}_wait(key, timeout)
+          local space = box.space.{space_name}
+          local deadline = fiber.clock() + timeout
+          -- Every key has own condition, so publishing wakes up only waiters of its key.
+          local waiters = {lower_name}_waiters[key]
+          if waiters == nil then
+            waiters = {{cond = fiber.cond(), count = 0}}
+            {lower_name}_waiters[key] = waiters
+          end
+          waiters.count = waiters.count + 1
+          local alive = is_alive(space:get(key))
+          local left = deadline - fiber.clock()
+          while not alive and left > 0 do
+            waiters.cond:wait(left)
+            alive = is_alive(space:get(key))
+            left = deadline - fiber.clock()
+          end
+          waiters.count = waiters.count - 1
+          if waiters.count == 0 then
+            {lower_name}_waiters[key] = nil
+          end
+          return alive
+        end
+
+        function {lower_name}_get_many(keys)
+          local space = box.space.{space_name}
+          local result = {{}}
+          for _, key in ipairs(keys) do
+            local tuple = space:get(key)
+            if is_alive(tuple) then
+              table.insert(result, {{tuple[1], tuple[2]}})
+            end
+          end
+          return result
+        end
+
+        function {lower_name}_set_many(tuples)
+          local space = box.space.{space_name}
+          box.atomic(function()
+            for _, tuple in ipairs(tuples) do
+              space:replace(tuple)
+            end
+          end)
+          return #tuples
+        end
+
+        function {lower_name}_delete_many(keys)
+          local space = box.space.{space_name}
+          local count = 0
+          box.atomic(function()
+            for _, key in ipairs(keys) do
+              if space:delete(key) ~= nil then
+                count = count + 1
+              end
+            end
+          end)
+          return count
+        end
+    """
+
     def __init__(self, servers, params):
         super().__init__(params)
-        self._serializer = Serializer()
         self._servers = servers
         self._options = params.get("OPTIONS", {})
+        self._serializer = TarantoolSerializer(
+            mode=self._options.get('serializer', 'pickle'),
+            protocol=self._options.get('pickle_version'),
+            compress=self._options.get('compress'),
+            compress_min_length=self._options.get('compress_min_length', 1024),
+        )
         self._space_name = self._options.get('space', 'DJANGO_CACHE').upper()
-        if self._options.get('connect_on_start', True):
+        self._batch_size = int(self._options.get('batch_size', 1000))
+        if self._options.get('connect_on_start', True) and self._space_name not in self.pool.prepared_spaces:
             self.start_hook()
+            self.pool.prepared_spaces.add(self._space_name)
 
     def close(self, **kwargs):
-        if not self.client.is_closed():
-            self.client.close()
+        if self._options.get('close_connection', False):
+            self.pool.close()
 
     def start_hook(self):
-        self.client.eval(
+        for expression in self._setup_expressions:
+            self.eval(expression)
+
+    @cached_property
+    def _setup_expressions(self) -> _t.Tuple[str, ...]:
+        # Space is temporary, so server loses it with functions on restart and all of them are created again.
+        lower_name = self._space_name.lower()
+        return (
             "box.schema.space.create("
                 f"'{self._space_name}', "  # noqa: E131
                 "{"
@@ -33,13 +337,8 @@ class TarantoolCache(BaseCache):
                         "{name = 'exp', type = 'number'}, "
                     "} "
                 "}"
-            ")"
-        )
-        self.client.eval(
-            f"box.space.{self._space_name}:create_index('primary', {{ parts = {{ 'id' }}, if_not_exists = true }})"
-        )
-        lower_name = self._space_name.lower()
-        self.client.eval(
+            ")",
+            f"box.space.{self._space_name}:create_index('primary', {{ parts = {{ 'id' }}, if_not_exists = true }})",
             f"""
             if {lower_name}_is_expired then return 0 end
 
@@ -60,23 +359,95 @@ class TarantoolCache(BaseCache):
                 tuples_per_iteration = 50,
                 full_scan_time = 3600
             }})
-            """
+            """,
+            self._functions,
         )
 
     @cached_property
-    def client(self):
-        host, _, port = self._servers.rpartition(':')
-        user = self._options.get('user', 'guest')
-        password = self._options.get('password')
-        client = tarantool.connect(host, int(port), None, user, password)
-        return client
+    def _functions(self) -> str:
+        return self.functions_source.format(space_name=self._space_name, lower_name=self._space_name.lower())
 
     @cached_property
-    def space(self):
-        return self.client.space(self._space_name)
+    def pool(self) -> TarantoolConnectionPool:
+        return TarantoolConnectionPool.get_pool(self._servers, self._options)
+
+    def request(self, method: str, *args, **kwargs):
+        """
+        Executes connection method (``select``, ``eval``, ``call``, etc.) on connection checked out from the pool.
+        """
+        with self.pool.connection() as client:
+            return getattr(client, method)(*args, **kwargs)
+
+    def eval(self, expression: str, *args):
+        return self.request('eval', expression, *args)
+
+    def _call(self, client: tarantool.Connection, function: str, args: tuple):
+        func_name = f'{self._space_name.lower()}_{function}'
+        try:
+            return client.call(func_name, args).data[0]
+        except tarantool.error.DatabaseError as err:
+            if err.code != tarantool.error.ER_NO_SUCH_PROC:
+                raise
+        # Server lost registered functions (e.g. after restart).
+        for expression in self._setup_expressions:
+            client.eval(expression)
+        return client.call(func_name, args).data[0]
+
+    def call(self, function: str, *args):
+        """
+        Calls stored function of the cache space registered by :meth:`start_hook`.
+        Space and functions are created again if the server lost them (e.g. after restart).
+
+        :param function: Function name without space prefix (``get``, ``add``, ``incr``, etc.).
+        :param args: Arguments of function.
+        :return: First value returned by function.
+        """
+        with self.pool.connection() as client:
+            return self._call(client, function, args)
+
+    async def acall(self, function: str, *args):
+        """
+        Asynchronous version of :meth:`call` which doesn't block event loop and threads.
+        """
+        connection = await self.pool.aacquire()
+        func_name = f'{self._space_name.lower()}_{function}'
+        try:
+            return (await connection.call(func_name, args))[0]
+        except tarantool.error.DatabaseError as err:
+            if err.code != tarantool.error.ER_NO_SUCH_PROC:
+                raise
+        for expression in self._setup_expressions:
+            await connection.eval(expression)
+        return (await connection.call(func_name, args))[0]
+
+    def _get_batches(self, items: _t.Sequence):
+        for index in range(0, len(items), self._batch_size):
+            yield items[index:index + self._batch_size]
+
+    def call_batches(self, function: str, items: _t.Sequence, *args):
+        """
+        Calls stored function of the cache space for every batch of ``items``
+        on one connection checked out from the pool.
+
+        :param function: Function name without space prefix (``get_many``, ``set_many``, etc.).
+        :param items: Sequence splitted to batches of ``batch_size`` items, passed as first argument.
+        :param args: Other arguments of function.
+        :return: Iterator of first value returned by function for each batch.
+        """
+        with self.pool.connection() as client:
+            for batch in self._get_batches(items):
+                yield self._call(client, function, (batch, *args))
+
+    async def acall_batches(self, function: str, items: _t.Sequence, *args):
+        """
+        Asynchronous version of :meth:`call_batches`. Batches are sent concurrently over one connection.
+
+        :return: List of first values returned by function for each batch.
+        """
+        return await asyncio.gather(*(self.acall(function, batch, *args) for batch in self._get_batches(items)))
 
     def space_eval(self, evaluation_string: str):
-        return self.client.eval(f'return box.space.{self._space_name}:{evaluation_string}')
+        return self.eval(f'return box.space.{self._space_name}:{evaluation_string}')
 
     def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
         if timeout == DEFAULT_TIMEOUT:
@@ -95,111 +466,188 @@ class TarantoolCache(BaseCache):
         return key, value, timeout
 
     def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
-        key, value, timeout = self._build_tuple(key, value, timeout, version)
-
-        try:
-            key, value, _ = self.space.insert((key, value, timeout)).data[0]
-        except tarantool.error.DatabaseError:
-            return False
-        if timeout == 0:
-            self.space.delete(key)
-
-        return True
+        return self.call('add', self._build_tuple(key, value, timeout, version))
 
     def get(self, key, default=None, version=None):
-        key = self.make_and_validate_key(key, version=version)
-        data = self.space.select(key).data
-        if not data:
+        value = self.call('get', self.make_and_validate_key(key, version=version))
+        if value is None:
             return default
-        if data[0][2] < time.time():
-            self.space.delete(key)
-            return default
-        return self._serializer.loads(data[0][1])
+        return self._serializer.loads(value)
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, version=None):
+        if callable(default):
+            # Don't compute default when the key exists.
+            value = self.get(key, self._missing_key, version=version)
+            if value is not self._missing_key:
+                return value
+            default = default()
+        return self._serializer.loads(self.call('get_or_set', self._build_tuple(key, default, timeout, version)))
 
     def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
-        self.space.replace(self._build_tuple(key, value, timeout, version))
+        self.call('set', self._build_tuple(key, value, timeout, version))
 
     def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_and_validate_key(key, version=version)
         timeout = self.get_backend_timeout(timeout=timeout)
         if timeout != -1:
             timeout = int(time.time() + timeout + 0.5)
-
-        try:
-            self.space.update(key, [('=', 'exp', timeout)])
-            return True
-        except tarantool.error.DatabaseError:
-            return False
+        return self.call('touch', key, timeout)
 
     def delete(self, key, version=None):
-        key = self.make_and_validate_key(key, version=version)
-        data = self.space.delete(key).data
-        if not data:
-            return
-        return self._serializer.loads(data[0][1])
+        return self.call('delete', self.make_and_validate_key(key, version=version))
 
     def has_key(self, key, version=None):
-        key = self.make_and_validate_key(key, version=version)
-        return bool(self.space.select(key).data)
+        return self.call('has_key', self.make_and_validate_key(key, version=version))
+
+    def delete_if_equal(self, key, value, version=None):
+        """
+        Deletes key only when it stores the given value.
+        Used by locks to not release lock acquired by another holder.
+        """
+        key, value, _ = self._build_tuple(key, value, None, version)
+        return self.call('delete_if_equal', key, value)
+
+    def touch_if_equal(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """
+        Sets new timeout for key only when it stores the given value.
+        """
+        return self.call('touch_if_equal', *self._build_tuple(key, value, timeout, version))
+
+    def pop(self, key, default=None, version=None):
+        """
+        Returns value by key and deletes it in one request.
+        """
+        value = self.call('pop', self.make_and_validate_key(key, version=version))
+        if value is None:
+            return default
+        return self._serializer.loads(value)
+
+    def publish(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """
+        Sets value and wakes up clients waiting for keys by :meth:`wait`.
+        """
+        self.call('publish', self._build_tuple(key, value, timeout, version))
+
+    def wait(self, key, timeout, version=None):
+        """
+        Blocks on server up to ``timeout`` seconds until key is published.
+        Waiting connection is not counted in ``max_pool_size``, so waits don't hold up other requests.
+
+        :return: ``True`` if key exists.
+        """
+        with self.pool.connection(slot=False) as client:
+            return self._call(client, 'wait', (self.make_and_validate_key(key, version=version), timeout))
 
     def incr(self, key, delta=1, version=None):
         key = self.make_and_validate_key(key, version=version)
-        if delta > 0:
-            operation = '+'
-        else:
-            operation = '-'
-            delta = -delta
-        value = self._serializer.dumps(delta)
-        data = self.space.update(key, [(operation, 'value', value)]).data
-        if not data:
+        value = self.call('incr', key, delta)
+        if value is None:
             raise ValueError(f"Key '{key}' not found.")
-        return data[0][1]
+        return value
 
     def get_many(self, keys, version=None):
         key_map = {
             self.make_and_validate_key(key, version=version): key for key in keys
         }
-        keys_list = [f"'{k}'" for k in key_map.keys()]
-        data = self.client.execute(
-            f'SELECT "id", "value" '  # nosec B608
-            f'FROM "{self._space_name}" '  # nosec B608
-            f'WHERE "id" IN ({", ".join(keys_list)}) AND "exp" >= {int(time.time())}'  # nosec B608
-        ).data
         return {
             key_map[k]: self._serializer.loads(v)
-            for k, v in data
+            for batch in self.call_batches('get_many', tuple(key_map))
+            for k, v in batch
         }
 
-    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
-        # pylint: disable=unidiomatic-typecheck
-
-        if not data:
-            return []
-
-        safe_data = {}
-        for key, value in data.items():
-            key = f"'{self.make_and_validate_key(key, version=version)}'"
-            quote = "'" if not type(value) is int else ""
-            safe_data[key] = f"{quote}{self._serializer.dumps(value)}{quote}"  # type: ignore[str-bytes-safe]
-
+    def _build_tuples(self, data, timeout=DEFAULT_TIMEOUT, version=None):
         timeout = self.get_backend_timeout(timeout=timeout)
         if timeout != -1:
             timeout = int(time.time() + timeout + 0.5)
 
-        self.client.eval("\n".join([
-            f'box.space.{self._space_name}:put{{ {k}, {v}, {timeout} }}'
-            for k, v in safe_data.items()
-        ]))
+        return tuple(
+            (self.make_and_validate_key(key, version=version), self._serializer.dumps(value), timeout)
+            for key, value in data.items()
+        )
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        if not data:
+            return []
+
+        for _ in self.call_batches('set_many', self._build_tuples(data, timeout, version)):
+            pass
 
         return []
 
     def delete_many(self, keys, version=None):
         if not keys:
             return
-        safe_keys = [f"'{self.make_and_validate_key(key, version=version)}'" for key in keys]
-        self.client.execute(
-            f'DELETE FROM "{self._space_name}" WHERE "id" IN ({", ".join(safe_keys)})'  # nosec B608
-        )
+        keys = tuple(self.make_and_validate_key(key, version=version) for key in keys)
+        for _ in self.call_batches('delete_many', keys):
+            pass
 
     def clear(self):
         return self.space_eval('truncate()')
+
+    async def aadd(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return await self.acall('add', self._build_tuple(key, value, timeout, version))
+
+    async def aget(self, key, default=None, version=None):
+        value = await self.acall('get', self.make_and_validate_key(key, version=version))
+        if value is None:
+            return default
+        return self._serializer.loads(value)
+
+    async def aget_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, version=None):
+        if callable(default):
+            value = await self.aget(key, self._missing_key, version=version)
+            if value is not self._missing_key:
+                return value
+            default = default()
+        return self._serializer.loads(await self.acall('get_or_set', self._build_tuple(key, default, timeout, version)))
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        await self.acall('set', self._build_tuple(key, value, timeout, version))
+
+    async def atouch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        timeout = self.get_backend_timeout(timeout=timeout)
+        if timeout != -1:
+            timeout = int(time.time() + timeout + 0.5)
+        return await self.acall('touch', key, timeout)
+
+    async def adelete(self, key, version=None):
+        return await self.acall('delete', self.make_and_validate_key(key, version=version))
+
+    async def ahas_key(self, key, version=None):
+        return await self.acall('has_key', self.make_and_validate_key(key, version=version))
+
+    async def aincr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        value = await self.acall('incr', key, delta)
+        if value is None:
+            raise ValueError(f"Key '{key}' not found.")
+        return value
+
+    async def aget_many(self, keys, version=None):
+        key_map = {
+            self.make_and_validate_key(key, version=version): key for key in keys
+        }
+        return {
+            key_map[k]: self._serializer.loads(v)
+            for batch in await self.acall_batches('get_many', tuple(key_map))
+            for k, v in batch
+        }
+
+    async def aset_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        if data:
+            await self.acall_batches('set_many', self._build_tuples(data, timeout, version))
+        return []
+
+    async def adelete_many(self, keys, version=None):
+        if keys:
+            keys = tuple(self.make_and_validate_key(key, version=version) for key in keys)
+            await self.acall_batches('delete_many', keys)
+
+    async def aclear(self):
+        connection = await self.pool.aacquire()
+        return await connection.eval(f'return box.space.{self._space_name}:truncate()')
+
+    async def aclose(self, **kwargs):
+        if self._options.get('close_connection', False):
+            await self.pool.aclose()
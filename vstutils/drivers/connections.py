@@ -0,0 +1,370 @@
+import time
+import typing as _t
+import asyncio
+import base64
+import functools
+import hashlib
+import itertools
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+
+import msgpack
+import tarantool
+from tarantool import const as iproto
+
+
+class AsyncTarantoolConnection:
+    """
+    Asyncio client of Tarantool binary protocol which supports ``call`` and ``eval`` requests.
+
+    Requests are multiplexed over one connection by their sync ids, so concurrent coroutines
+    don't wait for each other and the connection is never blocked by a single request.
+    """
+
+    def __init__(self, host, port, user=None, password=None, timeout=None):
+        # pylint: disable=too-many-arguments
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self._sync = itertools.count(1)
+        self._waiters: _t.Dict[int, asyncio.Future] = {}
+        self._writer: _t.Optional[asyncio.StreamWriter] = None
+        self._reader_task: _t.Optional[asyncio.Task] = None
+
+    async def connect(self) -> 'AsyncTarantoolConnection':
+        reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        greeting = await reader.readexactly(iproto.IPROTO_GREETING_SIZE)
+        self._reader_task = asyncio.create_task(self._read_responses(reader))
+        if self.password is not None:
+            salt = base64.b64decode(greeting[64:108])[:20]
+            hash1 = hashlib.sha1(self.password.encode('utf-8')).digest()  # nosec B324
+            hash2 = hashlib.sha1(salt + hashlib.sha1(hash1).digest()).digest()  # nosec B324
+            await self.request(iproto.REQUEST_TYPE_AUTHENTICATE, {
+                iproto.IPROTO_USER_NAME: self.user,
+                iproto.IPROTO_TUPLE: ('chap-sha1', bytes(a ^ b for a, b in zip(hash1, hash2))),
+            })
+        return self
+
+    def is_closed(self) -> bool:
+        return self._writer is None or self._writer.is_closing()
+
+    async def _read_responses(self, reader: asyncio.StreamReader):
+        error = tarantool.error.NetworkError(f'Connection to {self.host}:{self.port} is closed.')
+        try:
+            while True:
+                # Server always sends response length as msgpack uint32.
+                length = msgpack.unpackb(await reader.readexactly(5))
+                unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+                unpacker.feed(await reader.readexactly(length))
+                header = unpacker.unpack()
+                body: dict = next(unpacker, {})
+                future = self._waiters.pop(header[iproto.IPROTO_SYNC], None)
+                if future is None or future.done():
+                    continue
+                code = header[iproto.IPROTO_REQUEST_TYPE]
+                if code == iproto.REQUEST_TYPE_OK:
+                    future.set_result(body.get(iproto.IPROTO_DATA))
+                else:
+                    future.set_exception(tarantool.error.DatabaseError(
+                        code & (iproto.REQUEST_TYPE_ERROR - 1),
+                        body.get(iproto.IPROTO_ERROR_24, ''),
+                    ))
+        except (OSError, asyncio.IncompleteReadError) as err:
+            error = tarantool.error.NetworkError(err)
+        finally:
+            self.close()
+            waiters, self._waiters = self._waiters, {}
+            for future in waiters.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def request(self, request_type: int, body: dict):
+        if self.is_closed():
+            raise tarantool.error.NetworkError(f'Connection to {self.host}:{self.port} is closed.')
+        sync = next(self._sync)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[sync] = future
+        try:
+            header = msgpack.packb({iproto.IPROTO_REQUEST_TYPE: request_type, iproto.IPROTO_SYNC: sync})
+            payload = msgpack.packb(body)
+            self._writer.write(msgpack.packb(len(header) + len(payload)) + header + payload)  # type: ignore
+            await self._writer.drain()  # type: ignore
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._waiters.pop(sync, None)
+
+    async def call(self, func_name: str, args: _t.Sequence):
+        return await self.request(iproto.REQUEST_TYPE_CALL, {
+            iproto.IPROTO_FUNCTION_NAME: func_name,
+            iproto.IPROTO_TUPLE: args,
+        })
+
+    async def eval(self, expression: str, args: _t.Sequence = ()):
+        return await self.request(iproto.REQUEST_TYPE_EVAL, {
+            iproto.IPROTO_EXPR: expression,
+            iproto.IPROTO_TUPLE: args,
+        })
+
+    def add_cancel_callback(self, callback: _t.Callable[[], _t.Any]):
+        """
+        Registers callback which is called when connection is closed by :meth:`close`
+        or by cancellation of tasks on event loop shutdown (e.g. at the end of ``asyncio.run()``).
+        """
+        def on_reader_done(task: asyncio.Task):
+            if task.cancelled():
+                callback()
+
+        self._reader_task.add_done_callback(on_reader_done)  # type: ignore[union-attr]
+
+    def close(self):
+        if not self.is_closed():
+            self._writer.close()  # type: ignore
+        if self._reader_task is not None and self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+
+
+class TarantoolConnectionPool:
+    """
+    Thread-safe pool of Tarantool connections shared by all cache instances of the process
+    which use the same server and credentials.
+
+    Every request checks a connection out, so threads never interleave traffic on one socket.
+    Connections idle for longer than ``health_check_interval`` seconds are pinged before reuse
+    and reopened if the ping fails. Connections broken by a network error are dropped
+    and replaced on the next checkout.
+
+    Coroutines use one :class:`AsyncTarantoolConnection` per event loop, which multiplexes their requests.
+    The connection is closed and dropped from the pool on shutdown of its event loop.
+    """
+
+    pools: _t.ClassVar[_t.Dict[_t.Tuple, 'TarantoolConnectionPool']] = {}
+    pools_lock: _t.ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, host, port, user=None, password=None, **options):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_size = int(options.get('max_size', 10))
+        self.timeout = options.get('timeout', 10)
+        self.health_check_interval = options.get('health_check_interval', 30)
+        self.socket_timeout = options.get('socket_timeout')
+        self.prepared_spaces: _t.Set[str] = set()
+        self.in_use = 0
+        self.created = 0
+        self.reconnects = 0
+        self.waits = 0
+        self._idle: _t.Deque[_t.Tuple[tarantool.Connection, float]] = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._async_connections: _t.MutableMapping[asyncio.AbstractEventLoop, asyncio.Task] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def get_pool(cls, servers: str, options: dict) -> 'TarantoolConnectionPool':
+        """
+        Returns process-wide pool for server and credentials from cache settings.
+
+        :param servers: Cache location in ``host:port`` format.
+        :param options: Cache ``OPTIONS`` dictionary.
+        """
+        host, _, port = servers.rpartition(':')
+        key = (host, int(port), options.get('user', 'guest'), options.get('password'))
+        with cls.pools_lock:
+            if key not in cls.pools:
+                cls.pools[key] = cls(
+                    *key,
+                    max_size=options.get('max_pool_size', 10),
+                    timeout=options.get('pool_timeout', 10),
+                    health_check_interval=options.get('health_check_interval', 30),
+                    socket_timeout=options.get('socket_timeout'),
+                )
+            return cls.pools[key]
+
+    @classmethod
+    def get_metrics(cls):
+        """
+        Yields utilisation of every pool in format of :class:`vstutils.api.metrics.BaseBackend` metrics.
+        """
+        with cls.pools_lock:
+            pools = tuple(cls.pools.values())
+        for pool in pools:
+            labels = {'location': f'{pool.host}:{pool.port}'}
+            yield '{prefix}_cache_pool_connections', ({**labels, 'state': 'in_use'}, pool.in_use)
+            yield '{prefix}_cache_pool_connections', ({**labels, 'state': 'idle'}, pool.idle)
+            yield '{prefix}_cache_pool_connections', ({**labels, 'state': 'async'}, pool.async_connections)
+            yield '{prefix}_cache_pool_size', (labels, pool.max_size)
+            yield '{prefix}_cache_pool_created', (labels, pool.created)
+            yield '{prefix}_cache_pool_reconnects', (labels, pool.reconnects)
+            yield '{prefix}_cache_pool_waits', (labels, pool.waits)
+
+    @property
+    def idle(self) -> int:
+        """
+        Number of idle connections in the pool.
+        """
+        return len(self._idle)
+
+    @property
+    def async_connections(self) -> int:
+        """
+        Number of event loops which have their own connection.
+        """
+        return len(self._async_connections)
+
+    def _connect(self) -> tarantool.Connection:
+        connection = tarantool.Connection(
+            self.host,
+            self.port,
+            user=self.user,
+            password=self.password,
+            socket_timeout=self.socket_timeout,
+        )
+        with self._lock:
+            self.created += 1
+        return connection
+
+    def _is_healthy(self, connection: tarantool.Connection, last_used: float) -> bool:
+        if connection.is_closed():
+            return False
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            connection.ping(notime=True)
+        except tarantool.error.Error:
+            connection.close()
+            return False
+        return True
+
+    def _get_idle(self) -> _t.Optional[tarantool.Connection]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                connection, last_used = self._idle.pop()
+            if self._is_healthy(connection, last_used):
+                return connection
+            with self._lock:
+                self.reconnects += 1
+
+    def acquire(self, slot: bool = True) -> tarantool.Connection:
+        """
+        Checks a healthy connection out, waiting up to ``timeout`` seconds for a free slot.
+
+        :param slot: Take one of ``max_size`` slots. Connections of long blocking requests
+                     are checked out without slot, so they don't hold up other requests.
+        """
+        # Slot is held by checked out connection until :meth:`release`, so it can't be acquired in ``with``.
+        # pylint: disable=consider-using-with
+        if slot and not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.waits += 1
+            if not self._slots.acquire(timeout=self.timeout):
+                raise TimeoutError(f'No free connection to {self.host}:{self.port} in {self.timeout} seconds.')
+        try:
+            connection = self._get_idle() or self._connect()
+        except BaseException:
+            if slot:
+                self._slots.release()
+            raise
+        with self._lock:
+            self.in_use += 1
+        return connection
+
+    def release(self, connection: tarantool.Connection, broken: bool = False, slot: bool = True):
+        """
+        Returns connection to the pool or closes it when the connection is broken
+        or the pool already has ``max_size`` idle connections.
+        """
+        with self._lock:
+            self.in_use -= 1
+            keep = not broken and len(self._idle) < self.max_size
+            if keep:
+                self._idle.append((connection, time.monotonic()))
+        if not keep:
+            connection.close()
+        if slot:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self, slot: bool = True) -> _t.Iterator[tarantool.Connection]:
+        connection = self.acquire(slot)
+        broken = False
+        try:
+            yield connection
+        except tarantool.error.NetworkError:
+            broken = True
+            raise
+        finally:
+            self.release(connection, broken, slot)
+
+    def close(self):
+        """
+        Closes all idle connections.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for connection, _ in idle:
+            connection.close()
+
+    @staticmethod
+    def _is_alive_task(task: _t.Optional[asyncio.Task]) -> bool:
+        if task is None:
+            return False
+        if not task.done():
+            return True
+        return not task.cancelled() and task.exception() is None and not task.result().is_closed()
+
+    async def aacquire(self) -> AsyncTarantoolConnection:
+        """
+        Returns connection of running event loop, connecting again if it was closed.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._async_connections.get(loop)
+            if not self._is_alive_task(task):
+                if task is not None:
+                    self.reconnects += 1
+                # Loops closed without cancellation of their tasks can't close connections themselves.
+                for closed_loop in [key for key in self._async_connections if key.is_closed()]:
+                    del self._async_connections[closed_loop]
+                self.created += 1
+                task = loop.create_task(self._aconnect())
+                self._async_connections[loop] = task
+        # Cancellation of one waiter must not break connection for others.
+        return await asyncio.shield(task)  # type: ignore[arg-type]
+
+    async def _aconnect(self) -> AsyncTarantoolConnection:
+        connection = await AsyncTarantoolConnection(
+            self.host,
+            self.port,
+            user=self.user,
+            password=self.password,
+            timeout=self.socket_timeout,
+        ).connect()
+        # Stored task references its loop, so it is dropped explicitly to let loop be collected.
+        connection.add_cancel_callback(functools.partial(
+            self._forget_async_connection,
+            asyncio.get_running_loop(),
+            asyncio.current_task(),
+        ))
+        return connection
+
+    def _forget_async_connection(self, loop: asyncio.AbstractEventLoop, task: _t.Optional[asyncio.Task]):
+        with self._lock:
+            if self._async_connections.get(loop) is task:
+                del self._async_connections[loop]
+
+    async def aclose(self):
+        """
+        Closes connection of running event loop.
+        """
+        with self._lock:
+            task = self._async_connections.pop(asyncio.get_running_loop(), None)
+        if self._is_alive_task(task):
+            (await task).close()  # type: ignore[misc]
@@ -1,6 +1,13 @@
 import time
+import typing as _t
 import base64
+import socket
 import logging
+import threading
+import uuid
+import weakref
+from contextlib import contextmanager
+from collections import defaultdict, deque
 from datetime import datetime
 from queue import Empty
 
@@ -42,11 +49,11 @@ class TarantoolQoS(virtual.QoS):
     def ack(self, delivery_tag):
         """
         Acknowledges a message.
+        Acknowledgement is sent to server with next batch of task operations.
 
         :param delivery_tag: The delivery tag.
         """
-        queue, tarantool_id = self.get_tarantool_queue_id(delivery_tag)
-        self.channel.client_eval(queue, f'ack({tarantool_id})')
+        self.channel.schedule_task_operation('ack', *self.get_tarantool_queue_id(delivery_tag))
         super().ack(delivery_tag)
 
     def reject(self, delivery_tag, requeue=False):
@@ -60,8 +67,7 @@ class TarantoolQoS(virtual.QoS):
             operation = 'release'
         else:
             operation = 'delete'
-        queue, tarantool_id = self.get_tarantool_queue_id(delivery_tag)
-        self.channel.client_eval(queue, f'{operation}({tarantool_id})')
+        self.channel.schedule_task_operation(operation, *self.get_tarantool_queue_id(delivery_tag))
         self._quick_ack(delivery_tag)
 
 
@@ -74,17 +80,313 @@ class TarantoolChannel(virtual.Channel):
     QoS = TarantoolQoS
     Message = TarantoolMessage
 
+    from_transport_options = virtual.Channel.from_transport_options + (
+        'take_batch_size',
+        'ack_batch_size',
+        'ack_flush_interval',
+        'long_polling',
+        'long_polling_timeout',
+        'publish_batch_size',
+        'collect_metrics',
+        'metrics_cache_timeout',
+    )
+    #: Maximum number of messages taken from queue in one call (limited by prefetch count).
+    take_batch_size = 10
+    #: Number of scheduled acks and rejects which are sent to server immediately.
+    ack_batch_size = 50
+    #: Maximum time in seconds which scheduled acks and rejects wait for sending.
+    ack_flush_interval = 0.5
+    #: Wait for messages of consumed queues on server using dedicated connection instead of polling them.
+    long_polling = False
+    #: Maximum time in seconds of one wait for messages on server.
+    long_polling_timeout = 5.0
+    #: Number of messages buffered by :meth:`buffered_publish` which are sent to server in one call.
+    publish_batch_size = 1000
+    #: Report queues statistics of channel broker on metrics page.
+    collect_metrics = False
+    #: Time in seconds while collected queues statistics are reported without requests to server.
+    metrics_cache_timeout = 15.0
+    #: Upper bounds in seconds of take and ack latency histograms buckets.
+    latency_buckets = (0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 60, 300)
+    channels: 'weakref.WeakSet[TarantoolChannel]' = weakref.WeakSet()
+    statistics_cache: _t.Dict[str, _t.Tuple[float, list]] = {}
+
+    queue_functions = """
+        queue = require 'queue'
+        local msgpack = require 'msgpack'
+        local fiber = require 'fiber'
+
+        {prefix}ready = {prefix}ready or fiber.cond()
+        {prefix}watched = {prefix}watched or {{}}
+        {prefix}wakeups = {prefix}wakeups or {{}}
+        {prefix}latency = {prefix}latency or {{}}
+        {prefix}taken_at = {prefix}taken_at or {{}}
+
+        local latency_buckets = {{ {latency_buckets} }}
+
+        local function observe(tube_name, kind, value)
+          local tube_latency = {prefix}latency[tube_name]
+          if tube_latency == nil then
+            tube_latency = {{}}
+            {prefix}latency[tube_name] = tube_latency
+          end
+          local histogram = tube_latency[kind]
+          if histogram == nil then
+            histogram = {{buckets = {{}}, sum = 0, count = 0}}
+            for i = 1, #latency_buckets do
+              histogram.buckets[i] = 0
+            end
+            tube_latency[kind] = histogram
+          end
+          for i, bound in ipairs(latency_buckets) do
+            if value <= bound then
+              histogram.buckets[i] = histogram.buckets[i] + 1
+            end
+          end
+          histogram.sum = histogram.sum + value
+          histogram.count = histogram.count + 1
+        end
+
+        local function watch(tube_name, tube)
+          -- Tube dropped and created again is a new object without callback.
+          if {prefix}watched[tube_name] == tube then
+            return
+          end
+          local previous
+          previous = tube:on_task_change(function(task, stats_data)
+            if previous ~= nil then
+              previous(task, stats_data)
+            end
+            -- Task released by server (e.g. on disconnect of consumer) is not taken anymore.
+            local taken_at = {prefix}taken_at[tube_name]
+            if taken_at ~= nil and task ~= nil and stats_data ~= 'take' and stats_data ~= 'touch' then
+              taken_at[task[1]] = nil
+            end
+            {prefix}ready:broadcast()
+          end)
+          {prefix}watched[tube_name] = tube
+        end
+
+        local function take(tube_name, tube, timeout, collect)
+          local task = tube:take(timeout)
+          if task ~= nil and collect then
+            local now = fiber.time()
+            -- Fifottl tubes store creation time of task in microseconds.
+            local raw = box.space[tube_name]:get(task[1])
+            if raw ~= nil then
+              observe(tube_name, 'take', math.max(now - tonumber(raw[7]) / 1000000, 0))
+            end
+            watch(tube_name, tube)
+            local taken_at = {prefix}taken_at[tube_name]
+            if taken_at == nil then
+              taken_at = {{}}
+              {prefix}taken_at[tube_name] = taken_at
+            end
+            taken_at[task[1]] = now
+          end
+          return task
+        end
+
+        local function unpack_message(data)
+          -- Message is packed by client, so it is stored without decoding when server supports it.
+          if msgpack.object_from_raw ~= nil then
+            return msgpack.object_from_raw(data)
+          end
+          return msgpack.decode(data)
+        end
+
+        function {prefix}put(tube_name, data, options)
+          return queue.tube[tube_name]:put(unpack_message(data), options)[1]
+        end
+
+        function {prefix}put_many(tube_name, messages)
+          local tube = queue.tube[tube_name]
+          local ids = {{}}
+          for _, message in ipairs(messages) do
+            table.insert(ids, tube:put(unpack_message(message[1]), message[2])[1])
+          end
+          return ids
+        end
+
+        function {prefix}take_many(tube_name, count, timeout, collect)
+          local tube = queue.tube[tube_name]
+          local tasks = {{}}
+          local task = take(tube_name, tube, timeout, collect)
+          while task ~= nil do
+            table.insert(tasks, task)
+            if #tasks >= count then
+              break
+            end
+            task = take(tube_name, tube, 0, collect)
+          end
+          return tasks
+        end
+
+        function {prefix}take_any(tube_names, count, timeout, consumer_id, collect)
+          local deadline = fiber.clock() + timeout
+          local tasks = {{}}
+          while true do
+            for _, tube_name in ipairs(tube_names) do
+              local tube = queue.tube[tube_name]
+              if tube ~= nil then
+                watch(tube_name, tube)
+                while #tasks < count do
+                  local task = take(tube_name, tube, 0, collect)
+                  if task == nil then
+                    break
+                  end
+                  table.insert(tasks, {{tube_name, task}})
+                end
+              end
+            end
+            local left = deadline - fiber.clock()
+            if #tasks > 0 or left <= 0 or {prefix}wakeups[consumer_id] then
+              {prefix}wakeups[consumer_id] = nil
+              return tasks
+            end
+            -- Tubes signal about every task state change (put, release, end of delay, etc.).
+            {prefix}ready:wait(left)
+          end
+        end
+
+        function {prefix}wakeup(consumer_id)
+          {prefix}wakeups[consumer_id] = true
+          {prefix}ready:broadcast()
+        end
+
+        function {prefix}apply_many(tube_name, operation, ids)
+          local tube = queue.tube[tube_name]
+          local taken_at = {prefix}taken_at[tube_name] or {{}}
+          local done = 0
+          for _, id in ipairs(ids) do
+            -- Take time is known only for tasks taken with collecting of metrics.
+            local task_taken_at = taken_at[id]
+            if task_taken_at ~= nil then
+              taken_at[id] = nil
+            end
+            if pcall(tube[operation], tube, id) then
+              done = done + 1
+              if operation == 'ack' and task_taken_at ~= nil then
+                observe(tube_name, 'ack', math.max(fiber.time() - task_taken_at, 0))
+              end
+            end
+          end
+          return done
+        end
+
+        function {prefix}statistics()
+          local result = {{}}
+          for tube_name, _ in pairs(queue.tube) do
+            if string.sub(tube_name, 1, #'{prefix}') == '{prefix}' then
+              table.insert(result, {{tube_name, queue.statistics(tube_name), {prefix}latency[tube_name] or {{}}}})
+            end
+          end
+          return result
+        end
+    """
+
     def __init__(self, connection, **kwargs):
         super().__init__(connection, **kwargs)
         conninfo = connection.client
-        self.client = tarantool.connect(
+        self.client = self._connect()
+        self.prefix = f'{conninfo.virtual_host}_celery_queue_'.replace('/', '_').replace('__', '_')
+        # Acks may come from other threads, but connection is not thread-safe.
+        self.client_lock = threading.RLock()
+        # Tasks are acknowledged by session which took them,
+        # so long polling takes and acknowledges tasks using dedicated connection.
+        if self.long_polling:
+            self.consumer_client = self._connect()
+            self.consumer_lock = threading.RLock()
+            self.consumer_id = uuid.uuid4().hex
+        else:
+            self.consumer_client = self.client
+            self.consumer_lock = self.client_lock
+        self._prefetched = defaultdict(deque)
+        self._pending_operations = defaultdict(list)
+        self._pending_count = 0
+        self._pending_lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+        self._publish_buffer = defaultdict(list)
+        self._publish_depth = 0
+        self.client.eval(self.queue_functions.format(
+            prefix=self.prefix,
+            latency_buckets=', '.join(map(str, self.latency_buckets)),
+        ))
+        if self.collect_metrics:
+            self.channels.add(self)
+
+    def _connect(self):
+        conninfo = self.connection.client
+        return tarantool.connect(
             host=conninfo.hostname or 'localhost',
             port=conninfo.port or self.connection.default_port,
             user=conninfo.userid,
             password=conninfo.password,
         )
-        self.client.eval("queue = require 'queue'")
-        self.prefix = f'{conninfo.virtual_host}_celery_queue_'.replace('/', '_').replace('__', '_')
+
+    def client_call(self, function: str, queue: str, *args, consumer: bool = False):
+        """
+        Calls function registered by channel with tube of queue as first argument.
+
+        :param function: The function name without prefix (``put``, ``take_many`` or ``apply_many``).
+        :param queue: The queue name.
+        :param args: Other arguments of function.
+        :param consumer: Use connection which takes and acknowledges tasks.
+        :return: The first value returned by function.
+        """
+        client, lock = (self.consumer_client, self.consumer_lock) if consumer else (self.client, self.client_lock)
+        with lock:
+            return client.call(f'{self.prefix}{function}', (f'{self.prefix}{queue}', *args)).data[0]
+
+    def schedule_task_operation(self, operation: str, queue: str, tarantool_id: int):
+        """
+        Schedules ``ack``, ``release`` or ``delete`` of task.
+        Operations are sent in batches when ``ack_batch_size`` operations are scheduled
+        or ``ack_flush_interval`` seconds have passed since previous batch.
+
+        :param operation: The operation name.
+        :param queue: The queue name.
+        :param tarantool_id: The task id in tube.
+        """
+        with self._pending_lock:
+            self._pending_operations[(operation, queue)].append(tarantool_id)
+            self._pending_count += 1
+        self.flush_task_operations(force=False)
+
+    def flush_task_operations(self, force: bool = True):
+        """
+        Sends scheduled task operations to server.
+
+        :param force: Send operations even if batch is not full and flush interval is not passed.
+        """
+        with self._pending_lock:
+            if not self._is_flush_needed(force):
+                return
+        # Lock isn't awaited while consumer connection is long polling, so it can't be acquired in ``with``.
+        # pylint: disable=consider-using-with
+        if not self.consumer_lock.acquire(blocking=force or not self.long_polling):
+            # Consumer connection is busy by long polling, so it is woken up to send operations.
+            with self.client_lock:
+                self.client.call(f'{self.prefix}wakeup', (self.consumer_id,))
+            return
+        try:
+            with self._pending_lock:
+                if not self._is_flush_needed(force):
+                    return
+                pending, self._pending_operations = self._pending_operations, defaultdict(list)
+                self._pending_count = 0
+                self._flushed_at = time.monotonic()
+            for (operation, queue), ids in pending.items():
+                self.client_call('apply_many', queue, operation, ids, consumer=True)
+        finally:
+            self.consumer_lock.release()
+
+    def _is_flush_needed(self, force: bool) -> bool:
+        return bool(self._pending_count) and (
+            force or
+            self._pending_count >= self.ack_batch_size or
+            time.monotonic() - self._flushed_at >= self.ack_flush_interval
+        )
 
     def client_eval(self, queue: str, exec_code: str, should_return: bool = True):
         """
@@ -98,22 +400,68 @@ class TarantoolChannel(virtual.Channel):
         """
         command = f'{"return" if should_return else ""} queue.tube.{self.prefix}{queue}:{exec_code}'
         logger.debug(f'Call tarantool command: {command}')
-        return self.client.eval(command)
+        with self.client_lock:
+            return self.client.eval(command)
+
+    def _get_take_count(self):
+        estimate = self.qos.can_consume_max_estimate()
+        if estimate is None:
+            return self.take_batch_size
+        prefetched = sum(map(len, self._prefetched.values()))
+        return max(min(self.take_batch_size, estimate - prefetched), 1)
 
     def _get(self, queue, timeout=None):
-        """ Get next message from `queue`. """
+        """
+        Get next message from `queue`.
+        Messages are taken from server in batches and buffered by channel.
+        """
 
-        result =  self.client_eval(queue, f'take({timeout or 0})').data
-        if not result:
+        self.flush_task_operations(force=False)
+        prefetched = self._prefetched[queue]
+        if not prefetched:
+            prefetched.extend(self.client_call(
+                'take_many', queue, self._get_take_count(), timeout or 0, self.collect_metrics, consumer=True
+            ))
+        if not prefetched:
             raise Empty()
-        delivery_tag, _, payload = result[0]
-        payload = unpackb(base64.b64decode(payload))
+        return self._task_to_payload(prefetched.popleft())
+
+    def _task_to_payload(self, task):
+        delivery_tag, _, payload = task
+        if isinstance(payload, str):
+            # Message was published as base64 string by previous versions.
+            payload = unpackb(base64.b64decode(payload))
         payload['tarantool_queue_id'] = delivery_tag
         return payload
 
-    def _put(self, queue, message, **kwargs):
-        """ Put `message` onto `queue`. """
+    def drain_events(self, timeout=None, callback=None):
+        if not self.long_polling or not (self._consumers and self.qos.can_consume()):
+            return super().drain_events(timeout=timeout, callback=callback)
+        # Default callback is the same as in kombu virtual channel.
+        # pylint: disable=protected-access
+        return self._wait_many(self._active_queues, timeout, callback or self.connection._deliver)
 
+    def _wait_many(self, queues, timeout, callback):
+        """
+        Waits on server for messages from any of `queues` and delivers them.
+        Returns without delivery when ``long_polling_timeout`` is over, so caller may wait again.
+        Wait is interrupted earlier when other threads have task operations to send.
+        """
+        self.flush_task_operations(force=False)
+        wait = self.long_polling_timeout if timeout is None else min(timeout, self.long_polling_timeout)
+        tubes = [f'{self.prefix}{queue}' for queue in queues]
+        with self.consumer_lock:
+            tasks = self.consumer_client.call(
+                f'{self.prefix}take_any',
+                (tubes, self._get_take_count(), wait, self.consumer_id, self.collect_metrics),
+            ).data[0]
+        self.flush_task_operations(force=False)
+        if not tasks and timeout is not None and wait >= timeout:
+            raise socket.timeout()
+        for tube, task in tasks:
+            callback(self._task_to_payload(task), tube[len(self.prefix):])
+
+    def _get_put_options(self, message):
         headers = message.get('headers', {})
         properties = message.get('properties', {})
         options = {'pri': properties.get('priority', 0)}
@@ -121,16 +469,54 @@ class TarantoolChannel(virtual.Channel):
         now = maybe_make_aware(datetime.now())
         if (eta := headers.get('eta')) and (eta_date := datetime.fromisoformat(eta)) > now:
             options['delay'] = max(round((eta_date - now).total_seconds() - 0.5), 0)
-        ops = [
-            f'{k} = {v}'
-            for k, v in options.items()
-            if v
-        ]
-
-        self.client_eval(
-            queue,
-            f"put('{base64.b64encode(packb(message)).decode('utf-8')}', {{ {','.join(ops)} }})"
-        )
+
+        return {k: v for k, v in options.items() if v}
+
+    def _put(self, queue, message, **kwargs):
+        """ Put `message` onto `queue`. """
+
+        if self._publish_depth:
+            buffer = self._publish_buffer[queue]
+            buffer.append(message)
+            if len(buffer) >= self.publish_batch_size:
+                self._put_many(queue, buffer)
+                buffer.clear()
+            return
+        self.client_call('put', queue, packb(message), self._get_put_options(message))
+
+    def _put_many(self, queue, messages):
+        """ Put all `messages` onto `queue` in one call keeping priority and delay of every message. """
+
+        if messages:
+            self.client_call('put_many', queue, [(packb(m), self._get_put_options(m)) for m in messages])
+
+    def flush_publish_buffer(self):
+        """ Sends messages buffered by :meth:`buffered_publish`. """
+
+        for queue, messages in self._publish_buffer.items():
+            self._put_many(queue, messages)
+        self._publish_buffer.clear()
+
+    @contextmanager
+    def buffered_publish(self):
+        """
+        Buffers messages published through the channel and sends them in batches
+        of ``publish_batch_size`` messages. Rest of messages is sent on exit.
+
+        .. sourcecode:: python
+
+            with app.producer_or_acquire() as producer:
+                with producer.channel.buffered_publish():
+                    group(signatures).apply_async(producer=producer)
+        """
+
+        self._publish_depth += 1
+        try:
+            yield self
+        finally:
+            self._publish_depth -= 1
+            if not self._publish_depth:
+                self.flush_publish_buffer()
 
     def _purge(self, queue):
         """ Remove all messages from `queue`. """
@@ -147,7 +533,12 @@ class TarantoolChannel(virtual.Channel):
 
     def _delete(self, queue, *args, **kwargs):
         """ Delete `queue` """
-        self.client_eval(queue, 'drop()')
+        tube_name = f'{self.prefix}{queue}'
+        with self.client_lock:
+            self.client.eval(
+                f"queue.tube.{tube_name}:drop() "
+                f"{self.prefix}watched['{tube_name}'] = nil {self.prefix}taken_at['{tube_name}'] = nil"
+            )
 
     def _new_queue(self, queue, **kwargs):
         """ Create new queue. """
@@ -170,8 +561,57 @@ class TarantoolChannel(virtual.Channel):
         Cancel all consumers, and requeue unacked messages.
         """
 
+        self.flush_publish_buffer()
+        self.flush_task_operations()
+        for queue, prefetched in self._prefetched.items():
+            if prefetched:
+                self.client_call('apply_many', queue, 'release', [task[0] for task in prefetched], consumer=True)
+        self._prefetched.clear()
+        self.channels.discard(self)
         super().close()
         self.client.close()
+        if self.consumer_client is not self.client:
+            self.consumer_client.close()
+
+    def get_statistics(self):
+        """
+        Returns statistics of all queues of channel broker.
+        Statistics are cached for ``metrics_cache_timeout`` seconds, so scraping of metrics doesn't load server.
+        """
+        now = time.monotonic()
+        cached = self.statistics_cache.get(self.prefix)
+        if cached is None or now - cached[0] >= self.metrics_cache_timeout:
+            try:
+                with self.client_lock:
+                    statistics = self.client.call(f'{self.prefix}statistics', ()).data[0]
+            except tarantool.error.Error as err:
+                logger.warning('Failed to collect statistics of queues: %s', err)
+                statistics = cached[1] if cached else []
+            cached = self.statistics_cache[self.prefix] = (now, statistics)
+        return cached[1]
+
+    @classmethod
+    def get_metrics(cls):
+        """
+        Yields metrics of queues for every broker used by channels with enabled ``collect_metrics`` option.
+        """
+        channels: _t.Dict[str, TarantoolChannel] = {}
+        for channel in list(cls.channels):
+            channels.setdefault(channel.prefix, channel)
+        for prefix, channel in channels.items():
+            for tube, statistics, latency in channel.get_statistics():
+                labels = {'queue': tube[len(prefix):]}
+                tasks = statistics.get('tasks', {})
+                for state in ('ready', 'taken', 'delayed', 'buried'):
+                    yield '{prefix}_broker_queue_tasks', ({**labels, 'state': state}, tasks.get(state, 0))
+                yield '{prefix}_broker_published_total', (labels, statistics.get('calls', {}).get('put', 0))
+                for kind, histogram in (latency or {}).items():
+                    name = f'{{prefix}}_broker_{kind}_latency_seconds'
+                    for bound, count in zip(channel.latency_buckets, histogram['buckets']):
+                        yield f'{name}_bucket', ({**labels, 'le': str(bound)}, count)
+                    yield f'{name}_bucket', ({**labels, 'le': '+Inf'}, histogram['count'])
+                    yield f'{name}_sum', (labels, histogram['sum'])
+                    yield f'{name}_count', (labels, histogram['count'])
 
 
 class TarantoolTransport(virtual.Transport):
@@ -210,8 +650,46 @@ class TarantoolBackend(KeyValueStoreBackend):
     """
 
     supports_native_join = True
+    implements_incr = True
     persistent = False
 
+    # Keys are decoded to strings as declared by space format and looked up by primary index.
+    # None of these functions yields, so ``incr`` reads and replaces counter atomically.
+    functions_source = """
+        local clock = require('clock')
+
+        local function is_alive(tuple)
+          return tuple ~= nil and (tuple[3] < 0 or tuple[3] >= clock.realtime())
+        end
+
+        function {lower_name}_mget(keys)
+          local space = box.space.{space_name}
+          local result = {{}}
+          for _, key in ipairs(keys) do
+            local tuple = space:get(key)
+            if is_alive(tuple) then
+              table.insert(result, {{key, tuple[2]}})
+            end
+          end
+          return result
+        end
+
+        function {lower_name}_incr(key, exp)
+          local space = box.space.{space_name}
+          local tuple = space:get(key)
+          local value = 1
+          if is_alive(tuple) then
+            value = tonumber(tuple[2]) + 1
+          end
+          space:replace{{key, tostring(value), exp}}
+          return value
+        end
+
+        function {lower_name}_expire(key, exp)
+          box.space.{space_name}:update(key, {{ {{'=', 3, exp}} }})
+        end
+    """
+
     def __init__(self, url=None, expires=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         _, host, port, username, password, vhost, _ = parse_url(url)
@@ -259,8 +737,16 @@ class TarantoolBackend(KeyValueStoreBackend):
             }})
             """
         )
+        self.lower_name = lower_name
+        self.client.eval(self.functions_source.format(space_name=self.space_name, lower_name=lower_name))
         self.space = self.client.space(self.space_name)
 
+    def _get_expiration(self, expires):
+        return int(time.time() + expires + 0.5) if expires else -1
+
+    def call(self, function, *args):
+        return self.client.call(f'{self.lower_name}_{function}', args).data[0]
+
     def get(self, key):
         """
         Gets the value associated with the given key.
@@ -278,14 +764,7 @@ class TarantoolBackend(KeyValueStoreBackend):
         """
         Gets the values associated with the given key's array.
         """
-        keys = (f"'{k.decode('utf-8')}'" for k in keys)
-
-        data = self.client.execute(
-            f'select "id", "value" from "{self.space_name}" where "id"  in ({", ".join(keys)})'  # nosec B608
-        ).data
-        if not data:
-            return []
-        return dict(data)
+        return dict(self.call('mget', [key.decode('utf-8') for key in keys]))
 
     def set(self, key, value):
         """
@@ -295,8 +774,7 @@ class TarantoolBackend(KeyValueStoreBackend):
         :param value: The value to be stored.
         """
 
-        exp = int(time.time() + self.expires + 0.5) if self.expires else -1
-        self.space.replace((key.decode('utf-8'), value, exp))
+        self.space.replace((key.decode('utf-8'), value, self._get_expiration(self.expires)))
 
     def delete(self, key):
         """
@@ -305,3 +783,22 @@ class TarantoolBackend(KeyValueStoreBackend):
         :param key: The key for the value to be deleted.
         """
         self.space.delete(key.decode('utf-8'))
+
+    def incr(self, key):
+        """
+        Atomically increments chord counter stored by the given key.
+        Counter lives ``result_expires`` seconds after last increment.
+
+        :param key: The key of counter.
+        :return: The value of counter after increment.
+        """
+        return self.call('incr', key.decode('utf-8'), self._get_expiration(self.expires))
+
+    def expire(self, key, value):
+        """
+        Sets the lifetime of the value associated with the given key.
+
+        :param key: The key for the value.
+        :param value: Lifetime in seconds.
+        """
+        self.call('expire', key.decode('utf-8'), self._get_expiration(value))
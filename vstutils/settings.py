@@ -197,6 +197,11 @@ class WebSection(BaseAppendSection):
         'secure_hsts_seconds': ConfigIntSecondsType,
         'health_throttle_rate': ConfigIntType,
         'bulk_threads': ConfigIntType,
+        'bulk_workers': ConfigIntType,
+        'bulk_parallel_independent': ConfigBoolType,
+        'bulk_async_concurrency': ConfigIntType,
+        'bulk_resolve_cache_size': ConfigIntType,
+        'bulk_templates_cache_size': ConfigIntType,
         'max_tfa_attempts': ConfigIntType,
         'etag_default_timeout': ConfigIntSecondsType,
         'allow_auto_image_resize': ConfigBoolType,
@@ -309,9 +314,11 @@ class CacheOptionsSection(BackendSection):
         'cull_frequency': ConfigIntType,
         'max_pool_size': ConfigIntType,
         'pickle_version': ConfigIntType,
+        'compress_min_length': ConfigIntType,
         'socket_connect_timeout': ConfigIntSecondsType,
         'socket_timeout': ConfigIntSecondsType,
         'health_check_interval': ConfigIntSecondsType,
+        'pool_timeout': ConfigIntSecondsType,
     }
 
     def key_handler_to_all(self, key):
@@ -383,6 +390,14 @@ class RPCBrokerSection(BaseAppendSection):
         'wait_time_seconds': ConfigIntSecondsType,
         'max_retries': ConfigIntType,
         'polling_interval': FloatType(),
+        'take_batch_size': ConfigIntType,
+        'ack_batch_size': ConfigIntType,
+        'ack_flush_interval': FloatType(),
+        'long_polling': ConfigBoolType,
+        'long_polling_timeout': FloatType(),
+        'publish_batch_size': ConfigIntType,
+        'collect_metrics': ConfigBoolType,
+        'metrics_cache_timeout': FloatType(),
     }
 
 class RPCBrokerPredefinedQueuesSection(cconfig.Section):
@@ -535,6 +550,11 @@ config: cconfig.ConfigParserC = cconfig.ConfigParserC(
             'health_throttle_rate': env.int(f'{ENV_NAME}_WEB_HEALTH_THROTTLE_RATE', default=60),
             'metrics_throttle_rate': env.int(f'{ENV_NAME}_WEB_METRICS_THROTTLE_RATE', default=120),
             'bulk_threads': 3,
+            'bulk_workers': 20,
+            'bulk_parallel_independent': env.bool(f'{ENV_NAME}_WEB_BULK_PARALLEL_INDEPENDENT', default=False),
+            'bulk_async_concurrency': 10,
+            'bulk_resolve_cache_size': 1024,
+            'bulk_templates_cache_size': 1024,
             'max_tfa_attempts': ConfigIntType(os.getenv(f'{ENV_NAME}_MAX_TFA_ATTEMPTS', 5)),
             'etag_default_timeout': ConfigIntSecondsType(os.getenv(f'{ENV_NAME}_ETAG_TIMEOUT', '1d')),
             'allow_auto_image_resize': env.bool(f'{ENV_NAME}_WEB_ALLOW_AUTO_IMAGE_RESIZE', default=True),
@@ -1111,6 +1131,11 @@ HEALTH_THROTTLE_RATE: _t.Text = f"{web['health_throttle_rate']}/minute"
 METRICS_THROTTLE_RATE: _t.Text = f"{web['metrics_throttle_rate']}/minute"
 OPENAPI_VIEW_CLASS: _t.Text = 'vstutils.api.schema.views.OpenApiView'
 BULK_THREADS = web['bulk_threads']
+BULK_WORKERS: int = web['bulk_workers']
+BULK_PARALLEL_INDEPENDENT: bool = web['bulk_parallel_independent']
+BULK_ASYNC_CONCURRENCY: int = web['bulk_async_concurrency']
+BULK_RESOLVE_CACHE_SIZE: int = web['bulk_resolve_cache_size']
+BULK_TEMPLATES_CACHE_SIZE: int = web['bulk_templates_cache_size']
 
 OPENAPI_EXTRA_LINKS: SIMPLE_OBJECT_SETTINGS_TYPE = {
     'vstutils': {
@@ -10,12 +10,14 @@ import subprocess
 import asyncio
 import sys
 import tempfile
+import threading
 import time
 import traceback
 import types
 import typing as tp
 import uuid
 import warnings
+import weakref
 from functools import lru_cache, wraps
 from pathlib import Path
 from enum import Enum, EnumMeta
@@ -975,6 +977,7 @@ class KVExchanger(BaseVstObject):
     __slots__ = ('key', 'timeout', '__djangocache__')
     TIMEOUT = 60
     __djangocache__: tp.Any
+    __lockengine__: tp.Any
 
     @classproperty
     def PREFIX(cls):
@@ -1001,16 +1004,260 @@ class KVExchanger(BaseVstObject):
         # pylint: disable=no-member
         self.cache.touch(self.key, ttl or self.timeout)
 
+    @classproperty
+    def engine(cls):
+        # pylint: disable=no-self-argument,no-member
+        exchanger_class = cls if isinstance(cls, type) else type(cls)
+        if '__lockengine__' not in exchanger_class.__dict__:
+            exchanger_class.__lockengine__ = LockEngine.get_engine(exchanger_class.cache)
+        return exchanger_class.__lockengine__
+
     def get(self):
-        # pylint: disable=no-member
-        value = self.cache.get(self.key)
-        self.cache.delete(self.key)
-        return value
+        return self.engine.pop(self.key)
 
     def delete(self):
         # pylint: disable=no-member
         self.cache.delete(self.key)
 
+    def publish(self, value, ttl=None):
+        """
+        Stores value replacing previous one and wakes up consumers waiting for it.
+        """
+        self.engine.publish(self.key, value, ttl or self.timeout)
+
+    def wait(self, timeout=None):
+        """
+        Waits until value is sent and consumes it like :meth:`get`.
+        Waiting consumers are woken up by :meth:`publish` immediately with Redis and Tarantool locks cache,
+        other backends and values stored by :meth:`send` are noticed by polling.
+
+        :param timeout: maximum time to wait in seconds. Waits forever by default.
+        :return: value or ``None`` if nothing was sent in ``timeout`` seconds.
+        """
+        return self.engine.wait(self.key, timeout)
+
+
+class LockEngine:
+    """
+    Engine which :class:`.Lock` and :class:`.KVExchanger` use to work with keys in locks cache.
+    This one works with any Django cache backend, which ``add`` method is atomic.
+    Release and prolongation check the owner of lock before changing key,
+    but only engines for Redis and Tarantool do it atomically.
+    Waiting for values is implemented by polling with growing interval.
+
+    :param cache: locks cache backend.
+    """
+    __slots__ = ('cache',)
+    #: Maximum time in seconds of one blocking request or sleep while waiting for value.
+    MAX_BLOCK = 1.0
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    @staticmethod
+    def get_engine(cache) -> 'LockEngine':
+        """
+        Returns the most suitable engine for cache backend.
+        """
+        # Cache backend classes are checked only when their modules are already loaded by cache.
+        tarantool_driver = sys.modules.get('vstutils.drivers.cache')
+        if tarantool_driver is not None and isinstance(cache, tarantool_driver.TarantoolCache):
+            return TarantoolLockEngine(cache)
+        redis_backend = sys.modules.get('django.core.cache.backends.redis')
+        if redis_backend is not None and isinstance(cache, redis_backend.RedisCache):
+            return RedisLockEngine(cache)
+        return LockEngine(cache)
+
+    def acquire(self, key, value, timeout) -> tp.Optional[int]:
+        """
+        Stores value by key if key doesn't exist.
+
+        :return: fencing token of acquired lock or ``None`` when lock is held by another owner.
+        """
+        if self.cache.add(key, value, timeout):
+            return self.fence(key)
+        return None
+
+    def fence(self, key) -> int:
+        """
+        Returns next value of increasing counter of lock acquisitions.
+        """
+        fence_key = f'{key}_fence'
+        try:
+            return self.cache.incr(fence_key)
+        except ValueError:
+            self.cache.add(fence_key, 0, None)
+            return self.cache.incr(fence_key)
+
+    def release(self, key, value) -> bool:
+        if self.cache.get(key) != value:
+            return False
+        self.cache.delete(key)
+        return True
+
+    def prolong(self, key, value, timeout) -> bool:
+        return self.cache.get(key) == value and bool(self.cache.touch(key, timeout))
+
+    def pop(self, key):
+        """
+        Returns value by key and deletes it.
+        """
+        value = self.cache.get(key)
+        if value is not None:
+            self.cache.delete(key)
+        return value
+
+    def publish(self, key, value, timeout):
+        """
+        Stores value by key and wakes up waiting consumers.
+        """
+        self.cache.set(key, value, timeout)
+
+    def wait_for_change(self, key, seconds, attempt):
+        """
+        Blocks up to ``seconds`` until value by key could be changed.
+        """
+        time.sleep(min(seconds, self.POLL_INTERVAL * 2 ** attempt))
+
+    def wait(self, key, timeout):
+        """
+        Waits for value by key and pops it.
+
+        :return: value or ``None`` when ``timeout`` is over.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        attempt = 0
+        while (value := self.pop(key)) is None:
+            left = self.MAX_BLOCK if deadline is None else deadline - time.monotonic()
+            if left <= 0:
+                return None
+            self.wait_for_change(key, min(left, self.MAX_BLOCK), attempt)
+            attempt += 1
+        return value
+
+
+class TarantoolLockEngine(LockEngine):
+    """
+    Engine for :class:`vstutils.drivers.cache.TarantoolCache` which checks owner of lock by stored functions.
+    Consumers wait for published values on server.
+    """
+    __slots__ = ()
+
+    def release(self, key, value) -> bool:
+        return self.cache.delete_if_equal(key, value)
+
+    def prolong(self, key, value, timeout) -> bool:
+        return self.cache.touch_if_equal(key, value, timeout)
+
+    def pop(self, key):
+        return self.cache.pop(key)
+
+    def publish(self, key, value, timeout):
+        self.cache.publish(key, value, timeout)
+
+    def wait_for_change(self, key, seconds, attempt):
+        self.cache.wait(key, seconds)
+
+
+class RedisLockEngine(LockEngine):
+    """
+    Engine for Django Redis cache backend.
+    Lock is acquired by ``SET NX PX`` and released by compare-and-delete script in one request.
+    Publishing of value pushes notification to list, which waiting consumers pop by ``BLPOP``.
+    """
+    __slots__ = ('scripts',)
+
+    acquire_script = """
+        local acquired
+        if tonumber(ARGV[2]) > 0 then
+          acquired = redis.call('set', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2])
+        else
+          acquired = redis.call('set', KEYS[1], ARGV[1], 'NX')
+        end
+        if acquired then
+          return redis.call('incr', KEYS[2])
+        end
+        return false
+    """
+    release_script = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+          return redis.call('del', KEYS[1])
+        end
+        return 0
+    """
+    prolong_script = """
+        if redis.call('get', KEYS[1]) ~= ARGV[1] then
+          return 0
+        end
+        if tonumber(ARGV[2]) > 0 then
+          return redis.call('pexpire', KEYS[1], ARGV[2])
+        end
+        redis.call('persist', KEYS[1])
+        return 1
+    """
+    pop_script = """
+        local value = redis.call('get', KEYS[1])
+        if value then
+          redis.call('del', KEYS[1])
+        end
+        return value
+    """
+    publish_script = """
+        if tonumber(ARGV[2]) > 0 then
+          redis.call('set', KEYS[1], ARGV[1], 'PX', ARGV[2])
+        else
+          redis.call('set', KEYS[1], ARGV[1])
+        end
+        redis.call('del', KEYS[2])
+        redis.call('rpush', KEYS[2], 1)
+        redis.call('pexpire', KEYS[2], 1000)
+    """
+
+    def __init__(self, cache):
+        super().__init__(cache)
+        self.scripts = {}
+
+    def get_client(self, key):
+        # pylint: disable=protected-access
+        return self.cache._cache.get_client(key, write=True)
+
+    def run_script(self, name, keys, *args):
+        keys = [self.cache.make_and_validate_key(key) for key in keys]
+        client = self.get_client(keys[0])
+        if name not in self.scripts:
+            self.scripts[name] = client.register_script(getattr(self, f'{name}_script'))
+        return self.scripts[name](keys=keys, args=args, client=client)
+
+    def dumps(self, value):
+        # pylint: disable=protected-access
+        return self.cache._cache._serializer.dumps(value)
+
+    @staticmethod
+    def get_milliseconds(timeout):
+        return 0 if timeout is None else max(int(timeout * 1000), 1)
+
+    def acquire(self, key, value, timeout) -> tp.Optional[int]:
+        return self.run_script('acquire', (key, f'{key}_fence'), self.dumps(value), self.get_milliseconds(timeout))
+
+    def release(self, key, value) -> bool:
+        return bool(self.run_script('release', (key,), self.dumps(value)))
+
+    def prolong(self, key, value, timeout) -> bool:
+        return bool(self.run_script('prolong', (key,), self.dumps(value), self.get_milliseconds(timeout)))
+
+    def pop(self, key):
+        # pylint: disable=protected-access
+        value = self.run_script('pop', (key,))
+        return None if value is None else self.cache._cache._serializer.loads(value)
+
+    def publish(self, key, value, timeout):
+        self.run_script('publish', (key, f'{key}_notify'), self.dumps(value), self.get_milliseconds(timeout))
+
+    def wait_for_change(self, key, seconds, attempt):
+        notify_key = self.cache.make_and_validate_key(f'{key}_notify')
+        self.get_client(notify_key).blpop([notify_key], timeout=seconds)
+
 
 class Lock(KVExchanger):
     """
@@ -1026,10 +1273,18 @@ class Lock(KVExchanger):
     :type repeat: int
     :param err_msg: -- message for AcquireLockException error.
     :type err_msg: str
+    :param lease: -- short lifetime of lock in seconds which is renewed by background heartbeat
+                     until release. Lock of crashed process is freed after lease instead of ``timeout``.
+    :type lease: float
 
     .. note::
         - Used django.core.cache lib and settings in `settings.py`
         - Have Lock.SCHEDULER and Lock.GLOBAL id
+        - Free lock is acquired without any delay. While lock is held by another owner,
+          attempts are repeated with exponential backoff and random jitter.
+        - Lock is released only by its owner (see :class:`.LockEngine`).
+        - ``lock.token`` is a fencing token: it is greater than tokens of all previous
+          owners of the same lock, so storages can reject writes from stale owners.
 
     Example:
         .. sourcecode:: python
@@ -1046,6 +1301,16 @@ class Lock(KVExchanger):
                 # ``lock`` object will has been automatically released after
                 # exiting from context.
 
+    Example of long job with auto-renewing lease:
+        .. sourcecode:: python
+
+            from vstutils.utils import Lock
+
+            with Lock("some_lock_identifier", lease=10):
+                # Lock is prolonged every few seconds while job is running
+                # and expires in 10 seconds if process crashes.
+                long_job_execution()
+
     Another example without context manager:
         .. sourcecode:: python
 
@@ -1057,10 +1322,12 @@ class Lock(KVExchanger):
             del lock
 
     """
-    __slots__ = ('id', 'payload_data')
+    __slots__ = ('id', 'payload_data', 'token', 'lease', 'heartbeat', '__weakref__')
     TIMEOUT = 60 * 60 * 24
     GLOBAL = "global-deploy"
     SCHEDULER = "celery-beat"
+    BACKOFF_BASE = 0.01
+    BACKOFF_MAX = 0.5
 
     class AcquireLockException(Exception):
         """ Exception which will be raised on unreleased lock. """
@@ -1070,18 +1337,57 @@ class Lock(KVExchanger):
         # pylint: disable=no-self-argument
         return f"{cls.get_django_settings('VST_PROJECT_LIB')}_lock_"
 
-    def __init__(self, id, payload=1, repeat=1, err_msg="", timeout=None):
+    def __init__(self, id, payload=1, repeat=1, err_msg="", timeout=None, lease=None):  # noqa: CFQ002
         # pylint: disable=too-many-arguments
-        super().__init__(id, timeout)
+        super().__init__(id, lease or timeout)
+        self._setup(payload, lease)
+        self._acquire(id, repeat, err_msg)
+
+    def _setup(self, payload, lease):
         self.payload_data = f'{uuid.uuid4()}_{payload}'
-        self.id, start = None, time.time()
-        while time.time() - start <= repeat:
-            if self.send(self.payload_data) and not time.sleep(random.random()) and self.get() == self.payload_data:
-                logger.debug(f'Acquire lock with id `{id}` and payload `{self.payload_data}`')
-                self.id = id
-                return
-            time.sleep(random.random() / 10)
-        raise self.AcquireLockException(err_msg)
+        self.id = self.token = self.heartbeat = None
+        self.lease = lease
+
+    def _acquire(self, id, repeat, err_msg):
+        # pylint: disable=redefined-builtin
+        delays = self._get_delays(repeat)
+        while not self._try_acquire(id):
+            delay = next(delays, None)
+            if delay is None:
+                raise self.AcquireLockException(err_msg)
+            time.sleep(delay)
+        if self.lease:
+            self._start_heartbeat()
+
+    def _get_delays(self, repeat):
+        deadline, attempt = time.monotonic() + repeat, 0
+        while (left := deadline - time.monotonic()) > 0:
+            # Full jitter spreads retries of contending holders.
+            yield min(left, random.random() * min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt))
+            attempt += 1
+
+    def _try_acquire(self, id):
+        # pylint: disable=redefined-builtin
+        self.token = self.engine.acquire(self.key, self.payload_data, self.timeout)
+        if self.token is None:
+            return False
+        logger.debug(f'Acquire lock with id `{id}` and payload `{self.payload_data}`')
+        self.id = id
+        return True
+
+    def _start_heartbeat(self):
+        self.heartbeat = threading.Event()
+        threading.Thread(
+            target=_lock_heartbeat,
+            args=(weakref.ref(self), self.heartbeat, self.lease / 3),
+            name=f'lock-heartbeat-{self.id}',
+            daemon=True,
+        ).start()
+
+    def _stop_heartbeat(self):
+        if self.heartbeat is not None:
+            self.heartbeat.set()
+            self.heartbeat = None
 
     def get(self):  # nocv
         # pylint: disable=no-member
@@ -1093,19 +1399,253 @@ class Lock(KVExchanger):
     def __exit__(self, type_e, value, tb):
         self.release()
 
+    def prolong(self, ttl=None):
+        """
+        Prolongs lock for ``ttl`` seconds (lock timeout by default).
+
+        :return: ``False`` if lock is expired or acquired by another owner.
+        """
+        return self.engine.prolong(self.key, self.payload_data, ttl or self.timeout)
+
     def release(self, force_release=False):
         # pylint: disable=no-member
-        if force_release or self.id is not None:
+        self._stop_heartbeat()
+        if force_release:
             self.cache.delete(self.key)
+        elif self.id is not None:
+            self.engine.release(self.key, self.payload_data)
+        self.id = None
 
     def __del__(self):
         self.release()
 
 
+def _lock_heartbeat(lock_ref, stopped, interval):
+    # Heartbeat doesn't hold the lock, so forgotten lock is released by garbage collector.
+    while not stopped.wait(interval):
+        lock = lock_ref()
+        if lock is None:
+            return
+        try:
+            prolonged = lock.prolong()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(f'Failed to prolong lock with id `{lock.id}`.')
+            continue
+        if not prolonged:
+            logger.warning(f'Lock with id `{lock.id}` was lost.')
+            lock.id = None
+            return
+        del lock
+
+
+class AsyncLock(Lock):
+    """
+    Asyncio version of :class:`.Lock` for ASGI handlers and coroutines.
+    Lock is acquired on enter to ``async with`` block without blocking of event loop
+    and lease is renewed by asyncio task.
+
+    Example:
+        .. sourcecode:: python
+
+            from vstutils.utils import AsyncLock
+
+            async with AsyncLock("some_lock_identifier", repeat=30, lease=10):
+                await some_coroutine()
+    """
+    __slots__ = ('lock_id', 'repeat', 'err_msg')
+
+    def _acquire(self, id, repeat, err_msg):
+        # pylint: disable=redefined-builtin
+        # Lock is acquired on ``async with`` enter, so event loop isn't blocked in constructor.
+        self.lock_id, self.repeat, self.err_msg = id, repeat, err_msg
+
+    async def acquire(self):
+        """
+        Acquires lock waiting ``repeat`` seconds while it is held by another owner.
+        """
+        try_acquire = sync_to_async(self._try_acquire, thread_sensitive=False)
+        delays = self._get_delays(self.repeat)
+        while not await try_acquire(self.lock_id):
+            delay = next(delays, None)
+            if delay is None:
+                raise self.AcquireLockException(self.err_msg)
+            await asyncio.sleep(delay)
+        if self.lease:
+            self._start_heartbeat()
+        return self
+
+    def _start_heartbeat(self):
+        self.heartbeat = asyncio.create_task(self._heartbeat())
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            try:
+                prolonged = await sync_to_async(self.prolong, thread_sensitive=False)()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(f'Failed to prolong lock with id `{self.id}`.')
+                continue
+            if not prolonged:
+                logger.warning(f'Lock with id `{self.id}` was lost.')
+                self.id = None
+                return
+
+    def _stop_heartbeat(self):
+        heartbeat, self.heartbeat = self.heartbeat, None
+        if heartbeat is None:
+            return
+        # Lock may be released by garbage collector in any thread, so task is cancelled
+        # only by its own running loop. Task of stopped or closed loop will never run again.
+        loop = heartbeat.get_loop()
+        if not loop.is_running():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            heartbeat.cancel()
+        else:
+            loop.call_soon_threadsafe(heartbeat.cancel)
+
+    async def arelease(self):
+        self._stop_heartbeat()
+        await sync_to_async(self.release, thread_sensitive=False)()
+
+    async def __aenter__(self):
+        return await self.acquire()
+
+    async def __aexit__(self, type_e, value, tb):
+        await self.arelease()
+
+
+class Semaphore(Lock):
+    """
+    Distributed counting semaphore which allows ``limit`` holders with same id at once.
+    Based on :class:`.Lock`: every holder acquires one of ``limit`` lock slots,
+    so it supports same arguments, leases and fencing tokens.
+
+    :param limit: -- maximum number of concurrent holders.
+    :type limit: int
+
+    Example:
+        .. sourcecode:: python
+
+            from vstutils.utils import Semaphore
+
+            with Semaphore("exports", limit=4, repeat=60, lease=30):
+                # Not more than 4 exports are executed in cluster at once.
+                export_data()
+    """
+    __slots__ = ('limit', 'base_key', 'slot_keys')
+
+    @classproperty
+    def PREFIX(cls):
+        # pylint: disable=no-self-argument
+        return f"{cls.get_django_settings('VST_PROJECT_LIB')}_semaphore_"
+
+    def __init__(self, id, *args, limit=1, **kwargs):
+        self.limit = limit
+        super().__init__(id, *args, **kwargs)
+
+    def _setup(self, payload, lease):
+        super()._setup(payload, lease)
+        self.base_key = self.key
+        self.slot_keys = [f'{self.base_key}_{i}' for i in range(self.limit)]
+
+    def _try_acquire(self, id):
+        # pylint: disable=redefined-builtin
+        # Random order of slots decreases collisions of concurrent holders.
+        for key in random.sample(self.slot_keys, self.limit):
+            self.key = key
+            if super()._try_acquire(id):
+                return True
+        return False
+
+
+class ReadLock(Semaphore):
+    """
+    Shared part of distributed read/write lock. Allows up to ``limit`` readers with same id at once
+    while :class:`.WriteLock` with same id and ``limit`` isn't held or awaited.
+    """
+    __slots__ = ()
+
+    @classproperty
+    def PREFIX(cls):
+        # pylint: disable=no-self-argument
+        return f"{cls.get_django_settings('VST_PROJECT_LIB')}_rwlock_"
+
+    def __init__(self, id, *args, limit=100, **kwargs):
+        super().__init__(id, *args, limit=limit, **kwargs)
+
+    def _try_acquire(self, id):
+        # pylint: disable=redefined-builtin,no-member
+        if self.cache.has_key(self.base_key) or not super()._try_acquire(id):
+            return False
+        # Writer checks readers after taking its key, so one of them always backs off.
+        if self.cache.has_key(self.base_key):
+            self.engine.release(self.key, self.payload_data)
+            self.id = self.token = None
+            return False
+        return True
+
+
+class WriteLock(Lock):
+    """
+    Exclusive part of distributed read/write lock.
+    Writer takes the lock, so new readers wait, and then waits until active readers release their slots.
+    Lock is released if readers aren't finished during ``repeat`` seconds.
+
+    :param limit: -- maximum number of readers, should be same as for :class:`.ReadLock`.
+    :type limit: int
+
+    Example:
+        .. sourcecode:: python
+
+            from vstutils.utils import ReadLock, WriteLock
+
+            with ReadLock("config", repeat=10):
+                # Many readers can read config at once.
+                read_config()
+
+            with WriteLock("config", repeat=10):
+                # Writer waits until all readers finish and blocks new ones.
+                write_config()
+    """
+    __slots__ = ('limit', 'reader_keys')
+
+    @classproperty
+    def PREFIX(cls):
+        # pylint: disable=no-self-argument
+        return f"{cls.get_django_settings('VST_PROJECT_LIB')}_rwlock_"
+
+    def __init__(self, id, *args, limit=100, **kwargs):
+        self.limit = limit
+        try:
+            super().__init__(id, *args, **kwargs)
+        except self.AcquireLockException:
+            self.release()
+            raise
+
+    def _setup(self, payload, lease):
+        super()._setup(payload, lease)
+        self.reader_keys = [f'{self.key}_{i}' for i in range(self.limit)]
+
+    def _try_acquire(self, id):
+        # pylint: disable=redefined-builtin,no-member
+        if self.id is not None and not self.engine.prolong(self.key, self.payload_data, self.timeout):
+            # Key is expired or taken by another writer while waiting for readers.
+            self.id = self.token = None
+        if self.id is None and not super()._try_acquire(id):
+            return False
+        return not self.cache.get_many(self.reader_keys)
+
+
 class __LockAbstractDecorator:
     __slots__ = ('kwargs',)
     _err = "Wait until the end."
     _lock_key = None
+    _lock_class: tp.Type[Lock] = Lock
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
@@ -1113,7 +1653,7 @@ class __LockAbstractDecorator:
 
     def execute(self, func, *args, **kwargs):
         if self._lock_key is not None:
-            with Lock(self._lock_key, **self.kwargs):
+            with self._lock_class(self._lock_key, **self.kwargs):
                 return func(*args, **kwargs)
         return func(*args, **kwargs)
 
@@ -1143,6 +1683,42 @@ class model_lock_decorator(__LockAbstractDecorator):
         return super().execute(func, *args, **kwargs)
 
 
+class model_semaphore_decorator(model_lock_decorator):
+    """
+    Decorator for functions where 'pk' kwarg exist
+    which allows only ``limit`` concurrent calls for every id (see :class:`.Semaphore`).
+
+    Example:
+        .. sourcecode:: python
+
+            @model_semaphore_decorator(limit=3, repeat=60)
+            def export(pk):
+                ...
+    """
+    __slots__ = ()
+    _err = "Too many concurrent operations with object. Wait until the end."
+    _lock_class = Semaphore
+
+
+class model_read_lock_decorator(model_lock_decorator):
+    """
+    Decorator for functions where 'pk' kwarg exist which are executed concurrently
+    while functions with :class:`.model_write_lock_decorator` for same id aren't (see :class:`.ReadLock`).
+    """
+    __slots__ = ()
+    _lock_class = ReadLock
+
+
+class model_write_lock_decorator(model_lock_decorator):
+    """
+    Decorator for functions where 'pk' kwarg exist which are executed exclusively
+    of other functions with :class:`.model_write_lock_decorator` and :class:`.model_read_lock_decorator`
+    for same id (see :class:`.WriteLock`).
+    """
+    __slots__ = ()
+    _lock_class = WriteLock
+
+
 class Paginator(BasePaginator):
     """
     Class for fragmenting the query for small queries.
@@ -325,6 +325,69 @@ class UnhandledExecutor(Executor):
     working_handler: tp.Any
 
 
+class LockEngine:
+    MAX_BLOCK: tp.ClassVar[float]
+    POLL_INTERVAL: tp.ClassVar[float]
+    cache: BaseCache
+
+    def __init__(self, cache: BaseCache) -> None:
+        ...
+
+    @staticmethod
+    def get_engine(cache: BaseCache) -> 'LockEngine':
+        ...
+
+    def acquire(self, key, value, timeout) -> tp.Optional[int]:
+        ...
+
+    def fence(self, key) -> int:
+        ...
+
+    def release(self, key, value) -> bool:
+        ...
+
+    def prolong(self, key, value, timeout) -> bool:
+        ...
+
+    def pop(self, key) -> tp.Any:
+        ...
+
+    def publish(self, key, value, timeout) -> None:
+        ...
+
+    def wait_for_change(self, key, seconds: float, attempt: int) -> None:
+        ...
+
+    def wait(self, key, timeout: tp.Optional[float]) -> tp.Any:
+        ...
+
+
+class TarantoolLockEngine(LockEngine):
+    ...
+
+
+class RedisLockEngine(LockEngine):
+    acquire_script: tp.ClassVar[tp.Text]
+    release_script: tp.ClassVar[tp.Text]
+    prolong_script: tp.ClassVar[tp.Text]
+    pop_script: tp.ClassVar[tp.Text]
+    publish_script: tp.ClassVar[tp.Text]
+    scripts: tp.Dict[tp.Text, tp.Any]
+
+    def get_client(self, key) -> tp.Any:
+        ...
+
+    def run_script(self, name: tp.Text, keys: tp.Iterable, *args) -> tp.Any:
+        ...
+
+    def dumps(self, value) -> bytes | int:
+        ...
+
+    @staticmethod
+    def get_milliseconds(timeout: tp.Optional[float]) -> int:
+        ...
+
+
 class KVExchanger(BaseVstObject):
     TIMEOUT: tp.ClassVar[int]
     __djangocache__: tp.Any
@@ -332,6 +395,7 @@ class KVExchanger(BaseVstObject):
     timeout: tp.Any
     PREFIX: tp.ClassVar[tp.Text]
     cache: tp.ClassVar[BaseCache]
+    engine: tp.ClassVar[LockEngine]
 
     def __init__(self, key, timeout: tp.Any | None = ...) -> None:
         ...
@@ -348,6 +412,12 @@ class KVExchanger(BaseVstObject):
     def delete(self) -> None:
         ...
 
+    def publish(self, value, ttl: tp.Any | None = ...) -> None:
+        ...
+
+    def wait(self, timeout: tp.Optional[float] = ...) -> tp.Any:
+        ...
+
 
 class Lock(KVExchanger):
     TIMEOUT: tp.ClassVar[int]
@@ -355,6 +425,11 @@ class Lock(KVExchanger):
     SCHEDULER: tp.ClassVar[tp.Text]
     payload_data: tp.Any
     id: tp.Any
+    token: tp.Optional[int]
+    lease: tp.Optional[float]
+    heartbeat: tp.Any
+    BACKOFF_BASE: tp.ClassVar[float]
+    BACKOFF_MAX: tp.ClassVar[float]
 
     class AcquireLockException(Exception):
         ...
@@ -366,6 +441,7 @@ class Lock(KVExchanger):
         repeat: int = ...,
         err_msg: str = ...,
         timeout: tp.Any | None = ...,
+        lease: tp.Optional[float] = ...,
     ) -> None:
         ...
 
@@ -378,6 +454,9 @@ class Lock(KVExchanger):
     def __exit__(self, type_e, value, tb) -> None:
         ...
 
+    def prolong(self, ttl: tp.Any | None = ...) -> bool:  # type: ignore[override]
+        ...
+
     def release(self, force_release: bool = False) -> None:
         ...
 
@@ -385,6 +464,72 @@ class Lock(KVExchanger):
         ...
 
 
+class AsyncLock(Lock):
+    lock_id: tp.Any
+    repeat: int
+    err_msg: str
+
+    async def acquire(self) -> 'AsyncLock':
+        ...
+
+    async def arelease(self) -> None:
+        ...
+
+    async def __aenter__(self) -> 'AsyncLock':
+        ...
+
+    async def __aexit__(self, type_e, value, tb) -> None:
+        ...
+
+
+class Semaphore(Lock):
+    limit: int
+    base_key: tp.Text
+    slot_keys: tp.List[tp.Text]
+
+    def __init__(
+        self,
+        id,
+        payload: int = ...,
+        repeat: int = ...,
+        err_msg: str = ...,
+        timeout: tp.Any | None = ...,
+        lease: tp.Optional[float] = ...,
+        *,
+        limit: int = ...,
+    ) -> None:
+        ...
+
+    def __enter__(self) -> 'Semaphore':
+        ...
+
+
+class ReadLock(Semaphore):
+    def __enter__(self) -> 'ReadLock':
+        ...
+
+
+class WriteLock(Lock):
+    limit: int
+    reader_keys: tp.List[tp.Text]
+
+    def __init__(
+        self,
+        id,
+        payload: int = ...,
+        repeat: int = ...,
+        err_msg: str = ...,
+        timeout: tp.Any | None = ...,
+        lease: tp.Optional[float] = ...,
+        *,
+        limit: int = ...,
+    ) -> None:
+        ...
+
+    def __enter__(self) -> 'WriteLock':
+        ...
+
+
 class __LockAbstractDecorator:
     kwargs: tp.Any
 
@@ -403,6 +548,18 @@ class model_lock_decorator(__LockAbstractDecorator):
         ...
 
 
+class model_semaphore_decorator(model_lock_decorator):
+    ...
+
+
+class model_read_lock_decorator(model_lock_decorator):
+    ...
+
+
+class model_write_lock_decorator(model_lock_decorator):
+    ...
+
+
 class Paginator(BasePaginator):
     def __init__(self, qs, chunk_size: tp.Any | None = ...) -> None:
         ...